@@ -1,7 +1,7 @@
 import shutil
 from concurrent import futures
 from pathlib import Path
-from typing import List, Iterable
+from typing import List, Iterable, Tuple
 
 import nextcord
 import requests
@@ -10,8 +10,8 @@ from loguru import logger
 from nextcord import Interaction, SlashOption
 from nextcord.ext import commands
 
-from novelsave.core.dtos import NovelDTO
-from novelsave.core.entities.novel import Novel
+from novelsave.core.dtos import NovelDTO, ChapterDTO
+from novelsave.core.entities.novel import Asset, Novel
 from novelsave.core.services.cloud.filehost import BaseCloudFileHost
 from novelsave.core.services.packagers import BasePackager
 from novelsave.core.services.source import BaseSourceGateway
@@ -108,8 +108,8 @@ class DownloadHandler(SessionFragment):
 
         self.session.send_sync(f"Downloading thumbnail <{novel.thumbnail_url}>…")
         try:
-            response = requests.get(novel.thumbnail_url)
-        except requests.ConnectionError:
+            response = self.session.http_session().get(novel.thumbnail_url)
+        except (requests.ConnectionError, requests.Timeout):
             self.session.send_sync(utils.error("Connection terminated unexpectedly."))
             return
 
@@ -150,24 +150,32 @@ class DownloadHandler(SessionFragment):
 
         dto_adapter = self.session.dto_adapter()
         asset_service = self.session.asset_service()
+        rate_limiter = self.session.rate_limiter()
+
+        def download(dto: ChapterDTO) -> Tuple[ChapterDTO, List[Asset]]:
+            rate_limiter.acquire(dto.url)
+            dto = source_gateway.update_chapter_content(dto)
+
+            # parse on the worker, leaving only asset registration to this thread
+            dto.content, assets = asset_service.extract_assets(dto)
+            return dto, assets
 
         download_futures = [
-            self.session.executor.submit(
-                source_gateway.update_chapter_content,
-                dto_adapter.chapter_to_dto(c),
-            )
+            self.session.executor.submit(download, dto_adapter.chapter_to_dto(c))
             for c in chapters
         ]
 
         for chapter in futures.as_completed(download_futures):
             try:
-                chapter_dto = chapter.result()
+                chapter_dto, assets = chapter.result()
             except Exception as e:
                 logger.exception(e)
                 continue
 
-            chapter_dto.content = asset_service.collect_assets(novel, chapter_dto)
-            novel_service.update_content(chapter_dto)
+            chapter_dto.content = asset_service.register_assets(
+                novel, chapter_dto.content, assets
+            )
+            novel_service.update_content(chapter_dto, novel)
 
             logger.debug(
                 f"Chapter content downloaded: '{chapter_dto.title}' ({chapter_dto.index})"
@@ -1,6 +1,8 @@
 import shutil
 import threading
 
+import requests
+
 from loguru import logger
 
 from novelsave import migrations
@@ -11,6 +13,7 @@ from novelsave.core.services import (
     BaseAssetService,
     BaseFileService,
 )
+from novelsave.core.services.network import BaseRateLimiter
 from novelsave.core.services.packagers import BasePackagerProvider
 from novelsave.core.services.source import BaseSourceService
 from novelsave.utils.adapters import DTOAdapter
@@ -26,6 +29,8 @@ class ContainerMixin:
     asset_service: BaseAssetService
     file_service: BaseFileService
     packager_provider: BasePackagerProvider
+    rate_limiter: BaseRateLimiter
+    http_session: requests.Session
 
     @staticmethod
     def _make_unique_config(id_: str):
@@ -36,6 +41,14 @@ class ContainerMixin:
             ":///", maxsplit=1
         )
 
+        # caches and remembered state are kept apart for each user as well
+        temp["download"]["concurrency_file"] = (
+            config_dir / temp["download"]["concurrency_file"].name
+        )
+        temp["cache"]["dir"] = config_dir / temp["cache"]["dir"].name
+        temp["cookies"]["dir"] = config_dir / temp["cookies"]["dir"].name
+        temp["updates"]["file"] = config_dir / temp["updates"]["file"].name
+
         temp.update(
             {
                 "config": {
@@ -89,6 +102,12 @@ class ContainerMixin:
     def packager_provider(self):
         return self.application.packagers.packager_provider()
 
+    def rate_limiter(self):
+        return self.application.services.rate_limiter()
+
+    def http_session(self):
+        return self.application.services.http_session()
+
     def close_session(self):
         logger.debug(f"Session closed; thread id: {threading.current_thread().ident}")
         self.application.infrastructure.session().close()
@@ -7,5 +7,5 @@ from ._novel import (
     import_metadata,
 )
 from ._package import package
-from ._update import update
+from ._update import update, update_all
 from ._url import add_url, remove_url
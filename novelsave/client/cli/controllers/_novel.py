@@ -26,7 +26,7 @@ def show_info(
     except ValueError:
         sys.exit(1)
 
-    chapters = novel_service.get_chapters(novel)
+    counts = novel_service.get_chapter_counts(novel)
 
     data = {
         "novel": {
@@ -39,8 +39,9 @@ def show_info(
             "urls": [o.url for o in novel_service.get_urls(novel)],
         },
         "chapters": {
-            "total": len(chapters),
-            "downloaded": len([c for c in chapters if c.content]),
+            "total": counts.total,
+            "downloaded": counts.downloaded,
+            "failed": counts.failed,
         },
     }
 
@@ -82,15 +83,11 @@ def list_novels(
     novel_service: BaseNovelService = Provide[Application.services.novel_service],
     source_service: BaseSourceService = Provide[Application.services.source_service],
 ):
-    novels = novel_service.get_all_novels()
-
     table = [["Id", "Title", "Source", "Last updated"]]
 
-    for novel in novels:
-        url = novel_service.get_primary_url(novel)
-
+    for novel in novel_service.get_novel_listing():
         try:
-            source = source_service.source_from_url(url).name
+            source = source_service.source_from_url(novel.url).name
         except SourceNotFoundException:
             source = None
 
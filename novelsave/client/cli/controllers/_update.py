@@ -1,10 +1,23 @@
 import sys
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
 
+from dependency_injector.wiring import inject, Provide
 from loguru import logger
+from sqlalchemy.orm import scoped_session
+from tabulate import tabulate
+from tqdm import tqdm
 
+from novelsave.containers import Application
+from novelsave.core.services import BaseNovelService
+from novelsave.core.services.network import BaseCircuitBreaker
+from novelsave.core.services.source import BaseSourceService
+from novelsave.exceptions import SourceNotFoundException
+from novelsave.settings import TQDM_CONFIG
 from novelsave.utils.helpers import url_helper
 from .. import helpers
+from ..helpers import engines, scheduler
 
 
 def update(
@@ -12,6 +25,9 @@ def update(
     browser: Optional[str],
     limit: Optional[int],
     threads: Optional[int],
+    retry_failed: bool = False,
+    engine: str = engines.THREAD,
+    sequential: bool = False,
 ):
     """
     update the novel metadata and downloads any new chapters if not specified otherwise
@@ -23,6 +39,9 @@ def update(
     :param browser: extract cookies from this browser
     :param limit: no. of chapters to update
     :param threads: no. of threads to use when downloading chapters
+    :param retry_failed: download chapters whose previous failures are not yet eligible for retry
+    :param engine: download engine used to download chapters, 'thread' or 'async'
+    :param sequential: download the thumbnail, chapters and assets one after another
     """
     try:
         novel = helpers.get_novel(id_or_url)
@@ -36,11 +55,156 @@ def update(
     else:
         helpers.update_novel(novel, browser)
 
-    helpers.download_thumbnail(novel)
+    helpers.download_content(
+        novel, limit, threads, retry_failed, engine, sequential=sequential
+    )
 
-    if limit is None or limit > 0:
-        helpers.download_chapters(novel, limit, threads)
-    else:
-        logger.info("Skipped chapter download since it was specified as such.")
 
-    helpers.download_assets(novel)
+@dataclass
+class LibraryUpdate:
+    """a novel selected to be updated by :func:`update_all` along with its outcome"""
+
+    id: int
+    title: str
+    url: str
+    source: str
+    succeeded: int = 0
+    failed: int = 0
+    circuit: str = BaseCircuitBreaker.CLOSED
+    error: Optional[str] = None
+
+
+@inject
+def update_all(
+    browser: Optional[str],
+    limit: Optional[int],
+    threads: Optional[int],
+    retry_failed: bool = False,
+    engine: str = engines.THREAD,
+    sources: Iterable[str] = (),
+    stale_days: Optional[int] = None,
+    sequential: bool = False,
+    novel_service: BaseNovelService = Provide[Application.services.novel_service],
+    source_service: BaseSourceService = Provide[Application.services.source_service],
+    session: scoped_session = Provide[Application.infrastructure.session],
+    concurrency: int = Provide[Application.config.library.concurrency],
+    source_concurrency: int = Provide[Application.config.library.source_concurrency],
+):
+    """
+    update every novel in the library, several at a time
+
+    novels are updated concurrently, bounded by 'library.concurrency' overall
+    and by 'library.source_concurrency' for novels of the same source.
+
+    :param sources: only update novels from these sources (case-insensitive)
+    :param stale_days: only update novels that were not updated for this many days
+    :param sequential: download the thumbnail, chapters and assets of each novel one after another
+    """
+    source_names = {s.lower() for s in sources}
+    # timestamps are stored in utc by the database
+    cutoff = (
+        datetime.utcnow() - timedelta(days=stale_days)
+        if stale_days is not None
+        else None
+    )
+
+    updates = []
+    skipped = []
+    for novel in novel_service.get_novel_listing():
+        if cutoff is not None and novel.last_updated and novel.last_updated > cutoff:
+            continue
+
+        try:
+            source = source_service.source_from_url(novel.url).name
+        except SourceNotFoundException:
+            if not source_names:
+                skipped.append(novel)
+            continue
+
+        if source_names and source.lower() not in source_names:
+            continue
+
+        updates.append(LibraryUpdate(novel.id, novel.title, novel.url, source))
+
+    for novel in skipped:
+        logger.error(
+            f"Skipped '{novel.title}' ({novel.id}) since its source is not supported."
+        )
+
+    if not updates:
+        logger.info("Skipped update as no novels matched the filters.")
+        return
+
+    logger.info(
+        f"Updating {len(updates)} novels, {concurrency} at a time "
+        f"({source_concurrency} per source)…"
+    )
+
+    def run(update_: LibraryUpdate):
+        # each worker thread holds its own session of the scoped session
+        source_gateway = None
+        try:
+            novel = novel_service.get_novel_by_id(update_.id)
+            logger.info(f"Updating '{novel.title}' ({novel.id}) from {update_.source}…")
+
+            # resolved once so that cookies applied during the update are used by the download
+            source_gateway = helpers.get_source_gateway(update_.url)
+            helpers.update_novel(novel, browser, source_gateway)
+            update_.succeeded, update_.failed = helpers.download_content(
+                novel,
+                limit,
+                threads,
+                retry_failed,
+                engine,
+                source_gateway=source_gateway,
+                progress=False,
+                sequential=sequential,
+            )
+        finally:
+            if source_gateway is not None:
+                update_.circuit = helpers.circuit_state(source_gateway)
+            session.remove()
+
+    with tqdm(total=len(updates), **TQDM_CONFIG) as pbar:
+        for update_, future in scheduler.schedule(
+            updates,
+            lambda u: u.source,
+            run,
+            concurrency,
+            source_concurrency,
+        ):
+            try:
+                future.result()
+            except (Exception, SystemExit) as e:
+                # helpers exit when they encounter an error they consider fatal
+                update_.error = str(e) or type(e).__name__
+                logger.error(
+                    f"Failed to update '{update_.title}' ({update_.id}): {update_.error}."
+                )
+
+            pbar.update(1)
+
+    table = [["Id", "Title", "Source", "Chapters", "Errors", "Circuit", "Status"]]
+    for update_ in sorted(updates, key=lambda u: u.id):
+        status = "failed" if update_.error is not None else "updated"
+        table.append(
+            [
+                update_.id,
+                update_.title,
+                update_.source,
+                update_.succeeded,
+                update_.failed,
+                update_.circuit,
+                status,
+            ]
+        )
+
+    for line in tabulate(table, headers="firstrow", tablefmt="github").splitlines():
+        logger.info(line)
+
+    failed_novels = len([u for u in updates if u.error is not None])
+    logger.info(
+        f"Library update complete, {len(updates) - failed_novels} of {len(updates)} novels updated, "
+        f"with {sum(u.succeeded for u in updates)} chapters downloaded "
+        f"and {sum(u.failed for u in updates)} errors."
+    )
@@ -1,52 +1,121 @@
+import threading
+import time
+from importlib import metadata
+from typing import Callable, List, Optional, Tuple
+
 import requests
-from dependency_injector.wiring import inject, Provide
+from dependency_injector.wiring import inject, Provide, Provider
 from loguru import logger
 
+from novelsave import __version__
 from novelsave.containers import Application
-from novelsave.core.services import BaseMetaService
+from novelsave.core.services import BaseMetaService, BaseVersionCache
 from novelsave.core.services.source import BaseSourceService
 
 
+def installed_version(name: str) -> Optional[str]:
+    """version of the installed package, read from its metadata without importing it"""
+    if name == "novelsave":
+        return __version__
+
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+@inject
+def check_for_updates(
+    source_service: Callable[[], BaseSourceService] = Provider[
+        Application.services.source_service
+    ],
+    meta_service: Callable[[], BaseMetaService] = Provider[
+        Application.services.meta_service
+    ],
+    version_cache: BaseVersionCache = Provide[Application.services.version_cache],
+) -> List[Tuple[str, str]]:
+    """packages that have new versions available, along with the latest version
+
+    latest versions are only requested from PyPI once the cached versions expire,
+    the services that request them, and their imports, are only built then.
+    """
+    available_updates = []
+    for name, service in (
+        ("novelsave-sources", source_service),
+        ("novelsave", meta_service),
+    ):
+        current_version = installed_version(name)
+        if current_version is None:
+            logger.debug(
+                f"Skipped checking '{name}' for update as it is not installed."
+            )
+            continue
+
+        latest_version = version_cache.get(name)
+        if latest_version is None:
+            try:
+                latest_version = service().get_latest_version()
+            except (requests.ConnectionError, requests.Timeout, ConnectionError):
+                logger.debug(
+                    f"Connection terminated unexpectedly while checking '{name}' for update."
+                )
+                continue
+
+            version_cache.put(name, latest_version)
+
+        if latest_version > current_version:
+            available_updates.append((name, latest_version))
+
+    return available_updates
+
+
 @inject
 def update_check_event(
-    source_service: BaseSourceService = Provide[Application.services.source_service],
-    meta_service: BaseMetaService = Provide[Application.services.meta_service],
-):
+    deadline: float = Provide[Application.config.updates.deadline],
+    clock: Callable[[], float] = time.monotonic,
+) -> Callable[[], None]:
+    """start checking for new package versions on a background thread
+
+    :returns: function that reports the new versions, meant to be called on exit.
+        it waits for the check until deadline seconds after it started at most.
+    """
+    if type(deadline) == Provide:
+        logger.debug("Service injection failed. Skipped checking for updates.")
+        return lambda: None
+
     logger.debug("Checking for new package versions…")
 
-    if type(source_service) == Provide:
-        logger.debug("Service injection failed. Exiting process silently.")
-        return
+    result: List[Optional[List[Tuple[str, str]]]] = [None]
 
-    available_updates = []
-    errors = []
-
-    try:  # novelsave-sources
-        latest_sources_version = source_service.get_latest_version()
-        if latest_sources_version > source_service.current_version:
-            available_updates.append(("novelsave-sources", latest_sources_version))
-    except requests.ConnectionError as e:
-        errors.append(e)
-        logger.debug(
-            "Connection terminated unexpectedly while 'novelsave-sources' checking for update."
-        )
+    def check():
+        try:
+            result[0] = check_for_updates()
+        except Exception as e:
+            logger.debug(f"Update check failed: {type(e).__name__}: {e}.")
 
-    try:  # novelsave
-        latest_version = meta_service.get_latest_version()
-        if latest_version > meta_service.current_version:
-            available_updates.append(("novelsave", latest_version))
-    except requests.ConnectionError as e:
-        errors.append(e)
-        logger.debug(
-            "Connection terminated unexpectedly while checking 'novelsave' for update."
-        )
+    # a daemon thread that is still running does not hold up the exit
+    thread = threading.Thread(target=check, name="update-check", daemon=True)
+    started = clock()
+    thread.start()
+
+    def report():
+        thread.join(max(started + deadline - clock(), 0))
+        if thread.is_alive():
+            logger.debug("Abandoned the update check as it did not complete in time.")
+            return
+
+        available_updates = result[0]
+        if available_updates is None:
+            return
 
-    if not available_updates:
-        logger.debug(f"No upgrades to packages detected with {len(errors)} errors.")
-        return
+        if not available_updates:
+            logger.debug("No upgrades to packages detected.")
+            return
+
+        logger.warning(
+            f"Following packages have new versions available: {', '.join(f'{n}=={v}' for n, v in available_updates)}.\n"
+            f"Run the following command to upgrade:\n"
+            f"   python -m pip install --upgrade {' '.join(n for n, v in available_updates)}"
+        )
 
-    logger.warning(
-        f"Following packages have new versions available: {', '.join(f'{n}=={v}' for n, v in available_updates)}.\n"
-        f"Run the following command to upgrade:\n"
-        f"   python -m pip install --upgrade {' '.join(n for n, v in available_updates)}"
-    )
+    return report
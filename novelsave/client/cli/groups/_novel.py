@@ -1,10 +1,11 @@
 import sys
-from typing import Iterable
+from typing import Iterable, Optional
 
 import click
 from loguru import logger
 
 from .. import controllers
+from ..helpers import engines
 from ..main import cli
 
 
@@ -38,7 +39,26 @@ def _package(id_or_url: str, target: Iterable[str], target_all: bool):
     help="Extract cookies from the specified browser and use them in subsequent requests.",
 )
 @click.option(
-    "--threads", type=int, help="Amount of threads to use when downloading chapters."
+    "--threads",
+    type=int,
+    help="Concurrent requests when downloading chapters, tuned for each source if not provided.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(engines.ENGINES),
+    default=engines.THREAD,
+    show_default=True,
+    help="Download chapters using a pool of threads or from a single event loop.",
+)
+@click.option(
+    "--retry-failed",
+    is_flag=True,
+    help="Retry chapters that failed permanently or recently in previous runs.",
+)
+@click.option(
+    "--sequential",
+    is_flag=True,
+    help="Download the thumbnail, chapters and assets one after another instead of overlapping them.",
 )
 @click.option(
     "--target",
@@ -56,6 +76,9 @@ def _process(
     limit: int,
     browser: str,
     threads: int,
+    engine: str,
+    retry_failed: bool,
+    sequential: bool,
     target: Iterable[str],
     target_all: bool,
 ):
@@ -64,12 +87,30 @@ def _process(
         logger.error("'--threads' must be a positive integer.")
         sys.exit(2)
 
-    controllers.update(id_or_url, browser, limit, threads)
+    controllers.update(
+        id_or_url, browser, limit, threads, retry_failed, engine, sequential
+    )
     controllers.package(id_or_url, target, target_all)
 
 
 @cli.command(name="update")
-@click.argument("id_or_url")
+@click.argument("id_or_url", required=False)
+@click.option(
+    "--all",
+    "all_",
+    is_flag=True,
+    help="Update every novel in the library, several at a time.",
+)
+@click.option(
+    "--source",
+    multiple=True,
+    help="Only update novels from the specified source when using --all.",
+)
+@click.option(
+    "--stale-days",
+    type=int,
+    help="Only update novels not updated for the specified days when using --all.",
+)
 @click.option(
     "--limit",
     type=int,
@@ -80,15 +121,67 @@ def _process(
     help="Extract cookies from the specified browser and use them in subsequent requests.",
 )
 @click.option(
-    "--threads", type=int, help="Amount of threads to use when downloading chapters."
+    "--threads",
+    type=int,
+    help="Concurrent requests when downloading chapters, tuned for each source if not provided.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(engines.ENGINES),
+    default=engines.THREAD,
+    show_default=True,
+    help="Download chapters using a pool of threads or from a single event loop.",
+)
+@click.option(
+    "--retry-failed",
+    is_flag=True,
+    help="Retry chapters that failed permanently or recently in previous runs.",
+)
+@click.option(
+    "--sequential",
+    is_flag=True,
+    help="Download the thumbnail, chapters and assets one after another instead of overlapping them.",
 )
-def _update(id_or_url: str, limit: int, browser: str, threads: int):
+def _update(
+    id_or_url: Optional[str],
+    all_: bool,
+    source: Iterable[str],
+    stale_days: Optional[int],
+    limit: int,
+    browser: str,
+    threads: int,
+    engine: str,
+    retry_failed: bool,
+    sequential: bool,
+):
     """Scrape the website of the novel and update the database"""
     if threads is not None and threads <= 0:
         logger.error("'--threads' must be a positive integer.")
         sys.exit(2)
 
-    controllers.update(id_or_url, browser, limit, threads)
+    if all_ == (id_or_url is not None):
+        logger.error("Provide either 'ID_OR_URL' or '--all'.")
+        sys.exit(2)
+
+    if not all_ and (source or stale_days is not None):
+        logger.error("'--source' and '--stale-days' may only be used with '--all'.")
+        sys.exit(2)
+
+    if all_:
+        controllers.update_all(
+            browser,
+            limit,
+            threads,
+            retry_failed,
+            engine,
+            source,
+            stale_days,
+            sequential,
+        )
+    else:
+        controllers.update(
+            id_or_url, browser, limit, threads, retry_failed, engine, sequential
+        )
 
 
 @cli.command(name="metadata")
@@ -6,5 +6,7 @@ from .novel import (
     download_assets,
     create_novel,
     get_or_create_novel,
+    circuit_state,
+    download_content,
 )
 from .source import get_source_gateway, get_meta_source_gateway
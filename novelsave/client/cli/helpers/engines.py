@@ -0,0 +1,247 @@
+"""
+Download engines used to fetch chapter content
+
+Each engine is a context manager that schedules the download of every chapter
+and yields an iterator of completed :class:`concurrent.futures.Future`, that
+resolve to the result of ``process`` applied to the updated chapter or raise
+:class:`ContentUpdateFailedException`. Consumers can thus process the results
+the same way regardless of the engine.
+
+At most as many downloads as the limit of the concurrency controller are in
+flight (or completed but not yet consumed), a new download is only scheduled
+once the consumer takes a result. A slow consumer thus throttles the downloads
+instead of accumulating their content. Every request reports its latency and
+whether it suggests congestion to the controller, which adapts the limit.
+
+``process`` runs on the worker threads of the engine, this keeps expensive
+post processing such as parsing the chapter html off the consumer.
+"""
+import asyncio
+import time
+from concurrent import futures
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Set, Union
+
+from loguru import logger
+
+from novelsave.core.dtos import ChapterDTO
+from novelsave.core.services.network import (
+    BaseConcurrencyController,
+    BaseRateLimiter,
+    BaseRetryPolicy,
+)
+from novelsave.core.services.source import BaseSourceGateway, BaseAsyncSourceGateway
+from novelsave.exceptions import CircuitOpenException, ContentUpdateFailedException
+from novelsave.utils.helpers import async_helper
+
+THREAD = "thread"
+ASYNC = "async"
+
+ENGINES = [THREAD, ASYNC]
+
+
+def _identity(chapter_dto: ChapterDTO) -> ChapterDTO:
+    return chapter_dto
+
+
+class Window:
+    """Iterator of completed futures that keeps a bounded number of them submitted
+
+    The size may be a callable, which is consulted before every submission.
+    """
+
+    def __init__(
+        self,
+        submit: Callable[[ChapterDTO], futures.Future],
+        chapter_dtos: Iterable[ChapterDTO],
+        size: Union[int, Callable[[], int]],
+    ):
+        self.submit = submit
+        self.chapter_dtos = iter(chapter_dtos)
+        self.size = size if callable(size) else lambda: size
+
+        self.in_flight: Set[futures.Future] = set()
+
+    def _fill(self):
+        while len(self.in_flight) < max(self.size(), 1):
+            try:
+                dto = next(self.chapter_dtos)
+            except StopIteration:
+                break
+
+            self.in_flight.add(self.submit(dto))
+
+    def __iter__(self) -> Iterator[futures.Future]:
+        self._fill()
+        while self.in_flight:
+            done, _ = futures.wait(self.in_flight, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                # yielding before refilling applies the backpressure of the consumer
+                self.in_flight.remove(future)
+                yield future
+
+                self._fill()
+
+    def cancel(self):
+        """stop scheduling downloads, and cancel those that are not yet running"""
+        self.chapter_dtos = iter(())
+        # cancelled futures are never completed by a plain future.wait
+        self.in_flight = {f for f in self.in_flight if not f.cancel()}
+
+
+def _process(
+    process: Callable[[ChapterDTO], Any], dto: ChapterDTO, attempt: int
+) -> Any:
+    try:
+        return process(dto)
+    except Exception as exc:
+        raise ContentUpdateFailedException(dto, exc, attempt)
+
+
+def _check_circuit(source_gateway: BaseSourceGateway, dto: ChapterDTO, attempt: int):
+    """fail fast while the circuit of the source is open, before waiting on the rate limiter"""
+    circuit_breaker = source_gateway.circuit_breaker
+    if circuit_breaker is None:
+        return
+
+    try:
+        circuit_breaker.check()
+    except CircuitOpenException as exc:
+        raise ContentUpdateFailedException(dto, exc, attempt)
+
+
+def _record(
+    concurrency: BaseConcurrencyController,
+    retry_policy: BaseRetryPolicy,
+    start: float,
+    exception: Exception,
+):
+    # refused requests never reached the source, hence say nothing of its capacity
+    if not isinstance(exception, CircuitOpenException):
+        concurrency.record(
+            time.monotonic() - start, retry_policy.is_transient(exception)
+        )
+
+
+@contextmanager
+def thread_engine(
+    source_gateway: BaseSourceGateway,
+    chapter_dtos: List[ChapterDTO],
+    workers: int,
+    rate_limiter: BaseRateLimiter,
+    retry_policy: BaseRetryPolicy,
+    concurrency: BaseConcurrencyController,
+    process: Callable[[ChapterDTO], Any] = _identity,
+) -> Iterator[Iterator[futures.Future]]:
+    """download chapters with a pool of threads each making a blocking request
+
+    the pool holds as many workers as the concurrency may be raised to,
+    the workers beyond the current limit are left idle.
+    """
+
+    def download(dto: ChapterDTO):
+        attempt = 0
+        while True:
+            _check_circuit(source_gateway, dto, attempt)
+
+            # wait for the host to permit another request before occupying the connection
+            rate_limiter.acquire(dto.url)
+            attempt += 1
+
+            start = time.monotonic()
+            try:
+                dto = source_gateway.update_chapter_content(dto)
+            except Exception as exc:
+                _record(concurrency, retry_policy, start, exc)
+                if not retry_policy.should_retry(exc, attempt):
+                    raise ContentUpdateFailedException(dto, exc, attempt)
+
+                delay = retry_policy.delay(attempt)
+                logger.debug(
+                    f"Retrying '{dto.title}' ({dto.index}) in {delay:.2f}s after {type(exc).__name__} "
+                    f"(attempt={attempt})."
+                )
+                time.sleep(delay)
+            else:
+                concurrency.record(time.monotonic() - start, False)
+                return _process(process, dto, attempt)
+
+    with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        download_window = Window(
+            lambda dto: executor.submit(download, dto),
+            chapter_dtos,
+            lambda: concurrency.limit,
+        )
+
+        try:
+            yield iter(download_window)
+        finally:
+            # prevents the rest from starting when exiting early
+            download_window.cancel()
+
+
+@contextmanager
+def async_engine(
+    async_source_gateway_factory: Callable[..., BaseAsyncSourceGateway],
+    source_gateway: BaseSourceGateway,
+    chapter_dtos: List[ChapterDTO],
+    workers: int,
+    rate_limiter: BaseRateLimiter,
+    retry_policy: BaseRetryPolicy,
+    concurrency: BaseConcurrencyController,
+    process: Callable[[ChapterDTO], Any] = _identity,
+) -> Iterator[Iterator[futures.Future]]:
+    """download chapters concurrently from a single event loop
+
+    the threads only parse and process the downloaded pages, hence their
+    count does not limit how many requests may be in flight.
+    """
+    with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        async_source_gateway = async_source_gateway_factory(
+            source_gateway=source_gateway, executor=executor
+        )
+
+        async def download(dto: ChapterDTO):
+            attempt = 0
+            while True:
+                _check_circuit(source_gateway, dto, attempt)
+
+                await asyncio.sleep(rate_limiter.reserve(dto.url))
+                attempt += 1
+
+                start = time.monotonic()
+                try:
+                    dto = await async_source_gateway.update_chapter_content(dto)
+                except Exception as exc:
+                    _record(concurrency, retry_policy, start, exc)
+                    if not retry_policy.should_retry(exc, attempt):
+                        raise ContentUpdateFailedException(dto, exc, attempt)
+
+                    delay = retry_policy.delay(attempt)
+                    logger.debug(
+                        f"Retrying '{dto.title}' ({dto.index}) in {delay:.2f}s after {type(exc).__name__} "
+                        f"(attempt={attempt})."
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    concurrency.record(time.monotonic() - start, False)
+                    return await asyncio.get_running_loop().run_in_executor(
+                        executor, _process, process, dto, attempt
+                    )
+
+        with async_helper.loop_in_thread() as loop:
+            download_window = Window(
+                lambda dto: asyncio.run_coroutine_threadsafe(download(dto), loop),
+                chapter_dtos,
+                lambda: concurrency.limit,
+            )
+
+            try:
+                yield iter(download_window)
+            finally:
+                # stops the rest when exiting early
+                download_window.cancel()
+
+                asyncio.run_coroutine_threadsafe(
+                    async_source_gateway.close(), loop
+                ).result()
@@ -1,15 +1,19 @@
+import functools
 import os
 import shutil
 import sys
+import threading
 from concurrent import futures
 from functools import lru_cache
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 import requests
 from dependency_injector.wiring import inject, Provide
 from loguru import logger
+from sqlalchemy.orm import scoped_session
 from tqdm import tqdm
 
+from novelsave.client.cli.helpers import engines
 from novelsave.client.cli.helpers.source import get_source_gateway
 from novelsave.containers import Application
 from novelsave.core.dtos import ChapterDTO
@@ -18,10 +22,23 @@ from novelsave.core.services import (
     BasePathService,
     BaseNovelService,
     BaseAssetService,
+    BaseAssetDownloader,
     BaseFileService,
+    BaseChapterWriter,
+)
+from novelsave.core.services.network import (
+    BaseCircuitBreaker,
+    BaseConcurrencyController,
+    BaseConcurrencyStore,
+    BaseRateLimiter,
+    BaseRetryPolicy,
+)
+from novelsave.core.services.source import BaseSourceGateway, BaseAsyncSourceGateway
+from novelsave.exceptions import (
+    CircuitOpenException,
+    ContentUpdateFailedException,
+    NSError,
 )
-from novelsave.core.services.source import BaseSourceGateway
-from novelsave.exceptions import ContentUpdateFailedException, NSError
 from novelsave.exceptions import CookieBrowserNotSupportedException
 from novelsave.settings import TQDM_CONFIG
 from novelsave.utils.adapters import DTOAdapter
@@ -52,6 +69,10 @@ def retrieve_novel_info(source_gateway: BaseSourceGateway, url: str, browser: st
         raise NSError(
             "Connection terminated unexpectedly; Make sure you are connected to the internet."
         )
+    except CircuitOpenException as e:
+        raise NSError(
+            f"Skipped as the circuit of {e.source} is open, retry in {e.retry_in:.0f}s."
+        )
 
     return output
 
@@ -98,12 +119,15 @@ def create_novel(
 def update_novel(
     novel: Novel,
     browser: Optional[str],
+    source_gateway: Optional[BaseSourceGateway] = None,
     novel_service: BaseNovelService = Provide[Application.services.novel_service],
 ):
     url = novel_service.get_primary_url(novel)
     logger.debug(f"Acquired primary novel url: {url}.")
 
-    source_gateway = get_source_gateway(url)
+    if source_gateway is None:
+        source_gateway = get_source_gateway(url)
+
     novel_dto = retrieve_novel_info(source_gateway, url, browser)
 
     novel_service.update_novel(novel, novel_dto)
@@ -121,10 +145,17 @@ def update_novel(
 def download_thumbnail(
     novel: Novel,
     force: bool = False,
+    executor: Optional[futures.Executor] = None,
     novel_service: BaseNovelService = Provide[Application.services.novel_service],
     file_service: BaseFileService = Provide[Application.services.file_service],
     path_service: BasePathService = Provide[Application.services.path_service],
-):
+    http_session: requests.Session = Provide[Application.services.http_session],
+) -> Optional[futures.Future]:
+    """download the thumbnail of the novel
+
+    :param executor: download in the executor instead, only the database is updated beforehand
+    :returns: future of the download when using an executor
+    """
     thumbnail_path = path_service.thumbnail_path(novel)
     novel_service.set_thumbnail_asset(
         novel, path_service.relative_to_data_dir(thumbnail_path)
@@ -132,29 +163,47 @@ def download_thumbnail(
 
     if not force and thumbnail_path.exists() and thumbnail_path.is_file():
         logger.info("Skipped thumbnail download since file already exists.")
-        return
+        return None
 
-    logger.debug(f"Attempting to download thumbnail from {novel.thumbnail_url}.")
-    try:
-        response = requests.get(novel.thumbnail_url)
-    except requests.ConnectionError:
-        raise NSError(
-            "Connection terminated unexpectedly; Make sure you are connected to the internet."
-        )
+    # the novel must not be accessed from the executor
+    thumbnail_url, relative_path = novel.thumbnail_url, novel.thumbnail_path
 
-    if not response.ok:
-        logger.error(
-            f"Encountered an error during thumbnail download: {response.status_code} {response.reason}."
+    def fetch():
+        logger.debug(f"Attempting to download thumbnail from {thumbnail_url}.")
+        try:
+            response = http_session.get(thumbnail_url)
+        except (requests.ConnectionError, requests.Timeout):
+            raise NSError(
+                "Connection terminated unexpectedly; Make sure you are connected to the internet."
+            )
+
+        if not response.ok:
+            logger.error(
+                f"Encountered an error during thumbnail download: {response.status_code} {response.reason}."
+            )
+            return
+
+        thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
+        file_service.write_bytes(thumbnail_path, response.content)
+
+        size = string_helper.format_bytes(len(response.content))
+        logger.info(
+            f"Downloaded and saved thumbnail image to {relative_path} ({size})."
         )
-        return
 
-    thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
-    file_service.write_bytes(thumbnail_path, response.content)
+    if executor is not None:
+        return executor.submit(fetch)
 
-    size = string_helper.format_bytes(len(response.content))
-    logger.info(
-        f"Downloaded and saved thumbnail image to {novel.thumbnail_path} ({size})."
-    )
+    fetch()
+    return None
+
+
+def circuit_state(source_gateway: BaseSourceGateway) -> str:
+    circuit_breaker = source_gateway.circuit_breaker
+    if circuit_breaker is None:
+        return BaseCircuitBreaker.CLOSED
+
+    return circuit_breaker.state
 
 
 @inject
@@ -162,74 +211,176 @@ def download_chapters(
     novel: Novel,
     limit: Optional[int],
     threads: Optional[int],
+    retry_failed: bool = False,
+    engine: str = engines.THREAD,
+    source_gateway: Optional[BaseSourceGateway] = None,
+    progress: bool = True,
+    on_written: Optional[Callable[[], None]] = None,
     novel_service: BaseNovelService = Provide[Application.services.novel_service],
     asset_service: BaseAssetService = Provide[Application.services.asset_service],
+    rate_limiter: BaseRateLimiter = Provide[Application.services.rate_limiter],
+    retry_policy: BaseRetryPolicy = Provide[Application.services.retry_policy],
+    chapter_writer_factory: Callable[..., BaseChapterWriter] = Provide[
+        Application.services.chapter_writer.provider
+    ],
+    async_source_gateway_factory: Callable[..., BaseAsyncSourceGateway] = Provide[
+        Application.services.async_source_gateway.provider
+    ],
+    concurrency_controller_factory: Callable[..., BaseConcurrencyController] = Provide[
+        Application.services.concurrency_controller.provider
+    ],
+    concurrency_store: BaseConcurrencyStore = Provide[
+        Application.services.concurrency_store
+    ],
+    default_concurrency: int = Provide[Application.config.download.concurrency],
+    max_concurrency: int = Provide[Application.config.download.connections],
     dto_adapter: DTOAdapter = Provide[Application.adapters.dto_adapter],
-):
-    chapters = novel_service.get_pending_chapters(novel, limit)
+) -> Tuple[int, int]:
+    """download the pending chapters of the novel
+
+    :param threads: no. of concurrent requests, tuned for the source when not provided
+    :param retry_failed: include chapters whose previous failures are not yet eligible for retry
+    :param engine: 'thread' to make a blocking request per thread or 'async' to make them from an event loop
+    :param source_gateway: gateway to download from, otherwise acquired using the primary url of novel
+    :param progress: whether to display a progress bar
+    :param on_written: called from the writer thread once a batch of chapters is persisted
+    :returns: no. of chapters that succeeded and failed
+    """
+    chapters = novel_service.get_pending_chapters(
+        novel, limit, include_failed=retry_failed
+    )
     if not chapters:
         logger.info("Skipped chapter download as none are pending.")
-        return
+        return 0, 0
 
-    url = novel_service.get_primary_url(novel)
-    logger.debug(f"Acquired primary novel url: {url}.")
+    if source_gateway is None:
+        url = novel_service.get_primary_url(novel)
+        logger.debug(f"Acquired primary novel url: {url}.")
 
-    source_gateway = get_source_gateway(url)
-    thread_count = (
-        min(threads, os.cpu_count()) if threads is not None else os.cpu_count()
-    )
+        source_gateway = get_source_gateway(url)
+    chapter_dtos = [dto_adapter.chapter_to_dto(c) for c in chapters]
 
-    def download(dto: ChapterDTO):
-        try:
-            return source_gateway.update_chapter_content(dto)
-        except Exception as exc:
-            raise ContentUpdateFailedException(dto, exc)
+    def extract_assets(chapter_dto: ChapterDTO):
+        # parsing runs on the download workers, only registering the assets is left to the writer
+        chapter_dto.content, assets = asset_service.extract_assets(chapter_dto)
+        return chapter_dto, assets
 
-    logger.info(
-        f"Downloading {len(chapters)} pending chapters with {thread_count} threads…"
-    )
-    successes = 0
-    with tqdm(total=len(chapters), **TQDM_CONFIG) as pbar:
-        with futures.ThreadPoolExecutor(max_workers=thread_count) as executor:
-            download_futures = [
-                executor.submit(download, dto_adapter.chapter_to_dto(c))
-                for c in chapters
-            ]
+    if threads is not None:
+        # fixed by the user, hence neither tuned nor remembered
+        max_concurrency = threads
+        concurrency = concurrency_controller_factory(
+            initial=threads, minimum=threads, maximum=threads
+        )
+    else:
+        concurrency = concurrency_controller_factory(
+            initial=concurrency_store.get(source_gateway.name) or default_concurrency,
+            minimum=1,
+            maximum=max_concurrency,
+        )
+        logger.debug(
+            f"Tuning concurrency of {source_gateway.name} up to {max_concurrency} "
+            f"starting from {concurrency.limit}."
+        )
 
-            for future in futures.as_completed(download_futures):
-                try:
-                    chapter_dto = future.result()
-                    chapter_dto.content = asset_service.collect_assets(
-                        novel, chapter_dto
-                    )
-                    novel_service.update_content(chapter_dto)
+    if engine == engines.ASYNC:
+        logger.info(
+            f"Downloading {len(chapters)} pending chapters with {concurrency.limit} concurrent requests…"
+        )
+        download_engine = engines.async_engine(
+            functools.partial(
+                async_source_gateway_factory, connections=max_concurrency
+            ),
+            source_gateway,
+            chapter_dtos,
+            # threads only parse the responses, requests are bounded by the concurrency instead
+            os.cpu_count(),
+            rate_limiter,
+            retry_policy,
+            concurrency,
+            extract_assets,
+        )
+    else:
+        logger.info(
+            f"Downloading {len(chapters)} pending chapters with {concurrency.limit} threads…"
+        )
+        download_engine = engines.thread_engine(
+            source_gateway,
+            chapter_dtos,
+            max_concurrency,
+            rate_limiter,
+            retry_policy,
+            concurrency,
+            extract_assets,
+        )
 
-                    logger.debug(
-                        f"Chapter content downloaded: '{chapter_dto.title}' ({chapter_dto.index})"
-                    )
-                    successes += 1
-                except ContentUpdateFailedException as e:
-                    logger.error(
-                        f"An error occurred during content download: {type(e.exception)}."
-                    )
-                    logger.debug(
-                        "An error occurred during content download: {}",
-                        type(e.exception),
-                    )
+    if rate_limiter.is_enabled:
+        logger.debug("Throttling chapter requests according to per-host rate limits.")
+    successes = 0
+    refused = 0
+    with tqdm(total=len(chapters), disable=not progress, **TQDM_CONFIG) as pbar:
+        # the writer is exited last, so that downloaded chapters are persisted even when interrupted
+        with chapter_writer_factory(
+            novel=novel, on_written=on_written
+        ) as chapter_writer:
+            with download_engine as download_futures:
+                for future in download_futures:
+                    try:
+                        chapter_dto, assets = future.result()
+                        chapter_writer.put(chapter_dto, assets)
+
+                        logger.debug(
+                            f"Chapter content downloaded: '{chapter_dto.title}' ({chapter_dto.index})"
+                        )
+                        successes += 1
+                    except ContentUpdateFailedException as e:
+                        if isinstance(e.exception, CircuitOpenException):
+                            # not journaled, the chapter was never requested
+                            logger.debug(
+                                f"Skipped '{e.chapter.title}' ({e.chapter.index}) as the circuit is open."
+                            )
+                            refused += 1
+                        else:
+                            logger.error(
+                                f"An error occurred during content download: {type(e.exception)}."
+                            )
+                            logger.debug(
+                                "An error occurred during content download: {}",
+                                type(e.exception),
+                            )
+                            chapter_writer.put_failure(e)
+
+                    pbar.update(1)
+                    state = circuit_state(source_gateway)
+                    if state != BaseCircuitBreaker.CLOSED:
+                        pbar.set_postfix_str(f"circuit {state}")
+
+    if refused:
+        logger.warning(
+            f"Skipped {refused} chapters as the circuit of {source_gateway.name} is "
+            f"{circuit_state(source_gateway)}, they are downloaded by the next update."
+        )
 
-                pbar.update(1)
+    # the level reached during an outage says little about the source
+    if threads is None and not refused:
+        concurrency_store.put(source_gateway.name, concurrency.limit)
+        logger.debug(
+            f"Remembered concurrency of {source_gateway.name}: {concurrency.limit}."
+        )
 
     logger.info(
         f"Chapters download complete, {successes} succeeded, with {len(chapters) - successes} errors."
     )
+    return successes, len(chapters) - successes
 
 
 @inject
 def download_assets(
     novel: Novel,
+    progress: bool = True,
     asset_service: BaseAssetService = Provide[Application.services.asset_service],
-    file_service: BaseFileService = Provide[Application.services.file_service],
-    path_service: BasePathService = Provide[Application.services.path_service],
+    asset_downloader: BaseAssetDownloader = Provide[
+        Application.services.asset_downloader
+    ],
 ):
     pending = asset_service.pending_assets(novel)
     if not pending:
@@ -237,23 +388,158 @@ def download_assets(
         return
 
     logger.info(f"Downloading pending assets (count={len(pending)}).")
-    for asset in tqdm(pending, **TQDM_CONFIG):
-        response = requests.get(asset.url)
-        if not response.ok:
-            logger.error(f"Error during asset download: {asset.url} ({asset.id}).")
-            continue
+    errors = 0
+    with tqdm(total=len(pending), disable=not progress, **TQDM_CONFIG) as pbar:
+        for asset, error in asset_downloader.download(novel, pending):
+            if error is None:
+                logger.debug(f"Asset downloaded and saved: {asset.url} ({asset.id}).")
+            else:
+                logger.error(
+                    f"Error during asset download: {error.url} ({error.reason})."
+                )
+                errors += 1
+
+            pbar.update(1)
+
+    logger.info(
+        f"Assets download complete, {len(pending) - errors} succeeded, with {errors} errors."
+    )
+
 
-        file = path_service.asset_path(novel, asset)
-        file.parent.mkdir(parents=True, exist_ok=True)
+@inject
+def follow_assets(
+    novel_id: int,
+    written: threading.Event,
+    finished: threading.Event,
+    novel_service: BaseNovelService = Provide[Application.services.novel_service],
+    asset_service: BaseAssetService = Provide[Application.services.asset_service],
+    asset_downloader: BaseAssetDownloader = Provide[
+        Application.services.asset_downloader
+    ],
+    session: scoped_session = Provide[Application.infrastructure.session],
+) -> Tuple[int, int]:
+    """download the assets of the novel as they are registered, meant to run on its own thread
+
+    pending assets are looked up each time written is set, until finished is set.
+
+    :returns: no. of assets that succeeded and failed
+    """
+    succeeded = errors = 0
+    submitted = set()
+    try:
+        novel = novel_service.get_novel_by_id(novel_id)
+        while True:
+            written.wait()
+            written.clear()
+            last = finished.is_set()
+
+            # the assets registered by the writer since are not in the identity map
+            session.expire(novel, ["assets"])
+
+            # failed assets remain pending, they are only attempted once in a run
+            pending = [
+                a for a in asset_service.pending_assets(novel) if a.id not in submitted
+            ]
+            submitted.update(a.id for a in pending)
+
+            for asset, error in asset_downloader.download(novel, pending):
+                if error is None:
+                    logger.debug(
+                        f"Asset downloaded and saved: {asset.url} ({asset.id})."
+                    )
+                    succeeded += 1
+                else:
+                    logger.error(
+                        f"Error during asset download: {error.url} ({error.reason})."
+                    )
+                    errors += 1
+
+            if last:
+                break
+    finally:
+        session.remove()
 
-        file_service.write_bytes(file, response.content)
+    return succeeded, errors
 
-        asset.path = str(path_service.relative_to_data_dir(file))
-        asset_service.update_asset_path(asset)
 
-        logger.debug(f"Asset downloaded and saved: {asset.url} ({asset.id}).")
+def download_content(
+    novel: Novel,
+    limit: Optional[int],
+    threads: Optional[int],
+    retry_failed: bool = False,
+    engine: str = engines.THREAD,
+    source_gateway: Optional[BaseSourceGateway] = None,
+    progress: bool = True,
+    sequential: bool = False,
+) -> Tuple[int, int]:
+    """download the thumbnail, the pending chapters and the assets of the novel
+
+    the thumbnail is downloaded alongside the chapters, and the assets of each
+    persisted batch of chapters are downloaded while the rest of the chapters are,
+    unless sequential.
+
+    :returns: no. of chapters that succeeded and failed
+    """
+    download = limit is None or limit > 0
+    if not download:
+        logger.info("Skipped chapter download since it was specified as such.")
+
+    if sequential:
+        download_thumbnail(novel)
+        result = (0, 0)
+        if download:
+            result = download_chapters(
+                novel,
+                limit,
+                threads,
+                retry_failed,
+                engine,
+                source_gateway=source_gateway,
+                progress=progress,
+            )
+
+        download_assets(novel, progress=progress)
+        return result
+
+    written, finished = threading.Event(), threading.Event()
+    with futures.ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix="stage"
+    ) as executor:
+        thumbnail = download_thumbnail(novel, executor=executor)
+
+        # assets left pending by previous runs are downloaded right away
+        written.set()
+        assets = executor.submit(follow_assets, novel.id, written, finished)
+
+        result = (0, 0)
+        try:
+            if download:
+                result = download_chapters(
+                    novel,
+                    limit,
+                    threads,
+                    retry_failed,
+                    engine,
+                    source_gateway=source_gateway,
+                    progress=progress,
+                    on_written=written.set,
+                )
+        finally:
+            finished.set()
+            written.set()
+
+        succeeded, errors = assets.result()
+        if thumbnail is not None:
+            thumbnail.result()
+
+    if succeeded or errors:
+        logger.info(
+            f"Assets download complete, {succeeded} succeeded, with {errors} errors."
+        )
+    else:
+        logger.info("Skipped assets download as none are pending.")
 
-    logger.info("Assets download complete.")
+    return result
 
 
 @lru_cache(maxsize=1)
@@ -0,0 +1,70 @@
+"""
+Scheduler that runs jobs concurrently under an overall and a per-key limit
+
+Jobs that share a key (such as the source of a novel) wait for one another
+without occupying a worker, hence a busy key never starves the others.
+"""
+from collections import OrderedDict, deque
+from concurrent import futures
+from typing import Callable, Deque, Dict, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def schedule(
+    items: Iterable[T],
+    key: Callable[[T], str],
+    run: Callable[[T], object],
+    workers: int,
+    workers_per_key: int,
+) -> Iterator[Tuple[T, futures.Future]]:
+    """run each item concurrently
+
+    at most workers items run at once, of which at most workers_per_key share the same key.
+    keys are served in a round-robin manner, items of a key in the order provided.
+
+    :returns: iterator of the items along with their completed future
+    """
+    workers = max(workers, 1)
+    workers_per_key = max(workers_per_key, 1)
+
+    pending: Dict[str, Deque[T]] = OrderedDict()
+    for item in items:
+        pending.setdefault(key(item), deque()).append(item)
+
+    running: Dict[futures.Future, Tuple[str, T]] = {}
+    running_per_key: Dict[str, int] = {k: 0 for k in pending}
+
+    with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+
+        def fill():
+            progressed = True
+            while progressed and len(running) < workers:
+                progressed = False
+                for k in list(pending):
+                    if len(running) >= workers:
+                        break
+                    if running_per_key[k] >= workers_per_key:
+                        continue
+
+                    item = pending[k].popleft()
+                    if not pending[k]:
+                        del pending[k]
+
+                    running[executor.submit(run, item)] = (k, item)
+                    running_per_key[k] += 1
+                    progressed = True
+
+        try:
+            fill()
+            while running:
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    k, item = running.pop(future)
+                    running_per_key[k] -= 1
+                    yield item, future
+
+                fill()
+        finally:
+            # nothing new is started when exiting early, the running jobs are waited upon
+            pending.clear()
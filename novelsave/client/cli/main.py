@@ -62,7 +62,8 @@ def cli(debug: bool, plain: bool, skip_updates: bool):
 
     # only check for updates if this is not a help run
     if "--help" not in sys.argv[1:] and not skip_updates:
-        atexit.register(update_check_event)
+        # started early so that the check runs alongside the command
+        atexit.register(update_check_event())
 
 
 # @logger_config.catch()
@@ -1,28 +1,11 @@
+from typing import Any, Dict
+
 from dependency_injector import containers, providers
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 
-from novelsave.services import (
-    FileService,
-    NovelService,
-    PathService,
-    AssetService,
-    MetaService,
-    CalibreService,
-)
-from novelsave.services.config import ConfigService
-from novelsave.services.packagers import (
-    EpubPackager,
-    HtmlPackager,
-    MobiPackager,
-    PackagerProvider,
-    PdfPackager,
-    Azw3Packager,
-    TextPackager,
-)
-from novelsave.services.source import SourceService
-from novelsave.utils.adapters import SourceAdapter, DTOAdapter
+from novelsave.utils.helpers.import_helper import lazy_import
 
 
 @event.listens_for(Engine, "connect")
@@ -32,24 +15,68 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.close()
 
 
+SQLITE_JOURNAL_MODES = {"delete", "truncate", "persist", "memory", "wal", "off"}
+SQLITE_SYNCHRONOUS = {"off", "normal", "full", "extra"}
+
+
+def create_database_engine(url: str, sqlite: Dict[str, Any]) -> Engine:
+    """engine of the database, sqlite connections are tuned with the profile once opened
+
+    :param sqlite: journal_mode, synchronous, mmap_size (bytes),
+        cache_size (KiB) and busy_timeout (milliseconds) of sqlite connections
+    """
+    engine = create_engine(url, future=True)
+    if engine.dialect.name != "sqlite":
+        return engine
+
+    journal_mode = str(sqlite["journal_mode"]).lower()
+    if journal_mode not in SQLITE_JOURNAL_MODES:
+        raise ValueError(f"Unknown sqlite journal mode: '{journal_mode}'.")
+
+    synchronous = str(sqlite["synchronous"]).lower()
+    if synchronous not in SQLITE_SYNCHRONOUS:
+        raise ValueError(f"Unknown sqlite synchronous setting: '{synchronous}'.")
+
+    pragmas = [
+        f"PRAGMA busy_timeout={int(sqlite['busy_timeout'])}",
+        f"PRAGMA journal_mode={journal_mode}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA mmap_size={int(sqlite['mmap_size'])}",
+        # negative sizes are in KiB rather than pages
+        f"PRAGMA cache_size={-int(sqlite['cache_size'])}",
+    ]
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_profile(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
+
 class Adapters(containers.DeclarativeContainer):
     source_adapter = providers.Factory(
-        SourceAdapter,
+        lazy_import("novelsave.utils.adapters.SourceAdapter"),
     )
 
     dto_adapter = providers.Factory(
-        DTOAdapter,
+        lazy_import("novelsave.utils.adapters.DTOAdapter"),
     )
 
 
 class Infrastructure(containers.DeclarativeContainer):
     config = providers.Configuration()
+    sqlite = providers.Configuration()
 
-    engine = providers.Singleton(create_engine, url=config.database.url, future=True)
-    session_factory = providers.Singleton(
+    engine = providers.ThreadSafeSingleton(
+        create_database_engine, url=config.database.url, sqlite=sqlite
+    )
+    session_factory = providers.ThreadSafeSingleton(
         sessionmaker, autocommit=False, autoflush=False, bind=engine
     )
-    session = providers.Singleton(scoped_session, session_factory)
+    session = providers.ThreadSafeSingleton(scoped_session, session_factory)
 
 
 class Services(containers.DeclarativeContainer):
@@ -59,33 +86,77 @@ class Services(containers.DeclarativeContainer):
     infrastructure = providers.DependenciesContainer()
 
     config_service = providers.Singleton(
-        ConfigService,
+        lazy_import("novelsave.services.config.ConfigService"),
         config_file=config.config.file,
         defaults=config.config.defaults,
     )
 
+    response_cache = providers.ThreadSafeSingleton(
+        lazy_import("novelsave.services.network.ResponseCache"),
+        cache_dir=config.cache.dir,
+        max_size=config.cache.max_size,
+    )
+
+    # pooled session shared by every request that is not made through a source
+    http_session = providers.ThreadSafeSingleton(
+        lazy_import("novelsave.services.network.HttpSession"),
+        pool_size=config.assets.connections,
+        timeout=config.download.timeout,
+        response_cache=response_cache,
+    )
+
     meta_service = providers.Factory(
-        MetaService,
+        lazy_import("novelsave.services.MetaService"),
+        http_session=http_session,
     )
 
     file_service = providers.Factory(
-        FileService,
+        lazy_import("novelsave.services.FileService"),
+    )
+
+    version_cache = providers.ThreadSafeSingleton(
+        lazy_import("novelsave.services.VersionCache"),
+        file=config.updates.file,
+        ttl=config.updates.ttl,
     )
 
     novel_service = providers.Factory(
-        NovelService,
+        lazy_import("novelsave.services.NovelService"),
         session=infrastructure.session,
         dto_adapter=adapters.dto_adapter,
         file_service=file_service,
+        compression=config.storage.compression,
+    )
+
+    circuit_breaker = providers.Factory(
+        lazy_import("novelsave.services.network.CircuitBreaker"),
+        threshold=config.circuit.threshold,
+        cooldown=config.circuit.cooldown,
+    )
+
+    cookie_cache = providers.ThreadSafeSingleton(
+        lazy_import("novelsave.services.network.CookieCache"),
+        cookies_dir=config.cookies.dir,
+        ttl=config.cookies.ttl,
     )
 
-    source_service = providers.Singleton(
-        SourceService,
+    source_service = providers.ThreadSafeSingleton(
+        lazy_import("novelsave.services.source.SourceService"),
         source_adapter=adapters.source_adapter,
+        http_session=http_session,
+        response_cache=response_cache,
+        circuit_breaker_factory=circuit_breaker.provider,
+        cookie_cache=cookie_cache,
+    )
+
+    async_source_gateway = providers.Factory(
+        lazy_import("novelsave.services.source.AsyncSourceGateway"),
+        connections=config.download.connections,
+        timeout=config.download.timeout,
     )
 
     path_service = providers.Factory(
-        PathService,
+        lazy_import("novelsave.services.PathService"),
         data_dir=config.data.dir,
         novels_dir=config.novel.dir,
         config_dir=config.config.dir,
@@ -95,12 +166,65 @@ class Services(containers.DeclarativeContainer):
     )
 
     asset_service = providers.Factory(
-        AssetService,
+        lazy_import("novelsave.services.AssetService"),
         session=infrastructure.session,
         path_service=path_service,
     )
 
-    calibre_service = providers.Factory(CalibreService)
+    asset_downloader = providers.Factory(
+        lazy_import("novelsave.services.AssetDownloader"),
+        asset_service=asset_service,
+        path_service=path_service,
+        file_service=file_service,
+        http_session=http_session,
+        connections=config.assets.connections,
+        host_connections=config.assets.host_connections,
+        max_size=config.assets.max_size,
+    )
+
+    calibre_service = providers.Factory(
+        lazy_import("novelsave.services.CalibreService")
+    )
+
+    rate_limiter = providers.ThreadSafeSingleton(
+        lazy_import("novelsave.services.network.RateLimiter"),
+        rate=config.download.rate,
+        burst=config.download.burst,
+    )
+
+    retry_policy = providers.ThreadSafeSingleton(
+        lazy_import("novelsave.services.network.RetryPolicy"),
+        attempts=config.retry.attempts,
+        backoff=config.retry.backoff,
+        max_backoff=config.retry.max_backoff,
+        cooldown=config.retry.cooldown,
+    )
+
+    # tuned for a single download, seeded from the level remembered for the source
+    concurrency_controller = providers.Factory(
+        lazy_import("novelsave.services.network.ConcurrencyController")
+    )
+
+    concurrency_store = providers.ThreadSafeSingleton(
+        lazy_import("novelsave.services.network.ConcurrencyStore"),
+        file=config.download.concurrency_file,
+    )
+
+    failure_service = providers.Factory(
+        lazy_import("novelsave.services.FailureService"),
+        session=infrastructure.session,
+        retry_policy=retry_policy,
+    )
+
+    chapter_writer = providers.Factory(
+        lazy_import("novelsave.services.ChapterWriter"),
+        session=infrastructure.session,
+        novel_service=novel_service,
+        asset_service=asset_service,
+        failure_service=failure_service,
+        batch_size=config.writer.batch_size,
+        interval=config.writer.interval,
+    )
 
 
 class Packagers(containers.DeclarativeContainer):
@@ -108,7 +232,7 @@ class Packagers(containers.DeclarativeContainer):
     services = providers.DependenciesContainer()
 
     epub_packager = providers.Factory(
-        EpubPackager,
+        lazy_import("novelsave.services.packagers.EpubPackager"),
         novel_service=services.novel_service,
         file_service=services.file_service,
         path_service=services.path_service,
@@ -116,7 +240,7 @@ class Packagers(containers.DeclarativeContainer):
     )
 
     html_packager = providers.Factory(
-        HtmlPackager,
+        lazy_import("novelsave.services.packagers.HtmlPackager"),
         static_dir=config.static.dir,
         novel_service=services.novel_service,
         file_service=services.file_service,
@@ -126,38 +250,39 @@ class Packagers(containers.DeclarativeContainer):
     )
 
     text_packager = providers.Factory(
-        TextPackager,
+        lazy_import("novelsave.services.packagers.TextPackager"),
         novel_service=services.novel_service,
         file_service=services.file_service,
         path_service=services.path_service,
     )
 
     mobi_packager = providers.Factory(
-        MobiPackager,
+        lazy_import("novelsave.services.packagers.MobiPackager"),
         calibre_service=services.calibre_service,
         path_service=services.path_service,
     )
 
     pdf_packager = providers.Factory(
-        PdfPackager,
+        lazy_import("novelsave.services.packagers.PdfPackager"),
         calibre_service=services.calibre_service,
         path_service=services.path_service,
     )
 
     azw3_packager = providers.Factory(
-        Azw3Packager,
+        lazy_import("novelsave.services.packagers.Azw3Packager"),
         calibre_service=services.calibre_service,
         path_service=services.path_service,
     )
 
     packager_provider = providers.Factory(
-        PackagerProvider,
-        epub_packager,
-        html_packager,
-        mobi_packager,
-        pdf_packager,
-        azw3_packager,
-        text_packager,
+        lazy_import("novelsave.services.packagers.PackagerProvider"),
+        epub=epub_packager.provider,
+        html=html_packager.provider,
+        web=html_packager.provider,
+        mobi=mobi_packager.provider,
+        pdf=pdf_packager.provider,
+        azw3=azw3_packager.provider,
+        text=text_packager.provider,
     )
 
 
@@ -171,6 +296,7 @@ class Application(containers.DeclarativeContainer):
     infrastructure = providers.Container(
         Infrastructure,
         config=config.infrastructure,
+        sqlite=config.sqlite,
     )
 
     services = providers.Container(
@@ -1,3 +1,4 @@
+from .chapter_counts_dto import ChapterCountsDTO
 from .chapter_dto import ChapterDTO
 from .metadata_dto import MetaDataDTO
 from .novel_dto import NovelDTO
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ChapterCountsDTO:
+    total: int
+    downloaded: int
+    failed: int
+
+    @property
+    def pending(self) -> int:
+        return self.total - self.downloaded
@@ -1,6 +1,9 @@
 from .asset import Asset
 from .asset_type import AssetType
 from .chapter import Chapter
+from .chapter_content import ChapterContent
+from .chapter_failure import ChapterFailure
+from .content_dictionary import ContentDictionary
 from .metadata import MetaData
 from .novel import Novel
 from .novel_url import NovelUrl
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from sqlalchemy import (
     Column,
     Integer,
@@ -6,9 +8,14 @@ from sqlalchemy import (
     ForeignKey,
     func,
     UniqueConstraint,
+    select,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, object_session
 
+from novelsave.utils.helpers import compression_helper
+from .chapter_content import ChapterContent
+from .content_dictionary import ContentDictionary
 from ..base import Base
 
 
@@ -19,12 +26,59 @@ class Chapter(Base):
     id = Column(Integer, primary_key=True)
     index = Column(Integer, nullable=False)
     title = Column(String, nullable=False)
-    url = Column(String, nullable=False)
+    url = Column(String, nullable=False, index=True)
 
-    content = Column(String, nullable=True)
     volume_id = Column(Integer, ForeignKey("volumes.id"), nullable=False)
     volume = relationship("Volume", back_populates="chapters")
 
+    body = relationship(
+        "ChapterContent",
+        back_populates="chapter",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    failure = relationship(
+        "ChapterFailure",
+        back_populates="chapter",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
     last_updated = Column(
         TIMESTAMP, server_default=func.now(), onupdate=func.current_timestamp()
     )
+
+    @hybrid_property
+    def content(self) -> Optional[str]:
+        if self.body is None:
+            return None
+
+        return compression_helper.decompress(self.body.content, self._load_dictionary)
+
+    @content.setter
+    def content(self, value):
+        if value is None:
+            self.body = None
+        elif self.body is None:
+            self.body = ChapterContent(content=value)
+        else:
+            self.body.content = value
+
+    @content.expression
+    def content(cls):
+        return (
+            select(ChapterContent.content)
+            .where(ChapterContent.chapter_id == cls.id)
+            .scalar_subquery()
+        )
+
+    def _load_dictionary(self, digest: bytes) -> Optional[bytes]:
+        session = object_session(self)
+        if session is None:
+            return None
+
+        return session.execute(
+            select(ContentDictionary.data).where(ContentDictionary.digest == digest)
+        ).scalar()
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy.orm import relationship
+
+from ..base import Base
+
+
+class ChapterContent(Base):
+    """content of a downloaded chapter, kept apart so that chapter rows stay small"""
+
+    __tablename__ = "chapter_contents"
+
+    chapter_id = Column(
+        Integer, ForeignKey("chapters.id", ondelete="CASCADE"), primary_key=True
+    )
+    chapter = relationship("Chapter", back_populates="body")
+
+    # compressed bytes, or the text of chapters stored before compression
+    content = Column(String, nullable=False)
@@ -0,0 +1,34 @@
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Integer,
+    String,
+    TIMESTAMP,
+    ForeignKey,
+    func,
+)
+from sqlalchemy.orm import relationship
+
+from ..base import Base
+
+
+class ChapterFailure(Base):
+    __tablename__ = "chapter_failures"
+
+    id = Column(Integer, primary_key=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    is_permanent = Column(Boolean, nullable=False, default=False)
+    reason = Column(String, nullable=True)
+    retry_after = Column(TIMESTAMP, nullable=True)
+
+    chapter_id = Column(
+        Integer,
+        ForeignKey("chapters.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    chapter = relationship("Chapter", back_populates="failure")
+
+    last_updated = Column(
+        TIMESTAMP, server_default=func.now(), onupdate=func.current_timestamp()
+    )
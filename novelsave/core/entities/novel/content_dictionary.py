@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, LargeBinary
+from sqlalchemy.orm import relationship
+
+from ..base import Base
+
+
+class ContentDictionary(Base):
+    """dictionary the chapter content of a novel is compressed with"""
+
+    __tablename__ = "content_dictionaries"
+
+    id = Column(Integer, primary_key=True)
+    codec = Column(String, nullable=False)
+    digest = Column(LargeBinary, nullable=False, unique=True)
+    data = Column(LargeBinary, nullable=False)
+
+    novel_id = Column(
+        Integer,
+        ForeignKey("novels.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    novel = relationship("Novel", back_populates="content_dictionary")
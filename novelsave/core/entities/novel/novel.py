@@ -30,3 +30,10 @@ class Novel(Base):
         "MetaData", back_populates="novel", cascade="all, delete-orphan"
     )
     assets = relationship("Asset", back_populates="novel", cascade="all, delete-orphan")
+    content_dictionary = relationship(
+        "ContentDictionary",
+        back_populates="novel",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
@@ -8,7 +8,7 @@ class NovelUrl(Base):
     __tablename__ = "novel_urls"
 
     id = Column(Integer, primary_key=True)
-    url = Column(String, nullable=False)
+    url = Column(String, nullable=False, index=True)
 
     novel_id = Column(Integer, ForeignKey("novels.id"))
     novel = relationship("Novel", back_populates="urls", lazy="joined")
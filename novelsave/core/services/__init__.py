@@ -1,5 +1,12 @@
 from .base_file_service import BaseFileService
 from .base_meta_service import BaseMetaService
 from .base_path_service import BasePathService
-from .novel import BaseNovelService, BaseAssetService
+from .base_version_cache import BaseVersionCache
+from .novel import (
+    BaseNovelService,
+    BaseAssetService,
+    BaseAssetDownloader,
+    BaseFailureService,
+    BaseChapterWriter,
+)
 from .tools import BaseCalibreService
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Iterable
 
 
 class BaseFileService(ABC):
@@ -11,6 +12,13 @@ class BaseFileService(ABC):
     def write_bytes(self, path: Path, data: bytes):
         """write and replace bytes to a file"""
 
+    @abstractmethod
+    def write_chunks(self, path: Path, chunks: Iterable[bytes]) -> int:
+        """write and replace bytes to a file as they arrive, the file is only replaced once all chunks are written
+
+        :returns: no. of bytes written
+        """
+
     @abstractmethod
     def read_str(self, path: Path) -> str:
         """read strings from a file"""
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class BaseVersionCache(ABC):
+    @abstractmethod
+    def get(self, package: str) -> Optional[str]:
+        """latest version of the package found by a recent check, if any"""
+
+    @abstractmethod
+    def put(self, package: str, version: str):
+        """remember the latest version of the package found by a check"""
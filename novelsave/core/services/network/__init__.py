@@ -0,0 +1,7 @@
+from .base_circuit_breaker import BaseCircuitBreaker
+from .base_concurrency_controller import BaseConcurrencyController
+from .base_concurrency_store import BaseConcurrencyStore
+from .base_cookie_cache import BaseCookieCache
+from .base_rate_limiter import BaseRateLimiter
+from .base_response_cache import BaseResponseCache
+from .base_retry_policy import BaseRetryPolicy
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+
+class BaseCircuitBreaker(ABC):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    @property
+    @abstractmethod
+    def state(self) -> str:
+        """closed while requests are permitted, open while they are refused, half-open while probing"""
+
+    @abstractmethod
+    def check(self):
+        """raise if requests are currently refused, without claiming the probe
+
+        :raises CircuitOpenException: if requests are refused
+        """
+
+    @abstractmethod
+    def before_request(self):
+        """permit a request, or refuse it while the circuit is open
+
+        :raises CircuitOpenException: if the request is refused
+        """
+
+    @abstractmethod
+    def record_success(self):
+        """record a request that reached the source"""
+
+    @abstractmethod
+    def record_failure(self, exception: Exception):
+        """record a failed request, failures that suggest an outage may open the circuit"""
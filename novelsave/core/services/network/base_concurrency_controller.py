@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+
+class BaseConcurrencyController(ABC):
+    @property
+    @abstractmethod
+    def limit(self) -> int:
+        """maximum requests that should currently be in flight"""
+
+    @abstractmethod
+    def record(self, latency: float, congested: bool):
+        """record the outcome of a completed request
+
+        :param latency: seconds taken by the request
+        :param congested: whether the request failed in a way that suggests the host is overloaded
+        """
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class BaseConcurrencyStore(ABC):
+    @abstractmethod
+    def get(self, source: str) -> Optional[int]:
+        """concurrency level settled on by the previous download from the source, if any"""
+
+    @abstractmethod
+    def put(self, source: str, limit: int):
+        """remember the concurrency level settled on for the source"""
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from requests.cookies import RequestsCookieJar
+
+
+class BaseCookieCache(ABC):
+    @abstractmethod
+    def get(self, source: str, browser: str) -> Optional[RequestsCookieJar]:
+        """cookies of the source previously extracted from the browser, if not yet expired"""
+
+    @abstractmethod
+    def put(self, source: str, browser: str, cookies: RequestsCookieJar):
+        """remember the cookies of the source extracted from the browser"""
+
+    @abstractmethod
+    def invalidate(self, source: str, browser: str):
+        """forget the cookies of the source extracted from the browser"""
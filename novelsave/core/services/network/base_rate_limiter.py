@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+
+class BaseRateLimiter(ABC):
+    @property
+    @abstractmethod
+    def is_enabled(self) -> bool:
+        """whether requests are being throttled at all"""
+
+    @abstractmethod
+    def reserve(self, url: str) -> float:
+        """reserve permission for a request to the host of url without blocking
+
+        :returns: seconds the caller must wait before making the request
+        """
+
+    @abstractmethod
+    def acquire(self, url: str) -> float:
+        """block until a request to the host of url is permitted
+
+        :returns: seconds spent waiting for permission
+        """
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Dict
+
+import requests
+
+
+class BaseResponseCache(ABC):
+    @property
+    @abstractmethod
+    def is_enabled(self) -> bool:
+        """whether responses are being cached at all"""
+
+    @abstractmethod
+    def fetch(
+        self, url: str, send: Callable[[Dict[str, str]], requests.Response]
+    ) -> requests.Response:
+        """answer a GET request to url from the cache where possible
+
+        :param send: makes the request with the provided additional headers,
+            used when the cached response is missing or must be revalidated
+        :returns: the cached response if it is fresh or was not modified, otherwise the new response
+        """
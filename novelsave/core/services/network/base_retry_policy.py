@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+
+class BaseRetryPolicy(ABC):
+    @abstractmethod
+    def is_transient(self, exception: Exception) -> bool:
+        """whether the error is expected to go away if the request is repeated shortly"""
+
+    @abstractmethod
+    def is_permanent(self, exception: Exception) -> bool:
+        """whether the error will not go away however often the request is repeated"""
+
+    @abstractmethod
+    def should_retry(self, exception: Exception, attempt: int) -> bool:
+        """whether another attempt should be made after attempt no. of failed attempts"""
+
+    @abstractmethod
+    def delay(self, attempt: int) -> float:
+        """jittered seconds to wait before making the next attempt"""
+
+    @abstractmethod
+    def cooldown(self, attempts: int) -> timedelta:
+        """time to wait before a failure with total attempts is eligible in a later run"""
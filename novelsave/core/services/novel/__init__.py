@@ -1,2 +1,5 @@
+from .base_asset_downloader import BaseAssetDownloader
 from .base_asset_service import BaseAssetService
+from .base_chapter_writer import BaseChapterWriter
+from .base_failure_service import BaseFailureService
 from .base_novel_service import BaseNovelService
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Tuple
+
+from novelsave.core.entities.novel import Novel, Asset
+from novelsave.exceptions import AssetDownloadFailedException
+
+
+class BaseAssetDownloader(ABC):
+    @abstractmethod
+    def download(
+        self, novel: Novel, assets: List[Asset]
+    ) -> Iterator[Tuple[Asset, Optional[AssetDownloadFailedException]]]:
+        """download the assets concurrently and persist the paths of those downloaded
+
+        yields each asset once its download finishes, along with the exception if it failed.
+        """
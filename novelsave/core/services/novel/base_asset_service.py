@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from novelsave.core.dtos import ChapterDTO
 from novelsave.core.entities.novel import Novel, Asset
@@ -18,10 +18,27 @@ class BaseAssetService(ABC):
     def update_asset_path(self, asset: Asset):
         """update the file path of the asset"""
 
+    @abstractmethod
+    def update_asset_paths(self, paths: Dict[int, str]):
+        """update the file paths of many assets, mapped by their id, in a single transaction"""
+
     @abstractmethod
     def delete_assets_of_novel(self, novel: Novel):
         """delete all assets that are associated with from database"""
 
+    @abstractmethod
+    def extract_assets(self, chapter: ChapterDTO) -> Tuple[str, List[Asset]]:
+        """identify the assets in chapter html and replace their links with positional markers
+
+        does not access the database, hence is safe to call from any thread.
+
+        :returns: the modified html and the identified assets in the order of their markers
+        """
+
+    @abstractmethod
+    def register_assets(self, novel: Novel, html: str, assets: List[Asset]) -> str:
+        """add the extracted assets to database and replace positional markers with asset markers"""
+
     @abstractmethod
     def collect_assets(self, novel: Novel, chapter: ChapterDTO) -> str:
         """collect and modify the provided the html for asset injection"""
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from novelsave.core.dtos import ChapterDTO
+from novelsave.core.entities.novel import Asset
+from novelsave.exceptions import ContentUpdateFailedException
+
+
+class BaseChapterWriter(ABC):
+    @abstractmethod
+    def start(self):
+        """start persisting the chapters that are put into the writer"""
+
+    @abstractmethod
+    def put(self, chapter_dto: ChapterDTO, assets: Optional[List[Asset]] = None):
+        """queue a downloaded chapter to be persisted
+
+        :param assets: assets already extracted from the chapter content,
+            otherwise they are collected by the writer
+        """
+
+    @abstractmethod
+    def put_failure(self, exception: ContentUpdateFailedException):
+        """queue a failed chapter download to be journaled"""
+
+    @abstractmethod
+    def close(self):
+        """persist everything that is still queued and stop the writer"""
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
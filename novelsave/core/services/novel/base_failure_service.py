@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from novelsave.core.dtos import ChapterDTO
+from novelsave.core.entities.novel import Novel, ChapterFailure
+
+
+class BaseFailureService(ABC):
+    @abstractmethod
+    def get_failures(self, novel: Novel) -> List[ChapterFailure]:
+        """retrieve the journaled download failures of the novel's chapters"""
+
+    @abstractmethod
+    def record_failure(
+        self,
+        chapter_dto: ChapterDTO,
+        exception: Exception,
+        attempts: int,
+        commit: bool = True,
+    ) -> Optional[ChapterFailure]:
+        """journal a failed chapter download and schedule when it may be retried
+
+        :param commit: whether to commit the failure, otherwise the caller commits it
+        :returns: the failure, or none if the chapter does not exist
+        """
+
+    @abstractmethod
+    def clear_failures(self, chapter_dtos: List[ChapterDTO], commit: bool = True):
+        """remove journaled failures of chapters that have since been downloaded
+
+        :param commit: whether to commit the removal, otherwise the caller commits it
+        """
@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Iterator, Tuple
 
-from novelsave.core.dtos import NovelDTO, ChapterDTO, MetaDataDTO, VolumeDTO
+from sqlalchemy.engine import Row
+
+from novelsave.core.dtos import (
+    NovelDTO,
+    ChapterDTO,
+    ChapterCountsDTO,
+    MetaDataDTO,
+    VolumeDTO,
+)
 from novelsave.core.entities.novel import Novel, Chapter, Volume, MetaData, NovelUrl
 
 
@@ -19,6 +27,10 @@ class BaseNovelService(ABC):
     def get_novel_by_url(self, url: str) -> Optional[Novel]:
         """retrieve novel by url, if novel doesn't exist return none"""
 
+    @abstractmethod
+    def get_novel_listing(self) -> List[Row]:
+        """id, title, last_updated and primary url of every novel, ordered by id"""
+
     @abstractmethod
     def get_primary_url(self, novel: Novel) -> str:
         """retrieve the primary url corresponding to the novel"""
@@ -32,16 +44,32 @@ class BaseNovelService(ABC):
         """retrieve all chapters of the novel"""
 
     @abstractmethod
-    def get_pending_chapters(self, novel: Novel, limit: int) -> List[Chapter]:
-        """retrieve all pending chapters of the novel. a chapter is assumed to be pending if it has no content."""
+    def get_chapter_counts(self, novel: Novel) -> ChapterCountsDTO:
+        """no. of chapters of the novel, along with those downloaded and those that failed to be"""
+
+    @abstractmethod
+    def get_pending_chapters(
+        self, novel: Novel, limit: int, include_failed: bool = False
+    ) -> List[Chapter]:
+        """retrieve all pending chapters of the novel. a chapter is assumed to be pending if it has no content.
+
+        chapters whose journaled failure is permanent or not yet eligible for retry are skipped,
+        unless include_failed is specified.
+        """
 
     @abstractmethod
     def get_volumes(self, novel: Novel) -> List[Volume]:
         """retrieve all the volumes of the novel"""
 
     @abstractmethod
-    def get_volumes_with_chapters(self, novel: Novel) -> Dict[Volume, List[Chapter]]:
-        """retrieve all volumes along with their corresponding chapters that have content"""
+    def iter_chapters(
+        self, novel: Novel, batch_size: int = 100
+    ) -> Iterator[Tuple[Volume, Chapter]]:
+        """chapters that have content along with their volumes, in order of volume and chapter index
+
+        chapters are loaded from the database in batches of batch size as they are iterated,
+        so that the whole novel does not need to be held in memory.
+        """
 
     @abstractmethod
     def get_metadata(self, novel: Novel) -> List[MetaData]:
@@ -76,8 +104,21 @@ class BaseNovelService(ABC):
         """update and replace existing metadata"""
 
     @abstractmethod
-    def update_content(self, chapter_dto: ChapterDTO):
-        """update an existing chapter's content"""
+    def update_content(self, chapter_dto: ChapterDTO, novel: Optional[Novel] = None):
+        """update an existing chapter's content
+
+        content is compressed with the dictionary of the novel if provided.
+        """
+
+    @abstractmethod
+    def update_contents(
+        self, chapter_dtos: List[ChapterDTO], novel: Optional[Novel] = None
+    ):
+        """update the content of existing chapters in a single transaction
+
+        content is compressed with the dictionary of the novel if provided,
+        which is trained from the chapters if the novel does not have one yet.
+        """
 
     @abstractmethod
     def add_url(self, novel: Novel, url: str):
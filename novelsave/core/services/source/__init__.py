@@ -1,3 +1,4 @@
+from .base_async_source_gateway import BaseAsyncSourceGateway
 from .base_meta_source_gateway import BaseMetaSourceGateway
 from .base_source_gateway import BaseSourceGateway
 from .base_source_service import BaseSourceService
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+from novelsave.core import dtos
+
+
+class BaseAsyncSourceGateway(ABC):
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """name of the corresponding source"""
+
+    @abstractmethod
+    async def update_chapter_content(self, chapter: dtos.ChapterDTO) -> dtos.ChapterDTO:
+        """update a chapter's content by following its url, without blocking the event loop"""
+
+    @abstractmethod
+    async def close(self):
+        """release the connections held by the gateway"""
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from novelsave.core import dtos
+from novelsave.core.services.network import BaseCircuitBreaker
 
 
 class BaseSourceGateway(ABC):
@@ -10,6 +11,11 @@ class BaseSourceGateway(ABC):
     def name(self) -> str:
         """name of the corresponding source"""
 
+    @property
+    @abstractmethod
+    def circuit_breaker(self) -> Optional[BaseCircuitBreaker]:
+        """circuit breaker guarding the requests to the source, if any"""
+
     @property
     @abstractmethod
     def base_url(self) -> str:
@@ -44,3 +50,7 @@ class BaseSourceGateway(ABC):
     @abstractmethod
     def use_cookies_from_browser(self, browser: str):
         """take the cookies from the browser and add them to following requests"""
+
+    @abstractmethod
+    def discard_refused_cookies(self, exception: Exception):
+        """forget the cached browser cookies in use if the exception shows they were refused"""
@@ -22,6 +22,23 @@ class CookieBrowserNotSupportedException(NSException):
 class ContentUpdateFailedException(NSException):
     chapter: ChapterDTO
     exception: Exception
+    attempts: int = 1
+
+
+@dataclass
+class AssetDownloadFailedException(NSException):
+    """asset could not be downloaded"""
+
+    url: str
+    reason: str
+
+
+@dataclass
+class CircuitOpenException(NSException):
+    """requests to the source are refused while it is considered unavailable"""
+
+    source: str
+    retry_in: float
 
 
 @dataclass
@@ -1,7 +1,12 @@
+import re
+import sqlite3
 from pathlib import Path
+from typing import Optional, Set
 
-from alembic.command import upgrade
-from alembic.config import Config
+VERSIONS_DIR = Path(__file__).parent / "versions"
+
+REVISION_PATTERN = re.compile(r"^(down_revision|revision)\s*=\s*(.+)$", re.MULTILINE)
+IDENTIFIER_PATTERN = re.compile(r"[\"']([0-9a-zA-Z_]+)[\"']")
 
 
 def make_config(dir_: Path, url_: str, config_="alembic.ini"):
@@ -11,6 +16,8 @@ def make_config(dir_: Path, url_: str, config_="alembic.ini"):
     :param config_: config
     :return:
     """
+    from alembic.config import Config
+
     # retrieves config file path
     config_file = dir_ / config_
 
@@ -23,7 +30,51 @@ def make_config(dir_: Path, url_: str, config_="alembic.ini"):
     return config
 
 
+def head_revisions() -> Set[str]:
+    """revisions of the packaged migration scripts that no other revision follows
+
+    the scripts are read as text, which is far cheaper than loading them with alembic.
+    """
+    revisions, parents = set(), set()
+    for file in VERSIONS_DIR.glob("*.py"):
+        for name, value in REVISION_PATTERN.findall(file.read_text(encoding="utf-8")):
+            identifiers = IDENTIFIER_PATTERN.findall(value)
+            if name == "revision":
+                revisions.update(identifiers)
+            else:
+                parents.update(identifiers)
+
+    return revisions - parents
+
+
+def current_revisions(url: str) -> Optional[Set[str]]:
+    """revisions stored in the sqlite database, none if they cannot be read cheaply"""
+    prefix = "sqlite:///"
+    if not url.startswith(prefix) or not Path(url[len(prefix) :]).is_file():
+        return None
+
+    try:
+        connection = sqlite3.connect(url[len(prefix) :])
+        try:
+            rows = connection.execute("SELECT version_num FROM alembic_version")
+            return {row[0] for row in rows}
+        finally:
+            connection.close()
+    except sqlite3.Error:
+        return None
+
+
+def is_up_to_date(url: str) -> bool:
+    return current_revisions(url) == head_revisions()
+
+
 def migrate(url: str):
+    # alembic takes a while to import and load the scripts, only needed when behind
+    if is_up_to_date(url):
+        return
+
+    from alembic.command import upgrade
+
     config = make_config(Path(__file__).parent, url, "alembic.ini")
 
     # upgrade the database to the latest revision
@@ -0,0 +1,40 @@
+"""chapter failures
+
+Revision ID: 0f47c495be4b
+Revises: e5c4fb5600ea
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0f47c495be4b"
+down_revision = "e5c4fb5600ea"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "chapter_failures",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("is_permanent", sa.Boolean(), nullable=False),
+        sa.Column("reason", sa.String(), nullable=True),
+        sa.Column("retry_after", sa.TIMESTAMP(), nullable=True),
+        sa.Column("chapter_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "last_updated",
+            sa.TIMESTAMP(),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["chapter_id"], ["chapters.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("chapter_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("chapter_failures")
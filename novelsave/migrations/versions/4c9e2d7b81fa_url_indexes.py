@@ -0,0 +1,24 @@
+"""url indexes
+
+Revision ID: 4c9e2d7b81fa
+Revises: b3e8f1a2c7d4
+Create Date: 2026-10-18 16:02:44.180356
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4c9e2d7b81fa"
+down_revision = "b3e8f1a2c7d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f("ix_chapters_url"), "chapters", ["url"], unique=False)
+    op.create_index(op.f("ix_novel_urls_url"), "novel_urls", ["url"], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_novel_urls_url"), table_name="novel_urls")
+    op.drop_index(op.f("ix_chapters_url"), table_name="chapters")
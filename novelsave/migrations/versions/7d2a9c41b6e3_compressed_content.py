@@ -0,0 +1,143 @@
+"""compressed content
+
+Revision ID: 7d2a9c41b6e3
+Revises: 0f47c495be4b
+Create Date: 2026-10-18 14:05:27.519830
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from novelsave.utils.helpers import compression_helper
+
+# revision identifiers, used by Alembic.
+revision = "7d2a9c41b6e3"
+down_revision = "0f47c495be4b"
+branch_labels = None
+depends_on = None
+
+# chapters rewritten at a time, bounds the content held in memory
+BATCH_SIZE = 500
+DICTIONARY_SAMPLES = 8
+
+novels = sa.table("novels", sa.column("id", sa.Integer))
+volumes = sa.table(
+    "volumes", sa.column("id", sa.Integer), sa.column("novel_id", sa.Integer)
+)
+chapters = sa.table(
+    "chapters",
+    sa.column("id", sa.Integer),
+    sa.column("volume_id", sa.Integer),
+    sa.column("content", sa.String),
+)
+
+
+def content_dictionaries_table():
+    return op.create_table(
+        "content_dictionaries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("codec", sa.String(), nullable=False),
+        sa.Column("digest", sa.LargeBinary(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("novel_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["novel_id"], ["novels.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("digest"),
+        sa.UniqueConstraint("novel_id"),
+    )
+
+
+def rewrite_contents(novel_id: int, stored_type: str, convert):
+    """pass the content of the novel's chapters stored as the sqlite type through convert, in batches"""
+    connection = op.get_bind()
+    stmt = (
+        sa.select(chapters.c.id, chapters.c.content)
+        .join(volumes, volumes.c.id == chapters.c.volume_id)
+        .where(
+            (volumes.c.novel_id == novel_id)
+            & (sa.func.typeof(chapters.c.content) == stored_type)
+        )
+        .order_by(chapters.c.id)
+        .limit(BATCH_SIZE)
+    )
+    update = (
+        chapters.update()
+        .where(chapters.c.id == sa.bindparam("_id"))
+        .values(content=sa.bindparam("_content"))
+    )
+
+    last_id = 0
+    while True:
+        rows = connection.execute(stmt.where(chapters.c.id > last_id)).all()
+        if not rows:
+            break
+
+        connection.execute(
+            update, [{"_id": id_, "_content": convert(c)} for id_, c in rows]
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    content_dictionaries = content_dictionaries_table()
+    connection = op.get_bind()
+
+    for (novel_id,) in connection.execute(sa.select(novels.c.id)).all():
+        samples = connection.execute(
+            sa.select(chapters.c.content)
+            .join(volumes, volumes.c.id == chapters.c.volume_id)
+            .where(
+                (volumes.c.novel_id == novel_id)
+                & (sa.func.typeof(chapters.c.content) == "text")
+            )
+            .order_by(chapters.c.id)
+            .limit(DICTIONARY_SAMPLES)
+        ).scalars()
+        samples = [s for s in samples if s]
+
+        dictionary = None
+        if len(samples) >= DICTIONARY_SAMPLES:
+            dictionary = compression_helper.train_dictionary(
+                samples, compression_helper.ZLIB
+            )
+            connection.execute(
+                content_dictionaries.insert().values(
+                    novel_id=novel_id,
+                    codec=compression_helper.ZLIB,
+                    digest=compression_helper.digest(dictionary),
+                    data=dictionary,
+                )
+            )
+
+        rewrite_contents(
+            novel_id,
+            "text",
+            lambda c: compression_helper.compress(
+                c, compression_helper.ZLIB, dictionary
+            ),
+        )
+
+
+def downgrade():
+    connection = op.get_bind()
+    content_dictionaries = sa.table(
+        "content_dictionaries",
+        sa.column("digest", sa.LargeBinary),
+        sa.column("data", sa.LargeBinary),
+    )
+
+    def load_dictionary(digest: bytes):
+        return connection.execute(
+            sa.select(content_dictionaries.c.data).where(
+                content_dictionaries.c.digest == digest
+            )
+        ).scalar()
+
+    for (novel_id,) in connection.execute(sa.select(novels.c.id)).all():
+        rewrite_contents(
+            novel_id,
+            "blob",
+            lambda c: compression_helper.decompress(c, load_dictionary),
+        )
+
+    op.drop_table("content_dictionaries")
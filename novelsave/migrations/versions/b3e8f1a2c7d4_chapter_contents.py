@@ -0,0 +1,51 @@
+"""chapter contents
+
+Revision ID: b3e8f1a2c7d4
+Revises: 7d2a9c41b6e3
+Create Date: 2026-10-18 15:21:08.642197
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b3e8f1a2c7d4"
+down_revision = "7d2a9c41b6e3"
+branch_labels = None
+depends_on = None
+
+# sqlite drops columns in place from this version on
+DROP_COLUMN_VERSION = (3, 35, 0)
+
+
+def upgrade():
+    op.create_table(
+        "chapter_contents",
+        sa.Column("chapter_id", sa.Integer(), nullable=False),
+        sa.Column("content", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(["chapter_id"], ["chapters.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("chapter_id"),
+    )
+    op.execute(
+        "INSERT INTO chapter_contents (chapter_id, content) "
+        "SELECT id, content FROM chapters WHERE content IS NOT NULL"
+    )
+
+    # recreating the chapters table instead would cascade the deletes of its
+    # rows to the tables referencing it, so older versions keep the column empty.
+    if op.get_bind().dialect.server_version_info >= DROP_COLUMN_VERSION:
+        op.drop_column("chapters", "content")
+    else:
+        op.execute("UPDATE chapters SET content = NULL")
+
+
+def downgrade():
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("chapters")}
+    if "content" not in columns:
+        op.add_column("chapters", sa.Column("content", sa.String(), nullable=True))
+
+    op.execute(
+        "UPDATE chapters SET content = ("
+        "SELECT content FROM chapter_contents WHERE chapter_id = chapters.id)"
+    )
+    op.drop_table("chapter_contents")
@@ -1,7 +1,35 @@
-from .file_service import FileService
-from .meta_service import MetaService
-from .novel import NovelService, AssetService
-from .path_service import PathService
-from .tools import (
-    CalibreService,
+from typing import TYPE_CHECKING
+
+from novelsave.utils.helpers import import_helper
+
+if TYPE_CHECKING:
+    from .file_service import FileService
+    from .meta_service import MetaService
+    from .novel import (
+        NovelService,
+        AssetService,
+        AssetDownloader,
+        FailureService,
+        ChapterWriter,
+    )
+    from .path_service import PathService
+    from .tools import CalibreService
+    from .version_cache import VersionCache
+
+__getattr__ = import_helper.lazy_exports(
+    __name__,
+    {
+        ".file_service": ["FileService"],
+        ".meta_service": ["MetaService"],
+        ".novel": [
+            "NovelService",
+            "AssetService",
+            "AssetDownloader",
+            "FailureService",
+            "ChapterWriter",
+        ],
+        ".path_service": ["PathService"],
+        ".tools": ["CalibreService"],
+        ".version_cache": ["VersionCache"],
+    },
 )
@@ -1,4 +1,7 @@
+import os
+import tempfile
 from pathlib import Path
+from typing import Iterable
 
 from novelsave.core.services import BaseFileService
 
@@ -14,6 +17,24 @@ class FileService(BaseFileService):
         with path.open("wb") as file:
             file.write(data)
 
+    def write_chunks(self, path: Path, chunks: Iterable[bytes]) -> int:
+        """write and replace bytes to a file as they arrive, the file is only replaced once all chunks are written"""
+        # temporary file is placed alongside so that the rename stays within the filesystem
+        fd, temp = tempfile.mkstemp(prefix=path.name, suffix=".part", dir=path.parent)
+        try:
+            size = 0
+            with os.fdopen(fd, "wb") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+                    size += len(chunk)
+
+            os.replace(temp, path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+        return size
+
     def read_str(self, path: Path) -> str:
         """read strings from a file"""
         with path.open("r") as file:
@@ -5,12 +5,15 @@ from novelsave.core.services import BaseMetaService
 
 
 class MetaService(BaseMetaService):
+    def __init__(self, http_session: requests.Session):
+        self.http_session = http_session
+
     @property
     def current_version(self) -> str:
         return __version__
 
     def get_latest_version(self) -> str:
-        response = requests.get("https://pypi.org/pypi/novelsave/json")
+        response = self.http_session.get("https://pypi.org/pypi/novelsave/json")
         if not response.ok:
             raise ConnectionError(
                 f"Response received was not valid: GET {response.url} {response.status_code}"
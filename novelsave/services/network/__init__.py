@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from novelsave.utils.helpers import import_helper
+
+if TYPE_CHECKING:
+    from .circuit_breaker import CircuitBreaker
+    from .concurrency_controller import ConcurrencyController
+    from .concurrency_store import ConcurrencyStore
+    from .cookie_cache import CookieCache
+    from .http_session import HttpSession
+    from .rate_limiter import RateLimiter, TokenBucket
+    from .response_cache import ResponseCache
+    from .retry_policy import RetryPolicy
+
+__getattr__ = import_helper.lazy_exports(
+    __name__,
+    {
+        ".circuit_breaker": ["CircuitBreaker"],
+        ".concurrency_controller": ["ConcurrencyController"],
+        ".concurrency_store": ["ConcurrencyStore"],
+        ".cookie_cache": ["CookieCache"],
+        ".http_session": ["HttpSession"],
+        ".rate_limiter": ["RateLimiter", "TokenBucket"],
+        ".response_cache": ["ResponseCache"],
+        ".retry_policy": ["RetryPolicy"],
+    },
+)
@@ -0,0 +1,112 @@
+import threading
+import time
+from typing import Callable
+
+import requests
+from loguru import logger
+
+from novelsave.core.services.network import BaseCircuitBreaker
+from novelsave.exceptions import CircuitOpenException
+from .retry_policy import RetryPolicy
+
+
+class CircuitBreaker(BaseCircuitBreaker):
+    """Stops requests to a source after consecutive failures that suggest an outage
+
+    The circuit opens after threshold consecutive connection errors, timeouts
+    or 5xx responses, after which requests are refused until cooldown seconds
+    have passed. A single probe request is then permitted, which closes the
+    circuit when it succeeds or opens it again otherwise.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: int,
+        cooldown: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param threshold: consecutive failures that open the circuit, 0 or less disables the breaker
+        """
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.clock = clock
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._retry_in() <= 0:
+                return self.HALF_OPEN
+
+            return self._state
+
+    def _retry_in(self) -> float:
+        return self._opened_at + self.cooldown - self.clock()
+
+    @staticmethod
+    def is_outage(exception: Exception) -> bool:
+        status_code = RetryPolicy.status_code(exception)
+        if status_code is not None:
+            return status_code >= 500
+
+        return isinstance(
+            exception,
+            (requests.Timeout, requests.ConnectionError, ConnectionError, TimeoutError),
+        )
+
+    def check(self):
+        with self._lock:
+            retry_in = self._retry_in()
+            if (self._state == self.OPEN and retry_in > 0) or (
+                self._state == self.HALF_OPEN
+            ):
+                raise CircuitOpenException(self.name, max(retry_in, 0.0))
+
+    def before_request(self):
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+
+            retry_in = self._retry_in()
+            if self._state == self.OPEN and retry_in <= 0:
+                # this request probes whether the source has recovered
+                self._state = self.HALF_OPEN
+                logger.debug(f"Probing {self.name} after its circuit cooled down.")
+                return
+
+            raise CircuitOpenException(self.name, max(retry_in, 0.0))
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            if self._state != self.CLOSED:
+                logger.info(f"Closed circuit of {self.name} as it responds again.")
+                self._state = self.CLOSED
+
+    def record_failure(self, exception: Exception):
+        if not self.is_outage(exception):
+            # the source responded, even if the request itself failed
+            self.record_success()
+            return
+
+        with self._lock:
+            self._failures += 1
+            if self.threshold <= 0:
+                return
+
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = self.clock()
+                logger.warning(
+                    f"Opened circuit of {self.name} after {self._failures} consecutive failures, "
+                    f"requests are refused for {self.cooldown:.0f}s."
+                )
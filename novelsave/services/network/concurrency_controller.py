@@ -0,0 +1,98 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from loguru import logger
+
+from novelsave.core.services.network import BaseConcurrencyController
+
+
+class ConcurrencyController(BaseConcurrencyController):
+    """Tunes the concurrent requests made to a source with additive increase, multiplicative decrease
+
+    Completed requests are evaluated in rounds of as many requests as the
+    current limit. The limit is halved as soon as a request reports congestion,
+    reduced by a quarter after a round whose mean latency exceeds twice the
+    lowest mean seen, and otherwise raised by one after a round whose
+    throughput improved on the previous round by more than the noise margin.
+    """
+
+    decrease = 0.5
+    latency_decrease = 0.75
+    latency_spike = 2.0
+    improvement = 1.05
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum, self.minimum)
+        self.clock = clock
+
+        self._limit = self._clamp(initial)
+        self._lock = threading.Lock()
+
+        self._min_latency: Optional[float] = None
+        self._throughput: Optional[float] = None
+        self._reset_round()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def _clamp(self, limit: int) -> int:
+        return min(max(limit, self.minimum), self.maximum)
+
+    def _reset_round(self):
+        self._round_start = self.clock()
+        self._samples = 0
+        self._latency_sum = 0.0
+        self._decreased = False
+
+    def _set_limit(self, limit: int, reason: str):
+        limit = self._clamp(limit)
+        if limit != self._limit:
+            logger.debug(
+                f"Concurrency changed from {self._limit} to {limit} ({reason})."
+            )
+            self._limit = limit
+
+    def record(self, latency: float, congested: bool):
+        with self._lock:
+            self._samples += 1
+            self._latency_sum += latency
+
+            if congested and not self._decreased:
+                # a single decrease per round, the requests in flight likely failed together
+                self._set_limit(int(self._limit * self.decrease), "congestion")
+                self._decreased = True
+
+            if self._samples < self._limit:
+                return
+
+            elapsed = self.clock() - self._round_start
+            mean_latency = self._latency_sum / self._samples
+            throughput = self._samples / elapsed if elapsed > 0 else float("inf")
+
+            if not self._decreased:
+                if (
+                    self._min_latency is not None
+                    and mean_latency > self.latency_spike * self._min_latency
+                ):
+                    self._set_limit(
+                        int(self._limit * self.latency_decrease), "latency spike"
+                    )
+                elif (
+                    self._throughput is None
+                    or throughput > self.improvement * self._throughput
+                ):
+                    self._set_limit(self._limit + 1, "throughput improved")
+
+            if self._min_latency is None or mean_latency < self._min_latency:
+                self._min_latency = mean_latency
+            self._throughput = throughput
+            self._reset_round()
@@ -0,0 +1,46 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+from novelsave.core.services.network import BaseConcurrencyStore
+
+
+class ConcurrencyStore(BaseConcurrencyStore):
+    """Remembers the concurrency level settled on for each source in a json file"""
+
+    def __init__(self, file: Path):
+        self.file = Path(file)
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, int]:
+        try:
+            with self.file.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.debug(f"Ignored malformed concurrency levels: {self.file}.")
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def get(self, source: str) -> Optional[int]:
+        with self._lock:
+            limit = self._read().get(source)
+
+        return limit if isinstance(limit, int) else None
+
+    def put(self, source: str, limit: int):
+        with self._lock:
+            data = self._read()
+            data[source] = limit
+
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.file.with_suffix(".tmp")
+            with temp.open("w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(temp, self.file)
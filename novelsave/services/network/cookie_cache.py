@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from loguru import logger
+from requests.cookies import RequestsCookieJar
+
+from novelsave.core.services.network import BaseCookieCache
+from novelsave.utils.helpers import string_helper
+
+
+class CookieCache(BaseCookieCache):
+    """Keeps the cookies extracted from a browser for each source in json files
+
+    Extracting cookies decrypts the whole cookie store of the browser, hence the
+    cookies filtered for a source are reused until ttl seconds have passed.
+    The files hold credentials, so they are only readable by the user.
+    """
+
+    def __init__(
+        self,
+        cookies_dir: Path,
+        ttl: float,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        :param ttl: seconds the cookies are reused, 0 or less disables the cache
+        """
+        self.cookies_dir = Path(cookies_dir)
+        self.ttl = ttl
+        self.clock = clock
+
+        self._lock = threading.Lock()
+
+    def _file(self, source: str, browser: str) -> Path:
+        return self.cookies_dir / f"{string_helper.slugify(source, '_')}.{browser}.json"
+
+    def get(self, source: str, browser: str) -> Optional[RequestsCookieJar]:
+        if self.ttl <= 0:
+            return None
+
+        file = self._file(source, browser)
+        with self._lock:
+            try:
+                with file.open("r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                return None
+            except ValueError:
+                logger.debug(f"Ignored malformed cookie cache: {file}.")
+                return None
+
+        now = self.clock()
+        if not isinstance(data, dict) or data.get("expires", 0) <= now:
+            return None
+
+        cookies = RequestsCookieJar()
+        for c in data.get("cookies", []):
+            # the browser may have expired some of the cookies since
+            if c.get("expires") is not None and c["expires"] <= now:
+                continue
+
+            cookies.set(
+                c["name"],
+                c["value"],
+                domain=c["domain"],
+                path=c["path"],
+                secure=c["secure"],
+                expires=c["expires"],
+            )
+
+        return cookies
+
+    def put(self, source: str, browser: str, cookies: RequestsCookieJar):
+        if self.ttl <= 0:
+            return
+
+        data = {
+            "expires": self.clock() + self.ttl,
+            "cookies": [
+                {
+                    "name": c.name,
+                    "value": c.value,
+                    "domain": c.domain,
+                    "path": c.path,
+                    "secure": c.secure,
+                    "expires": c.expires,
+                }
+                for c in cookies
+            ],
+        }
+
+        file = self._file(source, browser)
+        with self._lock:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            temp = file.with_suffix(".tmp")
+            fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp, file)
+
+    def invalidate(self, source: str, browser: str):
+        with self._lock:
+            try:
+                self._file(source, browser).unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,50 @@
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from novelsave.core.services.network import BaseResponseCache
+
+
+class HttpSession(requests.Session):
+    """Pooled session that applies a default timeout to every request
+
+    Shared by the network calls that are not made through sources,
+    so that connections to the same host are kept alive and reused.
+    Plain GET requests are answered through the response cache when provided,
+    except streamed ones whose body is left for the caller to consume.
+    """
+
+    def __init__(
+        self,
+        pool_size: int,
+        timeout: float,
+        response_cache: Optional[BaseResponseCache] = None,
+    ):
+        super(HttpSession, self).__init__()
+        self.timeout = timeout
+        self.response_cache = response_cache
+
+        adapter = HTTPAdapter(pool_maxsize=max(pool_size, 1))
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+
+        if (
+            self.response_cache is None
+            or method.upper() != "GET"
+            or args
+            or kwargs.get("params")
+            or kwargs.get("stream")
+        ):
+            return super(HttpSession, self).request(method, url, *args, **kwargs)
+
+        headers = kwargs.pop("headers", None) or {}
+        return self.response_cache.fetch(
+            url,
+            lambda conditional: super(HttpSession, self).request(
+                method, url, headers={**headers, **conditional}, **kwargs
+            ),
+        )
@@ -0,0 +1,83 @@
+import threading
+import time
+from typing import Callable, Dict
+from urllib.parse import urlparse
+
+from novelsave.core.services.network import BaseRateLimiter
+
+
+class TokenBucket:
+    """Thread-safe token bucket that refills at a constant rate up to its capacity
+
+    Tokens are reserved rather than awaited under the lock, the balance may go
+    negative, in which case the caller is told how long to wait. This keeps the
+    critical section short and serves concurrent callers in arrival order.
+    """
+
+    def __init__(
+        self, rate: float, capacity: int, clock: Callable[[], float] = time.monotonic
+    ):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.clock = clock
+
+        self.tokens = float(self.capacity)
+        self.timestamp = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """reserve a single token
+
+        :returns: seconds to wait before the reserved token may be used
+        """
+        with self.lock:
+            now = self.clock()
+            elapsed = now - self.timestamp
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.timestamp = now
+
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+
+            return -self.tokens / self.rate
+
+
+class RateLimiter(BaseRateLimiter):
+    def __init__(self, rate: float, burst: int):
+        """
+        :param rate: sustained requests per second allowed for each host, 0 or less disables throttling
+        :param burst: maximum requests that may be made at once to each host
+        """
+        self.rate = rate
+        self.burst = burst
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.rate is not None and self.rate > 0
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            try:
+                return self._buckets[host]
+            except KeyError:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[host] = bucket
+                return bucket
+
+    def reserve(self, url: str) -> float:
+        if not self.is_enabled:
+            return 0.0
+
+        return self.bucket(url).reserve()
+
+    def acquire(self, url: str) -> float:
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import requests
+from loguru import logger
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from novelsave.core.services.network import BaseResponseCache
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    digest: str
+    headers: Dict[str, str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires: Optional[float]
+    content: bytes
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.content
+        response._content_consumed = True
+
+        return response
+
+
+class ResponseCache(BaseResponseCache):
+    """Content addressed cache of http responses stored on disk
+
+    Bodies are stored once per digest of their content, while an index maps
+    each url to its body along with the validators (ETag, Last-Modified) used
+    to revalidate it. Least recently used entries are evicted once the bodies
+    exceed max size.
+    """
+
+    # responses are replayed with their decoded content, hence these no longer apply
+    excluded_headers = {
+        "connection",
+        "content-encoding",
+        "content-length",
+        "set-cookie",
+        "transfer-encoding",
+    }
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size: int,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.cache_dir = cache_dir / "http"
+        self.max_size = max_size
+        self.clock = clock
+
+        # a single response may not take up more than a portion of the cache
+        self.max_entry_size = max_size // 8
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.max_size > 0
+
+    def _db(self) -> sqlite3.Connection:
+        """lazily open the index, so that nothing is created until the cache is used"""
+        if self._connection is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                str(self.cache_dir / "index.sqlite"),
+                timeout=30,
+                check_same_thread=False,
+            )
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "url TEXT PRIMARY KEY, digest TEXT NOT NULL, size INTEGER NOT NULL, "
+                    "headers TEXT NOT NULL, etag TEXT, last_modified TEXT, "
+                    "expires REAL, accessed REAL NOT NULL)"
+                )
+                self._connection.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_responses_accessed ON responses (accessed)"
+                )
+
+        return self._connection
+
+    def _object_path(self, digest: str) -> Path:
+        return self.cache_dir / "objects" / digest[:2] / digest
+
+    @staticmethod
+    def _cache_control(headers) -> Dict[str, Optional[str]]:
+        directives = {}
+        for directive in headers.get("Cache-Control", "").split(","):
+            key, _, value = directive.strip().partition("=")
+            if key:
+                directives[key.lower()] = value.strip('"') or None
+
+        return directives
+
+    def _expires(self, headers) -> Optional[float]:
+        cache_control = self._cache_control(headers)
+        if "no-cache" in cache_control:
+            return None
+
+        try:
+            return self.clock() + int(cache_control["max-age"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _lookup(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = (
+                self._db()
+                .execute(
+                    "SELECT digest, headers, etag, last_modified, expires "
+                    "FROM responses WHERE url = ?",
+                    (url,),
+                )
+                .fetchone()
+            )
+
+        if row is None:
+            return None
+
+        digest, headers, etag, last_modified, expires = row
+        try:
+            content = self._object_path(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+
+        return CachedResponse(
+            url, digest, json.loads(headers), etag, last_modified, expires, content
+        )
+
+    def _touch(self, url: str, expires: Optional[float]):
+        with self._lock, self._db() as db:
+            db.execute(
+                "UPDATE responses SET accessed = ?, expires = ? WHERE url = ?",
+                (self.clock(), expires, url),
+            )
+
+    def _is_cacheable(self, response: requests.Response) -> bool:
+        if response.status_code != 200:
+            return False
+
+        headers = response.headers
+        cache_control = self._cache_control(headers)
+        if "no-store" in cache_control:
+            return False
+
+        if not (
+            headers.get("ETag")
+            or headers.get("Last-Modified")
+            or self._expires(headers) is not None
+        ):
+            return False
+
+        return True
+
+    def _store(self, url: str, response: requests.Response):
+        content = response.content
+        if len(content) > self.max_entry_size:
+            return
+
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp = tempfile.mkstemp(suffix=".part", dir=path.parent)
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(temp, path)
+
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in self.excluded_headers
+        }
+
+        with self._lock, self._db() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, digest, size, headers, etag, last_modified, expires, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    digest,
+                    len(content),
+                    json.dumps(headers),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    self._expires(response.headers),
+                    self.clock(),
+                ),
+            )
+            self._evict(db)
+
+    def _evict(self, db: sqlite3.Connection):
+        """remove the least recently used entries until the bodies fit within max size"""
+        (total,) = db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT MAX(size) AS size FROM responses GROUP BY digest)"
+        ).fetchone()
+
+        while total > self.max_size:
+            rows = db.execute(
+                "SELECT url, digest, size FROM responses ORDER BY accessed LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+
+            for url, digest, size in rows:
+                db.execute("DELETE FROM responses WHERE url = ?", (url,))
+
+                # bodies are shared between urls with identical content
+                if db.execute(
+                    "SELECT 1 FROM responses WHERE digest = ?", (digest,)
+                ).fetchone():
+                    continue
+
+                self._object_path(digest).unlink(missing_ok=True)
+                total -= size
+                if total <= self.max_size:
+                    break
+
+    def fetch(
+        self, url: str, send: Callable[[Dict[str, str]], requests.Response]
+    ) -> requests.Response:
+        if not self.is_enabled:
+            return send({})
+
+        cached = self._lookup(url)
+        if cached is not None and (cached.expires or 0) > self.clock():
+            logger.debug(f"Using fresh cached response: {url}.")
+            self._touch(url, cached.expires)
+            return cached.to_response()
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = send(headers)
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"Using revalidated cached response: {url}.")
+            self._touch(url, self._expires(response.headers))
+            response.close()
+            return cached.to_response()
+
+        if self._is_cacheable(response):
+            self._store(url, response)
+
+        return response
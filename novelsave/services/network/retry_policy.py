@@ -0,0 +1,72 @@
+import random
+from datetime import timedelta
+from typing import Optional
+
+import requests
+from novelsave_sources import BadResponseException
+
+from novelsave.core.services.network import BaseRetryPolicy
+
+
+class RetryPolicy(BaseRetryPolicy):
+    # client errors that a repeated request will not resolve
+    # the rest of 4xx ask the client to slow down or try again
+    transient_client_status = {408, 425, 429}
+
+    # upper bound on the time a failure is kept from later runs
+    max_cooldown = timedelta(days=1)
+
+    def __init__(
+        self, attempts: int, backoff: float, max_backoff: float, cooldown: float
+    ):
+        """
+        :param attempts: maximum attempts made for a single request within a run
+        :param backoff: base seconds of the exponential backoff between attempts
+        :param max_backoff: maximum seconds waited between attempts
+        :param cooldown: base seconds a failed request is skipped in following runs
+        """
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.base_cooldown = cooldown
+
+    @staticmethod
+    def status_code(exception: Exception) -> Optional[int]:
+        """http status code of the response that caused the exception, if any"""
+        if isinstance(exception, BadResponseException) and exception.args:
+            return getattr(exception.args[0], "status_code", None)
+
+        response = getattr(exception, "response", None)
+        return getattr(response, "status_code", None)
+
+    def is_transient(self, exception: Exception) -> bool:
+        status_code = self.status_code(exception)
+        if status_code is not None:
+            return status_code >= 500 or status_code in self.transient_client_status
+
+        return isinstance(
+            exception,
+            (requests.Timeout, requests.ConnectionError, ConnectionError, TimeoutError),
+        )
+
+    def is_permanent(self, exception: Exception) -> bool:
+        status_code = self.status_code(exception)
+        if status_code is None:
+            return False
+
+        return 400 <= status_code < 500 and not self.is_transient(exception)
+
+    def should_retry(self, exception: Exception, attempt: int) -> bool:
+        return attempt < self.attempts and self.is_transient(exception)
+
+    def delay(self, attempt: int) -> float:
+        # full jitter, spreads out workers that failed together
+        # https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def cooldown(self, attempts: int) -> timedelta:
+        exponent = min(max(attempts - 1, 0), 16)
+        return min(
+            timedelta(seconds=self.base_cooldown * 2**exponent), self.max_cooldown
+        )
@@ -1,2 +1,21 @@
-from .asset_service import AssetService
-from .novel_service import NovelService
+from typing import TYPE_CHECKING
+
+from novelsave.utils.helpers import import_helper
+
+if TYPE_CHECKING:
+    from .asset_downloader import AssetDownloader
+    from .asset_service import AssetService
+    from .chapter_writer import ChapterWriter
+    from .failure_service import FailureService
+    from .novel_service import NovelService
+
+__getattr__ = import_helper.lazy_exports(
+    __name__,
+    {
+        ".asset_downloader": ["AssetDownloader"],
+        ".asset_service": ["AssetService"],
+        ".chapter_writer": ["ChapterWriter"],
+        ".failure_service": ["FailureService"],
+        ".novel_service": ["NovelService"],
+    },
+)
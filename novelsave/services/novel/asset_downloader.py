@@ -0,0 +1,137 @@
+import threading
+from concurrent import futures
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from novelsave.core.entities.novel import Novel, Asset
+from novelsave.core.services import (
+    BaseAssetDownloader,
+    BaseAssetService,
+    BaseFileService,
+    BasePathService,
+)
+from novelsave.exceptions import AssetDownloadFailedException
+from novelsave.utils.helpers import string_helper
+
+
+class AssetDownloader(BaseAssetDownloader):
+    """Downloads assets concurrently over the shared http session
+
+    Response bodies are streamed into a temporary file that replaces the asset
+    file once complete, hence an interrupted download never leaves a partial
+    asset behind. Paths of the downloaded assets are persisted in batches.
+    """
+
+    chunk_size = 64 * 1024
+    batch_size = 100
+
+    def __init__(
+        self,
+        asset_service: BaseAssetService,
+        path_service: BasePathService,
+        file_service: BaseFileService,
+        http_session: requests.Session,
+        connections: int,
+        host_connections: int,
+        max_size: int,
+    ):
+        self.asset_service = asset_service
+        self.path_service = path_service
+        self.file_service = file_service
+        self.http_session = http_session
+        self.connections = max(connections, 1)
+        self.host_connections = max(host_connections, 1)
+        self.max_size = max_size
+
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            try:
+                return self._host_limits[host]
+            except KeyError:
+                limit = threading.BoundedSemaphore(self.host_connections)
+                return self._host_limits.setdefault(host, limit)
+
+    def _exceeds_max_size(self, size: int) -> bool:
+        return 0 < self.max_size < size
+
+    def _limit_size(self, url: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        size = 0
+        for chunk in chunks:
+            size += len(chunk)
+            if self._exceeds_max_size(size):
+                raise AssetDownloadFailedException(
+                    url,
+                    f"exceeds maximum size of {string_helper.format_bytes(self.max_size)}",
+                )
+
+            yield chunk
+
+    def _fetch(self, url: str, file: Path) -> int:
+        with self._host_limit(url):
+            try:
+                with self.http_session.get(url, stream=True) as response:
+                    if not response.ok:
+                        raise AssetDownloadFailedException(
+                            url, f"{response.status_code} {response.reason}"
+                        )
+
+                    length = response.headers.get("Content-Length", "")
+                    if length.isdigit() and self._exceeds_max_size(int(length)):
+                        raise AssetDownloadFailedException(
+                            url,
+                            f"exceeds maximum size of {string_helper.format_bytes(self.max_size)}",
+                        )
+
+                    file.parent.mkdir(parents=True, exist_ok=True)
+                    return self.file_service.write_chunks(
+                        file,
+                        self._limit_size(url, response.iter_content(self.chunk_size)),
+                    )
+            except requests.RequestException as e:
+                raise AssetDownloadFailedException(url, f"{type(e).__name__}: {e}")
+
+    def download(
+        self, novel: Novel, assets: List[Asset]
+    ) -> Iterator[Tuple[Asset, Optional[AssetDownloadFailedException]]]:
+        # paths are resolved beforehand, the workers must not touch the database entities
+        files = {
+            asset.id: self.path_service.asset_path(novel, asset) for asset in assets
+        }
+
+        paths: Dict[int, str] = {}
+        with futures.ThreadPoolExecutor(max_workers=self.connections) as executor:
+            download_futures = {
+                executor.submit(self._fetch, asset.url, files[asset.id]): asset
+                for asset in assets
+            }
+
+            try:
+                for future in futures.as_completed(download_futures):
+                    asset = download_futures[future]
+                    try:
+                        future.result()
+                    except AssetDownloadFailedException as e:
+                        yield asset, e
+                        continue
+
+                    paths[asset.id] = str(
+                        self.path_service.relative_to_data_dir(files[asset.id])
+                    )
+                    if len(paths) >= self.batch_size:
+                        self.asset_service.update_asset_paths(paths)
+                        paths = {}
+
+                    yield asset, None
+            finally:
+                # prevents pending downloads from starting when exiting early
+                for future in download_futures:
+                    future.cancel()
+
+                self.asset_service.update_asset_paths(paths)
@@ -1,9 +1,10 @@
+import re
 from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from bs4 import BeautifulSoup
 from loguru import logger
-from sqlalchemy import update, delete
+from sqlalchemy import update, delete, select, bindparam
 from sqlalchemy.orm import Session
 
 from novelsave.core.dtos import ChapterDTO
@@ -14,6 +15,8 @@ from novelsave.utils.helpers import url_helper
 
 
 class AssetService(BaseAssetService):
+    position_marker = re.compile(r"{asset(\d+)}")
+
     def __init__(
         self,
         session: Session,
@@ -55,12 +58,34 @@ class AssetService(BaseAssetService):
         )
         self.session.commit()
 
+    def update_asset_paths(self, paths: Dict[int, str]):
+        if not paths:
+            return
+
+        # core table statement so that the parameter list is sent as a single executemany
+        table = Asset.__table__
+        self.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("_id"))
+            .values(path=bindparam("_path")),
+            [{"_id": id_, "_path": path} for id_, path in paths.items()],
+        )
+        self.session.commit()
+
     def delete_assets_of_novel(self, novel: Novel):
         self.session.execute(delete(Asset).where(Asset.novel_id == novel.id))
         self.session.commit()
 
     def update_assets(self, novel: Novel, assets: List[Asset]) -> Dict[str, Asset]:
-        indexed_assets = {a.url: a for a in novel.assets}
+        # only query the assets in question instead of loading all assets of novel
+        # this also keeps the lookup correct when assets are added by another session
+        urls = list({a.url for a in assets})
+        indexed_assets = {
+            a.url: a
+            for a in self.session.execute(
+                select(Asset).where((Asset.novel_id == novel.id) & Asset.url.in_(urls))
+            ).scalars()
+        }
         indexed_specific = {}
 
         assets_to_add = {}
@@ -68,13 +93,12 @@ class AssetService(BaseAssetService):
             try:
                 indexed_specific[asset.url] = indexed_assets[asset.url]
             except KeyError:
-                indexed_specific[asset.url] = asset
-                assets_to_add[asset.url] = asset
+                indexed_specific[asset.url] = assets_to_add.setdefault(asset.url, asset)
 
         # we only interact with the database if we have something to add
         # this is [expected] to be more performant
         if assets_to_add:
-            logger.debug(f"Adding {len(assets)} newly found assets.")
+            logger.debug(f"Adding {len(assets_to_add)} newly found assets.")
             self.session.add_all(assets_to_add.values())
             self.session.flush()
         else:
@@ -82,14 +106,14 @@ class AssetService(BaseAssetService):
 
         return indexed_specific
 
-    def collect_assets(self, novel: Novel, chapter: ChapterDTO) -> str:
-
+    def extract_assets(self, chapter: ChapterDTO) -> Tuple[str, List[Asset]]:
         # using default parser since lxml inserts <html> and <body> tags
         # those would have to be removed since the input doesnt require to have them
         # so its better to not insert them at all
         soup = BeautifulSoup(chapter.content, "html.parser")
 
         assets = []
+        positions = {}
         for img in soup.select("img"):
             src = img.get("src", default=None)
             alt = img.get("alt", default="[Unspecified]")
@@ -97,36 +121,49 @@ class AssetService(BaseAssetService):
                 continue
 
             url = url_helper.absolute_url(src, chapter.url)
-            asset = Asset(
-                name=alt,
-                url=url,
-                type_id=AssetTypes.IMAGE,
-                novel_id=novel.id,
-            )
+            if url not in positions:
+                positions[url] = len(assets)
+                assets.append(Asset(name=alt, url=url, type_id=AssetTypes.IMAGE))
 
-            assets.append(asset)
+            img["src"] = f"{{asset{positions[url]}}}"
 
         logger.debug(f"Identified {len(assets)} asset images.")
+        if not assets:
+            return chapter.content, assets
+
+        return str(soup), assets
+
+    def register_assets(self, novel: Novel, html: str, assets: List[Asset]) -> str:
         if not assets:
             logger.debug(
                 "Skipped further asset processing since no assets were identified."
             )
-            return chapter.content
+            return html
+
+        for asset in assets:
+            asset.novel_id = novel.id
 
         indexed_assets = self.update_assets(novel, assets)
-        for img in soup.select("img"):
-            src = img.get("src", default=None)
-            if not src:
-                continue
+        ids = [indexed_assets[asset.url].id for asset in assets]
 
-            url = url_helper.absolute_url(src, chapter.url)
-            img["src"] = f"{{id{indexed_assets[url].id}}}"
+        def replace(match: re.Match) -> str:
+            position = int(match.group(1))
+            if position >= len(ids):
+                return match.group(0)
+
+            return f"{{id{ids[position]}}}"
+
+        return self.position_marker.sub(replace, html)
+
+    def collect_assets(self, novel: Novel, chapter: ChapterDTO) -> str:
+        html, assets = self.extract_assets(chapter)
+        html = self.register_assets(novel, html, assets)
 
         logger.debug(
             f"Embedded asset markers into '{chapter.title}' ({chapter.index}) chapter."
         )
 
-        return str(soup)
+        return html
 
     def mapping_dict(self, path_mapping: Dict[int, str]):
         return defaultdict(
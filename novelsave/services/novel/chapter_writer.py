@@ -0,0 +1,180 @@
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Tuple, Union
+
+from loguru import logger
+from sqlalchemy.orm import scoped_session
+
+from novelsave.core.dtos import ChapterDTO
+from novelsave.core.entities.novel import Asset, Novel
+from novelsave.core.services import (
+    BaseAssetService,
+    BaseChapterWriter,
+    BaseFailureService,
+    BaseNovelService,
+)
+from novelsave.exceptions import ContentUpdateFailedException
+
+Item = Union[Tuple[ChapterDTO, Optional[List[Asset]]], ContentUpdateFailedException]
+
+
+class ChapterWriter(BaseChapterWriter):
+    """Persists downloaded chapters of a novel from a background thread
+
+    Chapters and failures are collected into batches, which are written using
+    a single executemany and commit once either batch_size chapters are collected or
+    interval seconds have passed since the first chapter of the batch.
+
+    All database access during the download happens on the writer thread,
+    which uses its own session of the scoped session.
+
+    At most two batches may be queued, after which put blocks until the
+    writer catches up. This propagates the backpressure of the database
+    to the downloads.
+    """
+
+    _stop = object()
+
+    def __init__(
+        self,
+        novel: Novel,
+        session: scoped_session,
+        novel_service: BaseNovelService,
+        asset_service: BaseAssetService,
+        failure_service: BaseFailureService,
+        batch_size: int,
+        interval: float,
+        on_written: Optional[Callable[[], None]] = None,
+    ):
+        """
+        :param on_written: called from the writer thread once a batch is committed
+        """
+        # the novel belongs to the caller's session, only its id crosses the thread
+        self.novel_id = novel.id
+        self.session = session
+        self.novel_service = novel_service
+        self.asset_service = asset_service
+        self.failure_service = failure_service
+        self.batch_size = max(batch_size, 1)
+        self.interval = interval
+        self.on_written = on_written
+
+        self.written = 0
+        self.error: Optional[BaseException] = None
+
+        self._queue: "queue.Queue[Item]" = queue.Queue(maxsize=2 * self.batch_size)
+        self._thread = threading.Thread(
+            target=self._run, name="chapter-writer", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def put(self, chapter_dto: ChapterDTO, assets: Optional[List[Asset]] = None):
+        self._put((chapter_dto, assets))
+
+    def put_failure(self, exception: ContentUpdateFailedException):
+        self._put(exception)
+
+    def _put(self, item: Item):
+        while True:
+            if self.error is not None:
+                raise self.error
+
+            try:
+                # wakes up periodically so that a failed writer does not block forever
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def close(self):
+        if self._thread.is_alive() and self.error is None:
+            try:
+                self._put(self._stop)
+            except BaseException:
+                # the writer failed meanwhile, which is raised below
+                pass
+        self._thread.join()
+
+        if self.error is not None:
+            raise self.error
+
+    def _next_batch(self) -> Tuple[List[Item], bool]:
+        """block until a batch is available
+
+        :returns: the batch and whether the writer was asked to stop
+        """
+        item = self._queue.get()
+        if item is self._stop:
+            return [], True
+
+        batch = [item]
+        deadline = time.monotonic() + self.interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if item is self._stop:
+                return batch, True
+
+            batch.append(item)
+
+        return batch, False
+
+    def _run(self):
+        try:
+            novel = self.session.get(Novel, self.novel_id)
+
+            stop = False
+            while not stop:
+                batch, stop = self._next_batch()
+                if batch:
+                    self._write(novel, batch)
+        except BaseException as e:
+            logger.exception(e)
+            self.error = e
+        finally:
+            self.session.remove()
+
+    def _write(self, novel: Novel, batch: List[Item]):
+        chapter_dtos = []
+        for item in batch:
+            if isinstance(item, ContentUpdateFailedException):
+                self.failure_service.record_failure(
+                    item.chapter, item.exception, item.attempts, commit=False
+                )
+                continue
+
+            chapter_dto, assets = item
+            if assets is None:
+                chapter_dto.content = self.asset_service.collect_assets(
+                    novel, chapter_dto
+                )
+            else:
+                # extraction already happened on the download workers
+                chapter_dto.content = self.asset_service.register_assets(
+                    novel, chapter_dto.content, assets
+                )
+
+            chapter_dtos.append(chapter_dto)
+
+        # the failures are committed along with the contents, once for the batch
+        self.failure_service.clear_failures(chapter_dtos, commit=False)
+        self.novel_service.update_contents(chapter_dtos, novel)
+        self.session.commit()
+
+        self.written += len(chapter_dtos)
+        logger.debug(
+            f"Persisted batch of {len(chapter_dtos)} chapters ({len(batch) - len(chapter_dtos)} failures)."
+        )
+
+        if self.on_written is not None:
+            self.on_written()
@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import List, Optional
+
+from loguru import logger
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from novelsave.core.dtos import ChapterDTO
+from novelsave.core.entities.novel import Novel, Chapter, ChapterFailure, Volume
+from novelsave.core.services import BaseFailureService
+from novelsave.core.services.network import BaseRetryPolicy
+
+
+class FailureService(BaseFailureService):
+    chunk_size = 500
+
+    def __init__(self, session: Session, retry_policy: BaseRetryPolicy):
+        self.session = session
+        self.retry_policy = retry_policy
+
+    def get_failures(self, novel: Novel) -> List[ChapterFailure]:
+        return (
+            self.session.execute(
+                select(ChapterFailure)
+                .join(Chapter)
+                .join(Volume)
+                .where(Volume.novel_id == novel.id)
+            )
+            .scalars()
+            .all()
+        )
+
+    def record_failure(
+        self,
+        chapter_dto: ChapterDTO,
+        exception: Exception,
+        attempts: int,
+        commit: bool = True,
+    ) -> Optional[ChapterFailure]:
+        chapter = (
+            self.session.execute(select(Chapter).where(Chapter.url == chapter_dto.url))
+            .scalars()
+            .first()
+        )
+        if chapter is None:
+            logger.debug(
+                f"Skipped journaling failure of '{chapter_dto.title}' ({chapter_dto.index}) "
+                f"as the chapter no longer exists."
+            )
+            return None
+
+        failure = chapter.failure
+        if failure is None:
+            # through the relationship, so that an uncommitted failure is found again
+            failure = ChapterFailure(chapter=chapter, attempts=0)
+            self.session.add(failure)
+
+        failure.attempts += attempts
+        failure.reason = f"{type(exception).__name__}: {exception}"[:512]
+        failure.is_permanent = self.retry_policy.is_permanent(exception)
+        if failure.is_permanent:
+            failure.retry_after = None
+        else:
+            failure.retry_after = datetime.utcnow() + self.retry_policy.cooldown(
+                failure.attempts
+            )
+
+        if commit:
+            self.session.commit()
+
+        logger.debug(
+            f"Journaled failure of '{chapter_dto.title}' ({chapter_dto.index}): "
+            f"attempts={failure.attempts}, permanent={failure.is_permanent}, retry_after={failure.retry_after}."
+        )
+        return failure
+
+    def clear_failures(self, chapter_dtos: List[ChapterDTO], commit: bool = True):
+        if not chapter_dtos:
+            return
+
+        urls = [dto.url for dto in chapter_dtos]
+
+        # chunked to stay below sqlite's bound parameter limit
+        for i in range(0, len(urls), self.chunk_size):
+            chapter_ids = select(Chapter.id).where(
+                Chapter.url.in_(urls[i : i + self.chunk_size])
+            )
+            self.session.execute(
+                delete(ChapterFailure)
+                .where(ChapterFailure.chapter_id.in_(chapter_ids))
+                .execution_options(synchronize_session=False)
+            )
+
+        if commit:
+            self.session.commit()
@@ -1,15 +1,61 @@
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Iterator, Tuple, Union
 
 from loguru import logger
-from sqlalchemy import delete, select, update
-from sqlalchemy.orm import Session
-
-from novelsave.core.dtos import NovelDTO, ChapterDTO, MetaDataDTO, VolumeDTO
-from novelsave.core.entities.novel import Novel, NovelUrl, Chapter, Volume, MetaData
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData as TableMetaData,
+    String,
+    Table,
+    case,
+    delete,
+    func,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, contains_eager
+
+from novelsave.core.dtos import (
+    NovelDTO,
+    ChapterDTO,
+    ChapterCountsDTO,
+    MetaDataDTO,
+    VolumeDTO,
+)
+from novelsave.core.entities.novel import (
+    Novel,
+    NovelUrl,
+    Chapter,
+    ChapterContent,
+    ChapterFailure,
+    ContentDictionary,
+    Volume,
+    MetaData,
+)
 from novelsave.core.services import BaseNovelService
 from novelsave.services import FileService
 from novelsave.utils.adapters import DTOAdapter
+from novelsave.utils.helpers import compression_helper
+
+# connection local table the scraped table of contents is diffed against
+scraped_chapters = Table(
+    "scraped_chapters",
+    TableMetaData(),
+    Column("url", String, primary_key=True),
+    Column("title", String, nullable=False),
+    Column("index", Integer, nullable=False),
+    Column("volume_id", Integer, nullable=False),
+)
+SCRAPED_CHAPTERS_DDL = (
+    "CREATE TEMPORARY TABLE IF NOT EXISTS scraped_chapters ("
+    'url VARCHAR PRIMARY KEY, title VARCHAR NOT NULL, "index" INTEGER NOT NULL, '
+    "volume_id INTEGER NOT NULL)"
+)
 
 
 class NovelService(BaseNovelService):
@@ -18,10 +64,18 @@ class NovelService(BaseNovelService):
         session: Session,
         dto_adapter: DTOAdapter,
         file_service: FileService,
+        compression: str = compression_helper.NONE,
+        dictionary_samples: int = 8,
     ):
+        """
+        :param compression: codec chapter content is compressed with, 'none', 'zlib' or 'zstd'
+        :param dictionary_samples: chapters written at once that a novel's dictionary is trained from
+        """
         self.session = session
         self.dto_adapter = dto_adapter
         self.file_service = file_service
+        self.compression = compression
+        self.dictionary_samples = dictionary_samples
 
     def get_all_novels(self) -> List[Novel]:
         return self.session.execute(select(Novel)).scalars().all()
@@ -35,6 +89,20 @@ class NovelService(BaseNovelService):
         sql = select(Novel).join(NovelUrl).filter(NovelUrl.url == url)
         return self.session.execute(sql).scalars().first()
 
+    def get_novel_listing(self) -> List[Row]:
+        primary_url = (
+            select(NovelUrl.url)
+            .where(NovelUrl.novel_id == Novel.id)
+            .order_by(NovelUrl.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = select(
+            Novel.id, Novel.title, Novel.last_updated, primary_url.label("url")
+        ).order_by(Novel.id)
+
+        return self.session.execute(stmt).all()
+
     def get_primary_url(self, novel: Novel) -> str:
         return self.get_urls(novel)[0].url
 
@@ -54,14 +122,48 @@ class NovelService(BaseNovelService):
             .all()
         )
 
-    def get_pending_chapters(self, novel: Novel, limit: int = -1):
+    def get_chapter_counts(self, novel: Novel) -> ChapterCountsDTO:
+        # failures of chapters that were downloaded later are left out
+        is_pending = ChapterContent.chapter_id == None  # noqa: E711
+        stmt = (
+            select(
+                func.count(Chapter.id),
+                func.count(ChapterContent.chapter_id),
+                func.count(case((is_pending, ChapterFailure.id))),
+            )
+            .join(Volume)
+            .outerjoin(ChapterContent)
+            .outerjoin(ChapterFailure)
+            .where(Volume.novel_id == novel.id)
+        )
+        total, downloaded, failed = self.session.execute(stmt).one()
+
+        return ChapterCountsDTO(total=total, downloaded=downloaded, failed=failed)
+
+    def get_pending_chapters(
+        self, novel: Novel, limit: int = -1, include_failed: bool = False
+    ):
         stmt = (
             select(Chapter)
             .join(Volume)
+            .outerjoin(ChapterContent)
             .where(
-                (Chapter.content == None) & (Volume.novel_id == novel.id)  # noqa: E711
+                (ChapterContent.chapter_id == None)  # noqa: E711
+                & (Volume.novel_id == novel.id)
             )
         )
+        if not include_failed:
+            # skip chapters that failed permanently or are still cooling down
+            stmt = stmt.outerjoin(ChapterFailure).where(
+                (ChapterFailure.id == None)  # noqa: E711
+                | (
+                    (ChapterFailure.is_permanent == False)  # noqa: E712
+                    & (
+                        (ChapterFailure.retry_after == None)  # noqa: E711
+                        | (ChapterFailure.retry_after <= datetime.utcnow())
+                    )
+                )
+            )
         if limit is not None and limit > 0:
             stmt = stmt.limit(limit)
 
@@ -70,24 +172,21 @@ class NovelService(BaseNovelService):
     def get_volumes(self, novel: Novel) -> List[Volume]:
         return novel.volumes
 
-    def get_volumes_with_chapters(self, novel: Novel) -> Dict[Volume, List[Chapter]]:
-        volumes = (
-            self.session.execute(select(Volume).where(Volume.novel_id == novel.id))
-            .scalars()
-            .all()
+    def iter_chapters(
+        self, novel: Novel, batch_size: int = 100
+    ) -> Iterator[Tuple[Volume, Chapter]]:
+        stmt = (
+            select(Volume, Chapter)
+            .join(Chapter.volume)
+            .join(Chapter.body)
+            .options(contains_eager(Chapter.body))
+            .where(Volume.novel_id == novel.id)
+            .order_by(Volume.index, Chapter.index)
+            .execution_options(yield_per=batch_size)
         )
 
-        return {
-            volume: self.session.execute(
-                select(Chapter).where(
-                    (Chapter.content != None)  # noqa: E711
-                    & (Chapter.volume_id == volume.id)
-                )
-            )
-            .scalars()
-            .all()
-            for volume in volumes
-        }
+        for volume, chapter in self.session.execute(stmt):
+            yield volume, chapter
 
     def get_metadata(self, novel: Novel) -> List[MetaData]:
         return novel.novel_metadata
@@ -135,6 +234,9 @@ class NovelService(BaseNovelService):
 
     def update_novel(self, novel: Novel, novel_dto: NovelDTO):
         self.dto_adapter.update_novel_from_dto(novel, novel_dto)
+
+        # marks the novel as updated even when none of its values changed
+        novel.last_updated = func.current_timestamp()
         self.session.commit()
 
     def set_thumbnail_asset(self, novel: Novel, r_path: Path):
@@ -150,7 +252,6 @@ class NovelService(BaseNovelService):
             .scalars()
             .all()
         )
-        chapters = self.get_chapters(novel)
         volume_mapped_chapters = self.dto_adapter.volumes_from_dto(novel, volume_dtos)
 
         indexed_volumes = {v.index: v for v in volumes}
@@ -180,42 +281,96 @@ class NovelService(BaseNovelService):
         self.session.add_all(volumes_to_add)
         self.session.flush()
 
-        # indexed by url which is unique across table
-        indexed_chapters = {c.url: c for c in chapters}
-        chapters_to_add = []
-
-        # iterate all new chapters
-        for volume, chapter_dtos in volume_mapped_chapters.items():
-            for chapter_dto in chapter_dtos:
-                chapter = self.dto_adapter.chapter_from_dto(volume, chapter_dto)
-                try:
-                    # existing chapter equivalent
-                    ece = indexed_chapters.pop(chapter.url)
-
-                    # update chapters that need to be updated
-                    if ece.volume_id != volume.id or ece.index != chapter.index:
-                        logger.debug(
-                            f"Updating '{chapter.title}': index {ece.index} -> {chapter.index}, "
-                            f"volume_id {ece.volume_id} -> {volume.id})"
-                        )
-                        self.session.execute(
-                            update(Chapter)
-                            .where(Chapter.url == chapter.url)
-                            .values(index=chapter.index, volume_id=volume.id)
-                        )
-                except KeyError:
-                    chapters_to_add.append(chapter)
+        # the scraped table of contents is staged so that it is diffed
+        # against the chapters with a few statements instead of per chapter
+        connection = self.session.connection()
+        connection.execute(text(SCRAPED_CHAPTERS_DDL))
+        connection.execute(delete(scraped_chapters))
+        staged = [
+            {
+                "url": chapter_dto.url,
+                "title": chapter_dto.title,
+                "index": chapter_dto.index,
+                "volume_id": volume.id,
+            }
+            for volume, chapter_dtos in volume_mapped_chapters.items()
+            for chapter_dto in chapter_dtos
+        ]
+        if staged:
+            # the first of chapters scraped more than once is kept
+            connection.execute(
+                insert(scraped_chapters).on_conflict_do_nothing(), staged
+            )
+
+        novel_chapters = Chapter.volume_id.in_(
+            select(Volume.id).where(Volume.novel_id == novel.id).scalar_subquery()
+        )
+        scraped = select(scraped_chapters).where(scraped_chapters.c.url == Chapter.url)
+
+        # delete chapters that dont exist anymore, first so that their
+        # positions are free for the chapters that take their place
+        deleted = connection.execute(
+            delete(Chapter)
+            .where(novel_chapters)
+            .where(Chapter.url.not_in(select(scraped_chapters.c.url)))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        logger.debug(f"Deleted {deleted} chapter rows that dont exist anymore.")
+
+        # chapters are moved out of the way of each other first, below the
+        # lowest index and apart by their ids, since a renumbering moves
+        # chapters into positions that others are yet to leave.
+        lowest_index = connection.execute(
+            select(func.min(Chapter.index)).where(novel_chapters)
+        ).scalar()
+        moved = connection.execute(
+            update(Chapter)
+            .where(novel_chapters)
+            .where(
+                scraped.where(
+                    (scraped_chapters.c.volume_id != Chapter.volume_id)
+                    | (scraped_chapters.c.index != Chapter.index)
+                ).exists()
+            )
+            .values(index=lowest_index - Chapter.id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if moved:
+            connection.execute(
+                update(Chapter)
+                .where(novel_chapters)
+                .where(Chapter.index < lowest_index)
+                .values(
+                    index=scraped.with_only_columns(
+                        scraped_chapters.c.index
+                    ).scalar_subquery(),
+                    volume_id=scraped.with_only_columns(
+                        scraped_chapters.c.volume_id
+                    ).scalar_subquery(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+        logger.debug(f"Moved {moved} chapter rows to their new positions.")
 
         # add all new chapters
-        logger.debug(f"Adding {len(chapters_to_add)} newly found chapters.")
-        self.session.add_all(chapters_to_add)
+        added = connection.execute(
+            insert(Chapter).from_select(
+                ["url", "title", "index", "volume_id"],
+                select(
+                    scraped_chapters.c.url,
+                    scraped_chapters.c.title,
+                    scraped_chapters.c.index,
+                    scraped_chapters.c.volume_id,
+                ).where(
+                    scraped_chapters.c.url.not_in(
+                        select(Chapter.url).where(novel_chapters)
+                    )
+                ),
+            )
+        ).rowcount
+        logger.debug(f"Added {added} newly found chapters.")
 
-        # delete chapters that dont exist anymore
-        logger.debug(
-            f"Deleting {len(indexed_chapters)} chapter rows that dont exist anymore."
-        )
-        for old in indexed_chapters.values():
-            self.session.delete(old)
+        connection.execute(delete(scraped_chapters))
 
         # delete volumes that dont exist anymore
         logger.debug(
@@ -261,15 +416,94 @@ class NovelService(BaseNovelService):
 
         self.session.commit()
 
-    def update_content(self, chapter_dto: ChapterDTO):
-        stmt = (
-            update(Chapter)
-            .where(Chapter.url == chapter_dto.url)
-            .values(content=chapter_dto.content)
+    def update_content(self, chapter_dto: ChapterDTO, novel: Optional[Novel] = None):
+        dictionary = self._content_dictionary(novel)
+        self._write_contents(
+            {chapter_dto.url: self._compress(chapter_dto.content, dictionary)}
+        )
+        self.session.commit()
+
+    def update_contents(
+        self, chapter_dtos: List[ChapterDTO], novel: Optional[Novel] = None
+    ):
+        if not chapter_dtos:
+            return
+
+        dictionary = self._content_dictionary(novel, chapter_dtos)
+        self._write_contents(
+            {dto.url: self._compress(dto.content, dictionary) for dto in chapter_dtos}
         )
-        self.session.execute(stmt)
         self.session.commit()
 
+    def _write_contents(self, contents: Dict[str, Optional[Union[str, bytes]]]):
+        """replace the content of the chapters with the urls, removing those without content"""
+        ids = self.session.execute(
+            select(Chapter.url, Chapter.id).where(Chapter.url.in_(contents.keys()))
+        ).all()
+
+        rows = [
+            {"chapter_id": id_, "content": contents[url]}
+            for url, id_ in ids
+            if contents[url] is not None
+        ]
+        if rows:
+            # a single executemany that inserts the content or replaces the existing one
+            stmt = insert(ChapterContent)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ChapterContent.chapter_id],
+                set_={"content": stmt.excluded.content},
+            )
+            self.session.execute(stmt, rows)
+
+        empty = [id_ for url, id_ in ids if contents[url] is None]
+        if empty:
+            self.session.execute(
+                delete(ChapterContent)
+                .where(ChapterContent.chapter_id.in_(empty))
+                .execution_options(synchronize_session="fetch")
+            )
+
+    def _compress(
+        self, content: Optional[str], dictionary: Optional[ContentDictionary]
+    ):
+        return compression_helper.compress(
+            content,
+            self.compression,
+            dictionary.data if dictionary is not None else None,
+        )
+
+    def _content_dictionary(
+        self, novel: Optional[Novel], chapter_dtos: List[ChapterDTO] = ()
+    ) -> Optional[ContentDictionary]:
+        """dictionary of the novel matching the codec, trained from the chapters when there is none"""
+        if novel is None or self.compression == compression_helper.NONE:
+            return None
+
+        dictionary = novel.content_dictionary
+        if dictionary is None:
+            samples = [dto.content for dto in chapter_dtos if dto.content]
+            if len(samples) < self.dictionary_samples:
+                return None
+
+            data = compression_helper.train_dictionary(samples, self.compression)
+            if data is None:
+                return None
+
+            dictionary = ContentDictionary(
+                novel_id=novel.id,
+                codec=self.compression,
+                digest=compression_helper.digest(data),
+                data=data,
+            )
+            self.session.add(dictionary)
+            self.session.flush()
+            logger.debug(
+                f"Trained {self.compression} dictionary of {len(data)} bytes "
+                f"for '{novel.title}' ({novel.id})."
+            )
+
+        return dictionary if dictionary.codec == self.compression else None
+
     def add_url(self, novel: Novel, url: str):
         if url in [novel_url.url for novel_url in self.get_urls(novel)]:
             raise ValueError(f"Url already exists in novel: {url}.")
@@ -297,7 +531,13 @@ class NovelService(BaseNovelService):
     def delete_content(self, novel: Novel):
         volumes = [v.id for v in self.get_volumes(novel)]
         stmt = (
-            update(Chapter).where(Chapter.volume_id.in_(volumes)).values(content=None)
+            delete(ChapterContent)
+            .where(
+                ChapterContent.chapter_id.in_(
+                    select(Chapter.id).where(Chapter.volume_id.in_(volumes))
+                )
+            )
+            .execution_options(synchronize_session="fetch")
         )
 
         self.session.execute(stmt)
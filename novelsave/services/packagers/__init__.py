@@ -1,7 +1,25 @@
-from .azw3_packager import Azw3Packager
-from .epub_packager import EpubPackager
-from .html_packager import HtmlPackager
-from .mobi_packager import MobiPackager
-from .package_provider import PackagerProvider
-from .pdf_packager import PdfPackager
-from .text_packager import TextPackager
+from typing import TYPE_CHECKING
+
+from novelsave.utils.helpers import import_helper
+
+if TYPE_CHECKING:
+    from .azw3_packager import Azw3Packager
+    from .epub_packager import EpubPackager
+    from .html_packager import HtmlPackager
+    from .mobi_packager import MobiPackager
+    from .package_provider import PackagerProvider
+    from .pdf_packager import PdfPackager
+    from .text_packager import TextPackager
+
+__getattr__ = import_helper.lazy_exports(
+    __name__,
+    {
+        ".azw3_packager": ["Azw3Packager"],
+        ".epub_packager": ["EpubPackager"],
+        ".html_packager": ["HtmlPackager"],
+        ".mobi_packager": ["MobiPackager"],
+        ".package_provider": ["PackagerProvider"],
+        ".pdf_packager": ["PdfPackager"],
+        ".text_packager": ["TextPackager"],
+    },
+)
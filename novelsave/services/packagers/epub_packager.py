@@ -42,13 +42,9 @@ class EpubPackager(BasePackager):
 
     def package(self, novel: Novel):
         urls = self.novel_service.get_urls(novel)
-        volumes = self.novel_service.get_volumes_with_chapters(novel)
-        chapter_count = len([c for cl in volumes.values() for c in cl])
         metadata = self.novel_service.get_metadata(novel)
         logger.debug(f"Preparing to package '{novel.title}' ({novel.id}) to epub.")
-        logger.debug(
-            f"Novel contains, {len(volumes)} volumes, {chapter_count} chapters, and {len(metadata)}) metadata."
-        )
+        logger.debug(f"Novel contains {len(metadata)}) metadata.")
 
         book = epub.EpubBook()
         book.set_identifier(str(novel.id))
@@ -72,15 +68,16 @@ class EpubPackager(BasePackager):
         book_preface = self.preface_html(novel, urls, metadata)
         book.add_item(book_preface)
 
+        # chapters arrive in order, only the epub pages are kept once they are added
         book_chapters = {}
-        for volume, chapters in volumes.items():
-            volume_tuple = (volume.index, volume.name)
-            book_chapters[volume_tuple] = []
-
-            for chapter in sorted(chapters, key=lambda c: c.index):
-                epub_chapter = self.chapter_html(novel, chapter)
-                book.add_item(epub_chapter)
-                book_chapters[volume_tuple].append(epub_chapter)
+        chapter_count = 0
+        for volume, chapter in self.novel_service.iter_chapters(novel):
+            epub_chapter = self.chapter_html(novel, chapter)
+            book.add_item(epub_chapter)
+            book_chapters.setdefault((volume.index, volume.name), []).append(
+                epub_chapter
+            )
+            chapter_count += 1
 
         logger.debug(f"Added {chapter_count + 1} pages to epub.")
 
@@ -1,11 +1,13 @@
 import base64
+import itertools
 import mimetypes
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 from loguru import logger
 from mako.lookup import TemplateLookup
+from mako.runtime import Context
 
 from novelsave.core.entities.novel import Novel, Volume, Chapter
 from novelsave.core.services import (
@@ -47,18 +49,17 @@ class HtmlPackager(BasePackager):
 
     def package(self, novel: Novel) -> Path:
         urls = self.novel_service.get_urls(novel)
-        volumes = self.novel_service.get_volumes_with_chapters(novel)
-        chapter_count = len([c for cl in volumes.values() for c in cl])
+        chapter_count = self.novel_service.get_chapter_counts(novel).downloaded
         metadata = self.novel_service.get_metadata(novel)
         logger.debug(f"Preparing to package '{novel.title}' ({novel.id}) to html.")
         logger.debug(
-            f"Novel contains {len(volumes)} volumes, {chapter_count} chapters, and {len(metadata)}) metadata."
+            f"Novel contains {chapter_count} chapters, and {len(metadata)}) metadata."
         )
 
         html_file = self.destination(novel)
         html_file.parent.mkdir(parents=True, exist_ok=True)
 
-        toc = self.prepare_toc(novel, volumes)
+        toc = self.prepare_toc(novel, self.novel_service.iter_chapters(novel))
 
         meta_by_name: Dict[str, List[str]] = {}
         for item in metadata:
@@ -66,24 +67,23 @@ class HtmlPackager(BasePackager):
                 metadata_helper.display_value(item)
             )
 
-        rendered_data = (
-            self.lookup.get_template("index.html.mako")
-            .render(
-                novel=novel,
-                metadata=meta_by_name,
-                volume_wrappers=toc,
-                chapter_count=chapter_count,
-                sources=[uobject.url for uobject in urls],
-                static=self.prepare_static(),
+        # rendered straight into the file as the chapters are loaded
+        with html_file.open("w", encoding="utf-8") as f:
+            self.lookup.get_template("index.html.mako").render_context(
+                Context(
+                    f,
+                    novel=novel,
+                    metadata=meta_by_name,
+                    volume_wrappers=toc,
+                    chapter_count=chapter_count,
+                    sources=[uobject.url for uobject in urls],
+                    static=self.prepare_static(),
+                )
             )
-            .encode("utf-8")
-        )
         logger.debug(
-            f"Rendered html file of size {string_helper.format_bytes(len(rendered_data))}'."
+            f"Rendered html file of size {string_helper.format_bytes(html_file.stat().st_size)}'."
         )
 
-        self.file_service.write_bytes(html_file, rendered_data)
-
         logger.debug(
             f"Compiled and saved html file to {{novel.dir}}/{self.path_service.relative_to_novel_dir(html_file)}."
         )
@@ -114,11 +114,14 @@ class HtmlPackager(BasePackager):
     def mapping_dict(self, novel: Novel):
         return self.asset_service.mapping_dict(self.path_mapping(novel))
 
-    def prepare_toc(self, novel: Novel, volumes: Dict[Volume, List[Chapter]]):
-        volume_wrappers = []
-        for volume, chapters in sorted(volumes.items(), key=lambda v: v[0].index):
-            chapter_wrappers = [
-                {
+    def prepare_toc(
+        self, novel: Novel, chapters: Iterable[Tuple[Volume, Chapter]]
+    ) -> Iterator[dict]:
+        """volume wrappers of the chapters, built as they are iterated by the template"""
+
+        def chapter_wrappers(group: Iterable[Tuple[Volume, Chapter]]):
+            for _, chapter in group:
+                yield {
                     "order": chapter.index,
                     "chapter": chapter,
                     "filename": f"{str(chapter.index).zfill(4)}.html",
@@ -127,23 +130,14 @@ class HtmlPackager(BasePackager):
                     ),
                     "id": f"chapter-{chapter.index}",
                 }
-                for chapter in sorted(chapters, key=lambda c: c.index)
-            ]
-
-            volume_wrappers.append(
-                {
-                    "order": volume.index,
-                    "volume": volume,
-                    "chapter_wrappers": chapter_wrappers,
-                    "id": f"volume-{volume.index}",
-                }
-            )
-
-        logger.debug(
-            f"Constructed table of contents for web with {len(volumes)} volumes."
-        )
 
-        return volume_wrappers
+        for volume, group in itertools.groupby(chapters, key=lambda vc: vc[0]):
+            yield {
+                "order": volume.index,
+                "volume": volume,
+                "chapter_wrappers": chapter_wrappers(group),
+                "id": f"volume-{volume.index}",
+            }
 
     def prepare_static(self):
         font_size = self.config_service.get_config("html.font_size")
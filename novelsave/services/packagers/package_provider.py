@@ -1,29 +1,40 @@
-from typing import Iterable
+from typing import Callable, Dict, Iterable, List
 
 from novelsave.core.services.packagers import BasePackager, BasePackagerProvider
 
 
 class PackagerProvider(BasePackagerProvider):
-    def __init__(self, *args):
-        self._packagers = args
+    def __init__(self, **factories: Callable[[], BasePackager]):
+        """
+        :param factories: factory of the packager identified by each keyword,
+            packagers are only created, and their dependencies imported, once requested.
+        """
+        self._factories = factories
+        self._packagers: Dict[Callable[[], BasePackager], BasePackager] = {}
+
+    def _packager(self, factory: Callable[[], BasePackager]) -> BasePackager:
+        # a packager identified by several keywords is created once
+        if factory not in self._packagers:
+            self._packagers[factory] = factory()
+
+        return self._packagers[factory]
 
     def keywords(self):
-        return [keyword for p in self._packagers for keyword in p.keywords()]
+        return list(self._factories.keys())
 
-    def packagers(self) -> Iterable[BasePackager]:
-        return self._packagers
+    def packagers(self) -> List[BasePackager]:
+        return [self._packager(f) for f in dict.fromkeys(self._factories.values())]
 
     def filter_packagers(self, keywords: Iterable[str]) -> Iterable[BasePackager]:
         keywords = [k.lower() for k in keywords]
-        packagers = self.packagers()
 
         filtered = set()
         for keyword in keywords:
-            for p in packagers:
-                if keyword in p.keywords():
-                    filtered.add(p)
-                    break
-            else:  # if inner loop was not broken
+            try:
+                factory = self._factories[keyword]
+            except KeyError:
                 raise ValueError(f"No packager was found that matches '{keyword}'.")
 
+            filtered.add(self._packager(factory))
+
         return sorted(filtered, key=lambda p: p.priority)
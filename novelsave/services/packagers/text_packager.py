@@ -38,12 +38,9 @@ class TextPackager(BasePackager):
 
     def package(self, novel: Novel) -> Path:
         urls = self.novel_service.get_urls(novel)
-        volumes = self.novel_service.get_volumes_with_chapters(novel)
-        chapter_count = len([c for cl in volumes.values() for c in cl])
         metadata = self.novel_service.get_metadata(novel)
         logger.debug(
-            f"Preparing to package to epub (id={novel.id}, title='{novel.title}', volumes={len(volumes)}, "
-            f"chapters={chapter_count}, metadata={len(metadata)})"
+            f"Preparing to package to text (id={novel.id}, title='{novel.title}', metadata={len(metadata)})"
         )
 
         folder = self.destination(novel)
@@ -65,14 +62,17 @@ class TextPackager(BasePackager):
 
         logger.debug("Written novel information to file (file='_preface.txt').")
 
-        for volume, chapters in volumes.items():
-            for chapter in chapters:
-                volume_prefix = (
-                    ("v" + str(volume.index).zfill(2)) if volume.index >= 0 else ""
-                )
-                filename = volume_prefix + "c" + str(chapter.index).zfill(4) + ".txt"
-                with (folder / filename).open("w", encoding="utf-8") as f:
-                    f.write(self.chapter(volume, chapter))
+        # written as they are loaded so that only a batch of chapters is held at once
+        chapter_count = 0
+        for volume, chapter in self.novel_service.iter_chapters(novel):
+            volume_prefix = (
+                ("v" + str(volume.index).zfill(2)) if volume.index >= 0 else ""
+            )
+            filename = volume_prefix + "c" + str(chapter.index).zfill(4) + ".txt"
+            with (folder / filename).open("w", encoding="utf-8") as f:
+                f.write(self.chapter(volume, chapter))
+
+            chapter_count += 1
 
         logger.debug(f"Written chapter content to text files (count={chapter_count})")
 
@@ -50,11 +50,12 @@ class PathService(BasePathService):
         return self.data_dir / str(novel.id)
 
     def asset_path(self, novel: Novel, asset: Asset) -> Path:
-        parse_result = urlparse(novel.thumbnail_url)
+        parse_result = urlparse(asset.url)
         suffix = Path(parse_result.path).suffix
-        file = Path(str(asset.id) + suffix)
+        directory = self.division_rules.get(suffix, "")
 
-        return self.novel_data_path(novel) / self.divide(file)
+        # left unresolved like the data dir, so that it stays relative to it
+        return self.novel_data_path(novel) / directory / (str(asset.id) + suffix)
 
     def thumbnail_path(self, novel: Novel) -> Path:
         suffix = Path(novel.thumbnail_url).suffix
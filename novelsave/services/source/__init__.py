@@ -1,3 +1,19 @@
-from .meta_source_gateway import MetaSourceGateway
-from .source_gateway import SourceGateway
-from .source_service import SourceService
+from typing import TYPE_CHECKING
+
+from novelsave.utils.helpers import import_helper
+
+if TYPE_CHECKING:
+    from .async_source_gateway import AsyncSourceGateway, PrefetchedHttpGateway
+    from .meta_source_gateway import MetaSourceGateway
+    from .source_gateway import SourceGateway
+    from .source_service import SourceService
+
+__getattr__ = import_helper.lazy_exports(
+    __name__,
+    {
+        ".async_source_gateway": ["AsyncSourceGateway", "PrefetchedHttpGateway"],
+        ".meta_source_gateway": ["MetaSourceGateway"],
+        ".source_gateway": ["SourceGateway"],
+        ".source_service": ["SourceService"],
+    },
+)
@@ -0,0 +1,213 @@
+import asyncio
+import threading
+from concurrent.futures import Executor
+from typing import Dict, Optional
+
+import requests
+from loguru import logger
+from novelsave_sources import BadResponseException, BaseHttpGateway
+from requests.cookies import RequestsCookieJar, get_cookie_header
+from requests.structures import CaseInsensitiveDict
+
+from .source_gateway import SourceGateway
+from ...core import dtos
+from ...core.services.source import BaseAsyncSourceGateway
+from ...exceptions import RequirementException
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class PrefetchedHttpGateway(BaseHttpGateway):
+    """Http gateway that answers requests from responses downloaded ahead of time
+
+    Requests that were not prefetched are forwarded to the wrapped gateway,
+    this keeps sources that make additional requests working as before.
+    """
+
+    def __init__(self, http_gateway: BaseHttpGateway):
+        self.http_gateway = http_gateway
+
+        self._responses: Dict[str, requests.Response] = {}
+        self._lock = threading.Lock()
+
+    def put(self, url: str, response: requests.Response):
+        with self._lock:
+            self._responses[url] = response
+
+    def discard(self, url: str):
+        with self._lock:
+            self._responses.pop(url, None)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict = None,
+        params: dict = None,
+        data: dict = None,
+        json: dict = None,
+    ) -> requests.Response:
+        if method.upper() == "GET" and not params:
+            with self._lock:
+                response = self._responses.pop(url, None)
+
+            if response is not None:
+                return response
+
+            logger.debug(f"Prefetched response not found, requesting: {url}.")
+
+        return self.http_gateway.request(
+            method, url, headers=headers, params=params, data=data, json=json
+        )
+
+    @property
+    def cookies(self) -> RequestsCookieJar:
+        return self.http_gateway.cookies
+
+    @cookies.setter
+    def cookies(self, cookies: RequestsCookieJar):
+        self.http_gateway.cookies = cookies
+
+
+class AsyncSourceGateway(BaseAsyncSourceGateway):
+    """Asynchronous adapter around a source gateway
+
+    Chapter pages are downloaded concurrently on the event loop using aiohttp,
+    the downloaded page is then parsed by the source in the executor.
+
+    aiohttp cannot solve the Cloudflare challenges that the source's own
+    session (cloudscraper) handles. Once a challenge is received, the rest
+    of the chapters are downloaded by the source itself in the executor.
+    """
+
+    def __init__(
+        self,
+        source_gateway: SourceGateway,
+        executor: Executor,
+        connections: int,
+        timeout: float,
+    ):
+        if aiohttp is None:
+            raise RequirementException(
+                "Asynchronous downloads require 'aiohttp', install it using 'pip install novelsave[async]'."
+            )
+
+        self.source_gateway = source_gateway
+        self.executor = executor
+        self.connections = connections
+        self.timeout = timeout
+
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self.challenged = False
+
+        source = self.source_gateway.source
+        self._http_gateway = source.http_gateway
+        self._prefetched = PrefetchedHttpGateway(self._http_gateway)
+        source.http_gateway = self._prefetched
+
+    @property
+    def name(self) -> str:
+        return self.source_gateway.name
+
+    def session(self) -> "aiohttp.ClientSession":
+        """lazily create the client session, it must be created within the running loop"""
+        if self._session is None:
+            # mirror the source's http gateway which disables certificate verification
+            connector = aiohttp.TCPConnector(limit=self.connections, ssl=False)
+
+            headers = getattr(
+                getattr(self._http_gateway, "session", None), "headers", {}
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=dict(headers),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+
+        return self._session
+
+    async def fetch(self, url: str) -> requests.Response:
+        """download the url and wrap the result as a requests response"""
+        headers = {}
+        cookie = get_cookie_header(
+            self._http_gateway.cookies, requests.Request("GET", url)
+        )
+        if cookie:
+            headers["Cookie"] = cookie
+
+        try:
+            async with self.session().get(url, headers=headers) as r:
+                response = requests.Response()
+                response.url = str(r.url)
+                response.status_code = r.status
+                response.reason = r.reason
+                response.headers = CaseInsensitiveDict(r.headers)
+                response.encoding = r.charset
+                response._content = await r.read()
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(str(e))
+        except aiohttp.ClientError as e:
+            raise requests.ConnectionError(str(e))
+
+        if not response.ok:
+            raise BadResponseException(response)
+
+        return response
+
+    async def guarded_fetch(self, url: str) -> requests.Response:
+        """fetch the url through the circuit breaker of the source gateway, if any"""
+        circuit_breaker = self.source_gateway.circuit_breaker
+        if circuit_breaker is not None:
+            circuit_breaker.before_request()
+
+        try:
+            response = await self.fetch(url)
+        except Exception as e:
+            self.source_gateway.discard_refused_cookies(e)
+            if circuit_breaker is not None:
+                circuit_breaker.record_failure(e)
+            raise
+
+        if circuit_breaker is not None:
+            circuit_breaker.record_success()
+        return response
+
+    @staticmethod
+    def is_challenge(response: requests.Response) -> bool:
+        """whether the response is an anti-bot page served by Cloudflare"""
+        return response.status_code in (403, 429, 503) and response.headers.get(
+            "Server", ""
+        ).lower().startswith("cloudflare")
+
+    async def update_chapter_content(self, chapter: dtos.ChapterDTO) -> dtos.ChapterDTO:
+        if not self.challenged:
+            try:
+                self._prefetched.put(chapter.url, await self.guarded_fetch(chapter.url))
+            except BadResponseException as e:
+                if not self.is_challenge(e.args[0]):
+                    raise
+
+                if not self.challenged:
+                    logger.warning(
+                        f"Received a Cloudflare challenge from {self.name}, "
+                        f"the remaining chapters are downloaded by the source itself."
+                    )
+                self.challenged = True
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self.executor, self.source_gateway.update_chapter_content, chapter
+            )
+        finally:
+            self._prefetched.discard(chapter.url)
+
+    async def close(self):
+        self.source_gateway.source.http_gateway = self._http_gateway
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
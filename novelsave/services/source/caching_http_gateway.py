@@ -0,0 +1,48 @@
+import requests
+from novelsave_sources import BaseHttpGateway
+from requests.cookies import RequestsCookieJar
+
+from ...core.services.network import BaseResponseCache
+
+
+class CachingHttpGateway(BaseHttpGateway):
+    """Http gateway that answers plain GET requests through the response cache
+
+    Cached pages are revalidated using the wrapped gateway, hence pages
+    that have not changed since they were last requested cost a 304.
+    """
+
+    def __init__(
+        self, http_gateway: BaseHttpGateway, response_cache: BaseResponseCache
+    ):
+        self.http_gateway = http_gateway
+        self.response_cache = response_cache
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict = None,
+        params: dict = None,
+        data: dict = None,
+        json: dict = None,
+    ) -> requests.Response:
+        if method.upper() != "GET" or params or data or json:
+            return self.http_gateway.request(
+                method, url, headers=headers, params=params, data=data, json=json
+            )
+
+        return self.response_cache.fetch(
+            url,
+            lambda conditional: self.http_gateway.request(
+                method, url, headers={**(headers or {}), **conditional}
+            ),
+        )
+
+    @property
+    def cookies(self) -> RequestsCookieJar:
+        return self.http_gateway.cookies
+
+    @cookies.setter
+    def cookies(self, cookies: RequestsCookieJar):
+        self.http_gateway.cookies = cookies
@@ -1,24 +1,72 @@
-from typing import List
+from typing import Callable, List, Optional, TypeVar
 
 import browser_cookie3
 from loguru import logger
 from novelsave_sources.sources.novel.source import Source
 from requests.cookies import RequestsCookieJar
 
+from .caching_http_gateway import CachingHttpGateway
 from ...core import dtos
+from ...core.services.network import (
+    BaseCircuitBreaker,
+    BaseCookieCache,
+    BaseResponseCache,
+)
 from ...core.services.source import BaseSourceGateway
 from ...exceptions import CookieBrowserNotSupportedException
+from ..network import RetryPolicy
 from ...utils.adapters import SourceAdapter
 
+T = TypeVar("T")
+
 
 class SourceGateway(BaseSourceGateway):
-    def __init__(self, source: Source, source_adapter: SourceAdapter):
+    def __init__(
+        self,
+        source: Source,
+        source_adapter: SourceAdapter,
+        response_cache: BaseResponseCache = None,
+        circuit_breaker: BaseCircuitBreaker = None,
+        cookie_cache: BaseCookieCache = None,
+    ):
         self.source = source
         self.source_adapter = source_adapter
+        self.response_cache = response_cache
+        self._circuit_breaker = circuit_breaker
+        self.cookie_cache = cookie_cache
+
+        # browser the cookies in use were extracted from
+        self._cookies_browser: Optional[str] = None
+
+    @staticmethod
+    def source_name(source: Source) -> str:
+        return getattr(source, "name", type(source).__name__)
 
     @property
     def name(self) -> str:
-        return getattr(self.source, "name", type(self.source).__name__)
+        return self.source_name(self.source)
+
+    @property
+    def circuit_breaker(self) -> Optional[BaseCircuitBreaker]:
+        return self._circuit_breaker
+
+    def guarded(self, request: Callable[[], T]) -> T:
+        """make the request through the circuit breaker, if any"""
+        # refused requests are not recorded, they never reached the source
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.before_request()
+
+        try:
+            result = request()
+        except Exception as e:
+            self.discard_refused_cookies(e)
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.record_failure(e)
+            raise
+
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success()
+        return result
 
     @property
     def base_url(self) -> str:
@@ -42,28 +90,65 @@ class SourceGateway(BaseSourceGateway):
         self.source.login(username, password)
 
     def novel_by_url(self, url: str) -> dtos.NovelDTO:
-        novel = self.source.novel(url)
+        # table of contents pages are mostly unchanged between updates, hence revalidated from cache
+        http_gateway = self.source.http_gateway
+        if self.response_cache is not None and self.response_cache.is_enabled:
+            self.source.http_gateway = CachingHttpGateway(
+                http_gateway, self.response_cache
+            )
+
+        try:
+            novel = self.guarded(lambda: self.source.novel(url))
+        finally:
+            self.source.http_gateway = http_gateway
 
         return self.source_adapter.novel_to_internal(novel)
 
     def update_chapter_content(self, chapter: dtos.ChapterDTO) -> dtos.ChapterDTO:
         source_chapter = self.source_adapter.chapter_to_external(chapter)
-        self.source.chapter(source_chapter)
+        self.guarded(lambda: self.source.chapter(source_chapter))
         self.source_adapter.chapter_content_to_internal(source_chapter, chapter)
 
         return chapter
 
     def use_cookies_from_browser(self, browser: str):
-        try:
-            cookies = getattr(browser_cookie3, browser)()
-        except AttributeError:
-            raise CookieBrowserNotSupportedException(browser)
+        cookiejar = None
+        if self.cookie_cache is not None:
+            cookiejar = self.cookie_cache.get(self.name, browser)
+
+        if cookiejar is not None:
+            logger.debug(
+                f"Reused {len(cookiejar)} cached cookies of '{self.name}' from '{browser=}'."
+            )
+        else:
+            try:
+                cookies = getattr(browser_cookie3, browser)()
+            except AttributeError:
+                raise CookieBrowserNotSupportedException(browser)
+
+            logger.debug(f"Extracted {len(cookies)} cookies from '{browser=}'.")
+
+            cookiejar = self.where_cookies_in_domain(cookies)
+            logger.debug(f"Filtered {len(cookiejar)} cookies for '{self.name}'.")
 
-        logger.debug(f"Extracted {len(cookies)} cookies from '{browser=}'.")
+            if self.cookie_cache is not None:
+                self.cookie_cache.put(self.name, browser, cookiejar)
 
-        cookiejar = self.where_cookies_in_domain(cookies)
         self.source.set_cookies(cookiejar)
-        logger.debug(f"Filtered {len(cookiejar)} cookies for '{self.name}'.")
+        self._cookies_browser = browser
+
+    def discard_refused_cookies(self, exception: Exception):
+        browser = self._cookies_browser
+        if self.cookie_cache is None or browser is None:
+            return
+
+        if RetryPolicy.status_code(exception) in (401, 403):
+            self._cookies_browser = None
+            self.cookie_cache.invalidate(self.name, browser)
+            logger.debug(
+                f"Discarded cached cookies of '{self.name}' from '{browser=}' "
+                f"after failed authentication."
+            )
 
     def where_cookies_in_domain(self, cookies):
         cj = RequestsCookieJar()
@@ -1,5 +1,7 @@
+import threading
 from functools import lru_cache
-from typing import List
+from typing import Callable, Dict, List, Optional, Type
+from urllib.parse import urlparse
 
 import novelsave_sources
 import requests
@@ -9,24 +11,101 @@ from novelsave_sources import (
     locate_metadata_source,
     UnknownSourceException,
 )
+from novelsave_sources.sources.novel.source import Source
 
 from .meta_source_gateway import MetaSourceGateway
 from .source_gateway import SourceGateway
+from ...core.services.network import (
+    BaseCircuitBreaker,
+    BaseCookieCache,
+    BaseResponseCache,
+)
 from ...core.services.source import BaseSourceService
 from ...exceptions import SourceNotFoundException
 from ...utils.adapters import SourceAdapter
 
 
 class SourceService(BaseSourceService):
-    def __init__(self, source_adapter: SourceAdapter):
+    def __init__(
+        self,
+        source_adapter: SourceAdapter,
+        http_session: requests.Session,
+        response_cache: BaseResponseCache,
+        circuit_breaker_factory: Optional[Callable[..., BaseCircuitBreaker]] = None,
+        cookie_cache: Optional[BaseCookieCache] = None,
+    ):
         self.source_adapter = source_adapter
+        self.http_session = http_session
+        self.response_cache = response_cache
+        self.circuit_breaker_factory = circuit_breaker_factory
+        self.cookie_cache = cookie_cache
+
+        # shared by every gateway of the source, so that an outage is remembered across novels
+        self._circuit_breakers: Dict[str, BaseCircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+        self._host_index: Optional[Dict[str, List[Type[Source]]]] = None
+        # sources swap their http gateway while in use, hence instances are not shared between threads
+        self._local = threading.local()
+
+    def _circuit_breaker(self, name: str) -> Optional[BaseCircuitBreaker]:
+        if self.circuit_breaker_factory is None:
+            return None
+
+        with self._lock:
+            if name not in self._circuit_breakers:
+                self._circuit_breakers[name] = self.circuit_breaker_factory(name=name)
+
+            return self._circuit_breakers[name]
+
+    def _source_gateway(self, source_type: Type[Source]) -> SourceGateway:
+        """gateway of the source type, created on first use by the current thread"""
+        try:
+            gateways = self._local.gateways
+        except AttributeError:
+            gateways = self._local.gateways = {}
+
+        try:
+            return gateways[source_type]
+        except KeyError:
+            pass
+
+        source = source_type()
+        gateway = gateways[source_type] = SourceGateway(
+            source,
+            source_adapter=self.source_adapter,
+            response_cache=self.response_cache,
+            circuit_breaker=self._circuit_breaker(SourceGateway.source_name(source)),
+            cookie_cache=self.cookie_cache,
+        )
+        return gateway
+
+    def _source_types_of_host(self, host: str) -> List[Type[Source]]:
+        with self._lock:
+            if self._host_index is None:
+                self._host_index = {}
+                for source_type in novel_source_types():
+                    for base_url in source_type.base_urls:
+                        self._host_index.setdefault(
+                            urlparse(base_url).netloc.lower(), []
+                        ).append(source_type)
+
+            return self._host_index.get(host, [])
+
+    def _locate_novel_source(self, url: str) -> Type[Source]:
+        for source_type in self._source_types_of_host(urlparse(url).netloc.lower()):
+            if source_type.of(url):
+                return source_type
+
+        # sources may match urls beyond the hosts of their base urls
+        return locate_novel_source(url)
 
     @property
     def current_version(self) -> str:
         return novelsave_sources.__version__
 
     def get_latest_version(self) -> str:
-        response = requests.get("https://pypi.org/pypi/novelsave-sources/json")
+        response = self.http_session.get("https://pypi.org/pypi/novelsave-sources/json")
         if not response.ok:
             raise ConnectionError(
                 f"Response received was not valid: GET {response.url} - {response.status_code} {response.reason}"
@@ -38,12 +117,9 @@ class SourceService(BaseSourceService):
         )
         return versions[0]
 
-    @lru_cache(1)
     def source_from_url(self, url: str) -> SourceGateway:
         try:
-            return SourceGateway(
-                locate_novel_source(url)(), source_adapter=self.source_adapter
-            )
+            return self._source_gateway(self._locate_novel_source(url))
         except UnknownSourceException:
             raise SourceNotFoundException(url)
 
@@ -58,6 +134,5 @@ class SourceService(BaseSourceService):
 
     def get_novel_sources(self) -> List[SourceGateway]:
         return [
-            SourceGateway(source_type(), source_adapter=self.source_adapter)
-            for source_type in novel_source_types()
+            self._source_gateway(source_type) for source_type in novel_source_types()
         ]
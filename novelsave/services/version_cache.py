@@ -0,0 +1,60 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from loguru import logger
+
+from novelsave.core.services import BaseVersionCache
+
+
+class VersionCache(BaseVersionCache):
+    """Remembers the latest versions of packages found on PyPI in a json file
+
+    A version is only returned for ttl seconds after it was checked, the
+    package is checked again afterwards.
+    """
+
+    def __init__(self, file: Path, ttl: float, clock: Callable[[], float] = time.time):
+        self.file = Path(file)
+        self.ttl = ttl
+        self.clock = clock
+
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with self.file.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.debug(f"Ignored malformed version cache: {self.file}.")
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def get(self, package: str) -> Optional[str]:
+        with self._lock:
+            entry = self._read().get(package)
+
+        try:
+            if self.clock() - entry["checked"] < self.ttl:
+                return entry["version"]
+        except (TypeError, KeyError):
+            pass
+
+        return None
+
+    def put(self, package: str, version: str):
+        with self._lock:
+            data = self._read()
+            data[package] = {"version": version, "checked": self.clock()}
+
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.file.with_suffix(".tmp")
+            with temp.open("w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(temp, self.file)
@@ -19,6 +19,18 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 
 DATA_DIR = CONFIG_DIR / "data"
 
+# download concurrency settled on for each source
+CONCURRENCY_FILE = CONFIG_DIR / "concurrency.json"
+
+# disposable data that speeds up repeated runs, such as http responses
+CACHE_DIR = CONFIG_DIR / "cache"
+
+# cookies extracted from browsers for each source
+COOKIES_DIR = CONFIG_DIR / "cookies"
+
+# latest package versions found by the update check
+VERSIONS_FILE = CONFIG_DIR / "versions.json"
+
 DATABASE_FILE = (CONFIG_DIR / "data.sqlite").resolve()
 DATABASE_URL = "sqlite:///" + str(DATABASE_FILE)
 
@@ -27,6 +39,72 @@ DATABASE_URL = "sqlite:///" + str(DATABASE_FILE)
 DEFAULT_NOVEL_DIR = Path.home() / "novels"
 DEFAULT_HTML_FONT_SIZE = "1rem"
 
+# politeness limits applied to each host when downloading chapters.
+# rate is the sustained requests per second, 0 disables throttling.
+DEFAULT_DOWNLOAD_RATE = 5.0
+DEFAULT_DOWNLOAD_BURST = 10
+
+# maximum requests in flight when downloading chapters, the concurrency is
+# tuned per source starting from the initial level unless specified by --threads.
+# the level settled on is remembered for the next download from the source.
+DEFAULT_DOWNLOAD_CONNECTIONS = 64
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
+# seconds after which a request is abandoned
+REQUEST_TIMEOUT = 60
+
+# downloaded chapters are written to the database in batches, a batch is
+# committed once it reaches the size or the interval (seconds) has passed.
+DEFAULT_WRITER_BATCH_SIZE = 100
+DEFAULT_WRITER_INTERVAL = 2.0
+
+# assets are downloaded concurrently with a limit on the connections to a
+# single host, assets larger than max size (bytes) are abandoned.
+DEFAULT_ASSET_CONNECTIONS = 16
+DEFAULT_ASSET_HOST_CONNECTIONS = 4
+DEFAULT_ASSET_MAX_SIZE = 20 * 1024 * 1024
+
+# novels updated concurrently by 'update --all', overall and of a single source
+DEFAULT_LIBRARY_CONCURRENCY = 4
+DEFAULT_LIBRARY_SOURCE_CONCURRENCY = 1
+
+# codec chapter content is stored with, 'none', 'zlib' or 'zstd' (requires zstandard).
+# content of each novel is compressed with a dictionary trained from its chapters.
+DEFAULT_STORAGE_COMPRESSION = "zlib"
+
+# tuning of the sqlite database connections. the write ahead log lets packaging
+# read while chapters are written, which only syncs to disk at checkpoints.
+# mmap_size is in bytes, cache_size in KiB and busy_timeout in milliseconds.
+DEFAULT_SQLITE_JOURNAL_MODE = "wal"
+DEFAULT_SQLITE_SYNCHRONOUS = "normal"
+DEFAULT_SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_SQLITE_CACHE_SIZE = 64 * 1024
+DEFAULT_SQLITE_BUSY_TIMEOUT = 5000
+
+# maximum size (bytes) of the http response cache, 0 disables the cache
+DEFAULT_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+# new versions are checked for at most once per ttl (seconds) in the background,
+# the check is abandoned once the command exits after the deadline (seconds).
+UPDATE_CHECK_TTL = 24 * 60 * 60.0
+UPDATE_CHECK_DEADLINE = 2.0
+
+# seconds the cookies extracted from a browser are reused, 0 disables the cache
+DEFAULT_COOKIES_TTL = 12 * 60 * 60.0
+
+# requests to a source are refused for the cooldown (seconds) after this many
+# consecutive connection errors or 5xx responses, 0 disables the breaker.
+DEFAULT_CIRCUIT_THRESHOLD = 5
+DEFAULT_CIRCUIT_COOLDOWN = 120.0
+
+# retries of failed chapter downloads. attempts are made within a single
+# run with jittered exponential backoff (seconds), failures that remain
+# are skipped by later runs for an exponentially growing cooldown (seconds).
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 1.0
+DEFAULT_RETRY_MAX_BACKOFF = 30.0
+DEFAULT_RETRY_COOLDOWN = 600.0
+
 # the following map defines how files are stored
 # by further subdivision into sub-folders
 DIVISION_RULES = {
@@ -76,6 +154,31 @@ config = {
         "defaults": {
             "novel.dir": DEFAULT_NOVEL_DIR,
             "html.font_size": DEFAULT_HTML_FONT_SIZE,
+            "download.rate": DEFAULT_DOWNLOAD_RATE,
+            "download.burst": DEFAULT_DOWNLOAD_BURST,
+            "download.connections": DEFAULT_DOWNLOAD_CONNECTIONS,
+            "download.concurrency": DEFAULT_DOWNLOAD_CONCURRENCY,
+            "writer.batch_size": DEFAULT_WRITER_BATCH_SIZE,
+            "writer.interval": DEFAULT_WRITER_INTERVAL,
+            "assets.connections": DEFAULT_ASSET_CONNECTIONS,
+            "assets.host_connections": DEFAULT_ASSET_HOST_CONNECTIONS,
+            "assets.max_size": DEFAULT_ASSET_MAX_SIZE,
+            "storage.compression": DEFAULT_STORAGE_COMPRESSION,
+            "sqlite.journal_mode": DEFAULT_SQLITE_JOURNAL_MODE,
+            "sqlite.synchronous": DEFAULT_SQLITE_SYNCHRONOUS,
+            "sqlite.mmap_size": DEFAULT_SQLITE_MMAP_SIZE,
+            "sqlite.cache_size": DEFAULT_SQLITE_CACHE_SIZE,
+            "sqlite.busy_timeout": DEFAULT_SQLITE_BUSY_TIMEOUT,
+            "cache.max_size": DEFAULT_CACHE_MAX_SIZE,
+            "cookies.ttl": DEFAULT_COOKIES_TTL,
+            "library.concurrency": DEFAULT_LIBRARY_CONCURRENCY,
+            "library.source_concurrency": DEFAULT_LIBRARY_SOURCE_CONCURRENCY,
+            "circuit.threshold": DEFAULT_CIRCUIT_THRESHOLD,
+            "circuit.cooldown": DEFAULT_CIRCUIT_COOLDOWN,
+            "retry.attempts": DEFAULT_RETRY_ATTEMPTS,
+            "retry.backoff": DEFAULT_RETRY_BACKOFF,
+            "retry.max_backoff": DEFAULT_RETRY_MAX_BACKOFF,
+            "retry.cooldown": DEFAULT_RETRY_COOLDOWN,
         },
     },
     "data": {
@@ -85,6 +188,60 @@ config = {
     "novel": {
         "dir": DEFAULT_NOVEL_DIR,
     },
+    "download": {
+        "rate": DEFAULT_DOWNLOAD_RATE,
+        "burst": DEFAULT_DOWNLOAD_BURST,
+        "connections": DEFAULT_DOWNLOAD_CONNECTIONS,
+        "concurrency": DEFAULT_DOWNLOAD_CONCURRENCY,
+        "concurrency_file": CONCURRENCY_FILE,
+        "timeout": REQUEST_TIMEOUT,
+    },
+    "writer": {
+        "batch_size": DEFAULT_WRITER_BATCH_SIZE,
+        "interval": DEFAULT_WRITER_INTERVAL,
+    },
+    "assets": {
+        "connections": DEFAULT_ASSET_CONNECTIONS,
+        "host_connections": DEFAULT_ASSET_HOST_CONNECTIONS,
+        "max_size": DEFAULT_ASSET_MAX_SIZE,
+    },
+    "library": {
+        "concurrency": DEFAULT_LIBRARY_CONCURRENCY,
+        "source_concurrency": DEFAULT_LIBRARY_SOURCE_CONCURRENCY,
+    },
+    "storage": {
+        "compression": DEFAULT_STORAGE_COMPRESSION,
+    },
+    "sqlite": {
+        "journal_mode": DEFAULT_SQLITE_JOURNAL_MODE,
+        "synchronous": DEFAULT_SQLITE_SYNCHRONOUS,
+        "mmap_size": DEFAULT_SQLITE_MMAP_SIZE,
+        "cache_size": DEFAULT_SQLITE_CACHE_SIZE,
+        "busy_timeout": DEFAULT_SQLITE_BUSY_TIMEOUT,
+    },
+    "cache": {
+        "dir": CACHE_DIR,
+        "max_size": DEFAULT_CACHE_MAX_SIZE,
+    },
+    "updates": {
+        "file": VERSIONS_FILE,
+        "ttl": UPDATE_CHECK_TTL,
+        "deadline": UPDATE_CHECK_DEADLINE,
+    },
+    "cookies": {
+        "dir": COOKIES_DIR,
+        "ttl": DEFAULT_COOKIES_TTL,
+    },
+    "circuit": {
+        "threshold": DEFAULT_CIRCUIT_THRESHOLD,
+        "cooldown": DEFAULT_CIRCUIT_COOLDOWN,
+    },
+    "retry": {
+        "attempts": DEFAULT_RETRY_ATTEMPTS,
+        "backoff": DEFAULT_RETRY_BACKOFF,
+        "max_backoff": DEFAULT_RETRY_MAX_BACKOFF,
+        "cooldown": DEFAULT_RETRY_COOLDOWN,
+    },
     "infrastructure": {
         "database": {
             "url": DATABASE_URL,
@@ -1,2 +1,15 @@
-from .dto_adapter import DTOAdapter
-from .source_adapter import SourceAdapter
+from typing import TYPE_CHECKING
+
+from novelsave.utils.helpers import import_helper
+
+if TYPE_CHECKING:
+    from .dto_adapter import DTOAdapter
+    from .source_adapter import SourceAdapter
+
+__getattr__ = import_helper.lazy_exports(
+    __name__,
+    {
+        ".dto_adapter": ["DTOAdapter"],
+        ".source_adapter": ["SourceAdapter"],
+    },
+)
@@ -0,0 +1,34 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+async def _cancel_pending():
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@contextmanager
+def loop_in_thread() -> Iterator[asyncio.AbstractEventLoop]:
+    """Run a new event loop in a background thread for the duration of the context
+
+    Coroutines may be scheduled on the loop using :func:`asyncio.run_coroutine_threadsafe`,
+    which returns :class:`concurrent.futures.Future` that can be awaited from synchronous code.
+    Tasks that are still pending when the context exits are cancelled.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="event-loop", daemon=True)
+    thread.start()
+
+    try:
+        yield loop
+    finally:
+        asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,171 @@
+import hashlib
+import threading
+import zlib
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from novelsave.exceptions import RequirementException
+
+NONE = "none"
+ZLIB = "zlib"
+ZSTD = "zstd"
+
+CODECS = (NONE, ZLIB, ZSTD)
+
+# compressed values start with the codec followed by the digest of the
+# dictionary they were compressed with, zeroes when compressed without one.
+_CODEC_IDS = {ZLIB: 1, ZSTD: 2}
+_CODEC_NAMES = {v: k for k, v in _CODEC_IDS.items()}
+
+DIGEST_SIZE = 8
+NO_DICTIONARY = bytes(DIGEST_SIZE)
+HEADER_SIZE = 1 + DIGEST_SIZE
+
+# zlib only looks back 32 KiB, larger dictionaries are of no use to it
+ZLIB_DICTIONARY_SIZE = 32 * 1024
+
+# dictionaries are immutable and addressed by their digest
+_dictionaries: Dict[bytes, bytes] = {}
+_lock = threading.Lock()
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise RequirementException(
+            "Compressing with zstd requires 'zstandard', install it using 'pip install novelsave[zstd]'."
+        )
+
+    return zstandard
+
+
+def digest(dictionary: bytes) -> bytes:
+    """digest that addresses the dictionary in compressed values"""
+    return hashlib.blake2b(dictionary, digest_size=DIGEST_SIZE).digest()
+
+
+def compress(
+    text: Optional[str], codec: str, dictionary: Optional[bytes] = None
+) -> Union[str, bytes, None]:
+    """compress the text with the codec, the text is returned as is with codec 'none'
+
+    >>> decompress(compress('<p>text</p>', 'zlib'), lambda d: None)
+    '<p>text</p>'
+
+    :raises ValueError: if the codec is not known
+    :raises RequirementException: if the codec is zstd and zstandard is not installed
+    """
+    if text is None or codec == NONE:
+        return text
+
+    data = text.encode("utf-8")
+    if codec == ZLIB:
+        if dictionary is not None:
+            compressor = zlib.compressobj(9, zdict=dictionary)
+        else:
+            compressor = zlib.compressobj(9)
+        compressed = compressor.compress(data) + compressor.flush()
+    elif codec == ZSTD:
+        zstandard = _zstandard()
+        if dictionary is not None:
+            compressor = zstandard.ZstdCompressor(
+                dict_data=zstandard.ZstdCompressionDict(dictionary)
+            )
+        else:
+            compressor = zstandard.ZstdCompressor()
+        compressed = compressor.compress(data)
+    else:
+        raise ValueError(f"Unknown compression codec: '{codec}'.")
+
+    key = digest(dictionary) if dictionary is not None else NO_DICTIONARY
+    with _lock:
+        if dictionary is not None:
+            _dictionaries.setdefault(key, dictionary)
+
+    return bytes([_CODEC_IDS[codec]]) + key + compressed
+
+
+def decompress(
+    value: Union[str, bytes, None], load_dictionary: Callable[[bytes], Optional[bytes]]
+) -> Optional[str]:
+    """text of a value stored by :func:`compress`, text that was stored as is is returned unchanged
+
+    :param value: compressed bytes or text
+    :param load_dictionary: dictionary of a digest, only called for dictionaries not seen before
+    :raises ValueError: if the dictionary the value was compressed with is not found
+    """
+    if value is None or isinstance(value, str):
+        return value
+
+    codec = _CODEC_NAMES[value[0]]
+    key = value[1:HEADER_SIZE]
+    data = value[HEADER_SIZE:]
+
+    dictionary = None
+    if key != NO_DICTIONARY:
+        dictionary = dictionary_of(key, load_dictionary)
+
+    if codec == ZLIB:
+        if dictionary is not None:
+            decompressor = zlib.decompressobj(zdict=dictionary)
+        else:
+            decompressor = zlib.decompressobj()
+        decompressed = decompressor.decompress(data) + decompressor.flush()
+    else:
+        zstandard = _zstandard()
+        if dictionary is not None:
+            decompressor = zstandard.ZstdDecompressor(
+                dict_data=zstandard.ZstdCompressionDict(dictionary)
+            )
+        else:
+            decompressor = zstandard.ZstdDecompressor()
+        decompressed = decompressor.decompressobj().decompress(data)
+
+    return decompressed.decode("utf-8")
+
+
+def dictionary_of(
+    key: bytes, load_dictionary: Callable[[bytes], Optional[bytes]]
+) -> bytes:
+    """dictionary addressed by the digest, loaded once and kept for the process"""
+    with _lock:
+        dictionary = _dictionaries.get(key)
+    if dictionary is not None:
+        return dictionary
+
+    dictionary = load_dictionary(key)
+    if dictionary is None:
+        raise ValueError(f"Compression dictionary not found: {key.hex()}.")
+
+    with _lock:
+        _dictionaries.setdefault(key, dictionary)
+    return dictionary
+
+
+def train_dictionary(
+    samples: Iterable[str], codec: str, size: int = ZLIB_DICTIONARY_SIZE
+) -> Optional[bytes]:
+    """dictionary of the content shared between the samples
+
+    zlib prefers the strings most likely to occur at the end of its dictionary,
+    so the opening of each sample is stacked up to the size. zstd trains one
+    from the samples, which requires a reasonable number of them.
+
+    :returns: the dictionary, or None if the samples are not enough to build one
+    """
+    data = [s.encode("utf-8") for s in samples if s]
+    if codec == NONE or not data:
+        return None
+
+    if codec == ZLIB:
+        size = min(size, ZLIB_DICTIONARY_SIZE)
+        share = max(size // len(data), 1)
+        return b"".join(d[:share] for d in data)[-size:]
+    elif codec == ZSTD:
+        zstandard = _zstandard()
+        try:
+            return zstandard.train_dictionary(size, data).as_bytes()
+        except zstandard.ZstdError:
+            return None
+    else:
+        raise ValueError(f"Unknown compression codec: '{codec}'.")
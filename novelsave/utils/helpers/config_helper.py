@@ -21,6 +21,31 @@ def _version_2(data: dict):
     types = {
         "novel.dir": Path,
         "html.font_size": str,
+        "download.rate": float,
+        "download.burst": int,
+        "download.connections": int,
+        "download.concurrency": int,
+        "writer.batch_size": int,
+        "writer.interval": float,
+        "assets.connections": int,
+        "assets.host_connections": int,
+        "assets.max_size": int,
+        "storage.compression": str,
+        "sqlite.journal_mode": str,
+        "sqlite.synchronous": str,
+        "sqlite.mmap_size": int,
+        "sqlite.cache_size": int,
+        "sqlite.busy_timeout": int,
+        "cache.max_size": int,
+        "cookies.ttl": float,
+        "library.concurrency": int,
+        "library.source_concurrency": int,
+        "circuit.threshold": int,
+        "circuit.cooldown": float,
+        "retry.attempts": int,
+        "retry.backoff": float,
+        "retry.max_backoff": float,
+        "retry.cooldown": float,
     }
 
     parsed = {}
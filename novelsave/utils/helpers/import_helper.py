@@ -0,0 +1,52 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, List
+
+
+def lazy_import(path: str) -> Callable[..., Any]:
+    """Callable that imports the object at the dotted path once called, then calls it
+
+    Meant as the factory of a dependency injection provider, so that the module
+    and its dependencies are only imported when the provider is first used.
+
+    >>> ordered_dict = lazy_import('collections.OrderedDict')
+    >>> ordered_dict(a=1)
+    OrderedDict([('a', 1)])
+
+    :param path: module path followed by the name of the object in the module
+    :returns: function that passes its arguments on to the imported object
+    """
+    module_name, _, name = path.rpartition(".")
+
+    def call(*args, **kwargs):
+        return getattr(importlib.import_module(module_name), name)(*args, **kwargs)
+
+    call.__qualname__ = call.__name__ = name
+    call.__doc__ = f"Import '{path}' and call it with the arguments."
+    return call
+
+
+def lazy_exports(package: str, exports: Dict[str, List[str]]) -> Callable[[str], Any]:
+    """Module level ``__getattr__`` that imports the names exported by a package on first access
+
+    This keeps ``from package import Name`` working without importing every
+    module of the package, and their dependencies, along with the package.
+
+    :param package: name of the package, usually ``__name__``
+    :param exports: names exported from each module relative to the package
+    :returns: function to be assigned to ``__getattr__`` of the package
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module = modules[name]
+        except KeyError:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        value = getattr(importlib.import_module(module, package), name)
+        # later lookups find the attribute without calling this again
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
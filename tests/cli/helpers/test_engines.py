@@ -0,0 +1,152 @@
+import asyncio
+from concurrent import futures
+from typing import List
+from unittest.mock import Mock
+
+import requests
+
+from novelsave.client.cli.helpers import engines
+from novelsave.core.dtos import ChapterDTO
+from novelsave.exceptions import CircuitOpenException, ContentUpdateFailedException
+from novelsave.services.network import (
+    CircuitBreaker,
+    ConcurrencyController,
+    RateLimiter,
+    RetryPolicy,
+)
+
+
+def test_window_bounds_submissions():
+    submitted = []
+
+    def submit(dto):
+        submitted.append(dto)
+        future = futures.Future()
+        future.set_result(dto)
+        return future
+
+    window = engines.Window(submit, range(10), 3)
+
+    results = []
+    for future in window:
+        # nothing is submitted beyond the window until the consumer takes a result
+        assert len(submitted) - len(results) <= 3
+        results.append(future.result())
+
+    assert sorted(results) == list(range(10))
+
+
+def test_window_cancel():
+    submitted = []
+
+    def submit(dto):
+        future = futures.Future()
+        if dto == 0:
+            future.set_result(dto)
+
+        submitted.append(future)
+        return future
+
+    window = engines.Window(submit, range(10), 3)
+    iterator = iter(window)
+    assert next(iterator).result() == 0
+
+    window.cancel()
+
+    assert all(f.cancelled() for f in submitted[1:])
+    assert list(iterator) == []
+    assert len(submitted) == 3
+
+
+class FakeAsyncSourceGateway:
+    def __init__(self, fail: dict, block: asyncio.Event = None):
+        self.fail = dict(fail)
+        self.block = block
+        self.requests = []
+        self.closed = False
+
+    async def update_chapter_content(self, chapter: ChapterDTO) -> ChapterDTO:
+        self.requests.append(chapter.index)
+        if self.fail.get(chapter.index, 0) > 0:
+            self.fail[chapter.index] -= 1
+            raise requests.Timeout()
+
+        if self.block is not None and chapter.index > 0:
+            await self.block.wait()
+
+        chapter.content = f"c{chapter.index}"
+        return chapter
+
+    async def close(self):
+        self.closed = True
+
+
+def make_chapters(count: int) -> List[ChapterDTO]:
+    return [
+        ChapterDTO(index=i, title=f"c{i}", url=f"https://example.com/{i}")
+        for i in range(count)
+    ]
+
+
+def run_async_engine(gateway, chapters, window, retry_policy):
+    return engines.async_engine(
+        lambda **_: gateway,
+        Mock(circuit_breaker=None),
+        chapters,
+        2,
+        RateLimiter(0, 1),
+        retry_policy,
+        ConcurrencyController(window, window, window),
+        lambda dto: dto.content,
+    )
+
+
+def test_async_engine_retries():
+    gateway = FakeAsyncSourceGateway({1: 1, 2: 5})
+    retry_policy = RetryPolicy(attempts=3, backoff=0, max_backoff=0, cooldown=1)
+
+    results, failures = [], []
+    with run_async_engine(gateway, make_chapters(4), 2, retry_policy) as completed:
+        for future in completed:
+            try:
+                results.append(future.result())
+            except ContentUpdateFailedException as e:
+                failures.append((e.chapter.index, e.attempts))
+
+    assert sorted(results) == ["c0", "c1", "c3"]
+    assert failures == [(2, 3)]
+    assert gateway.requests.count(1) == 2
+    assert gateway.closed
+
+
+def test_async_engine_cancels_on_exit():
+    gateway = FakeAsyncSourceGateway({}, block=asyncio.Event())
+    retry_policy = RetryPolicy(attempts=1, backoff=0, max_backoff=0, cooldown=1)
+
+    with run_async_engine(gateway, make_chapters(10), 3, retry_policy) as completed:
+        assert next(completed).result() == "c0"
+
+    # the blocked downloads are cancelled and those outside the window never requested
+    assert 0 in gateway.requests
+    assert set(gateway.requests) <= {0, 1, 2}
+    assert gateway.closed
+
+
+def test_thread_engine_fails_fast_when_circuit_open():
+    circuit_breaker = CircuitBreaker("Source", 1, 60)
+    circuit_breaker.record_failure(requests.Timeout())
+    source_gateway = Mock(circuit_breaker=circuit_breaker)
+    retry_policy = RetryPolicy(attempts=3, backoff=0, max_backoff=0, cooldown=1)
+
+    with engines.thread_engine(
+        source_gateway,
+        make_chapters(5),
+        2,
+        RateLimiter(1, 1),
+        retry_policy,
+        ConcurrencyController(2, 2, 2),
+    ) as completed:
+        exceptions = [future.exception() for future in completed]
+
+    assert all(isinstance(e.exception, CircuitOpenException) for e in exceptions)
+    source_gateway.update_chapter_content.assert_not_called()
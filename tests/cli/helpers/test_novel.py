@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -93,3 +94,32 @@ def test_get_or_create_no_novel_ok(mocker):
 
     result = novel_helper.get_or_create_novel("1")
     assert "novel" == result
+
+
+def test_follow_assets_downloads_each_asset_once():
+    first, second = MagicMock(id=1), MagicMock(id=2)
+    asset_service = MagicMock()
+    asset_service.pending_assets.side_effect = [[first], [first, second]]
+    asset_downloader = MagicMock()
+    session = MagicMock()
+
+    written, finished = threading.Event(), threading.Event()
+    written.set()
+
+    def download(_, assets):
+        # the chapters complete while the first assets are downloaded
+        finished.set()
+        written.set()
+        return [(asset, None) for asset in assets]
+
+    asset_downloader.download.side_effect = download
+
+    result = novel_helper.follow_assets(
+        1, written, finished, MagicMock(), asset_service, asset_downloader, session
+    )
+
+    downloaded = [c.args[1] for c in asset_downloader.download.call_args_list]
+    assert downloaded == [[first], [second]]
+    assert result == (2, 0)
+    assert session.expire.call_count == 2
+    session.remove.assert_called_once()
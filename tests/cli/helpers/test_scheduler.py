@@ -0,0 +1,60 @@
+import threading
+import time
+
+from novelsave.client.cli.helpers import scheduler
+
+
+def test_schedule_limits():
+    lock = threading.Lock()
+    running = {"total": 0, "a": 0, "b": 0}
+    peaks = {"total": 0, "a": 0, "b": 0}
+
+    def run(item):
+        key = item[0]
+        with lock:
+            for k in ("total", key):
+                running[k] += 1
+                peaks[k] = max(peaks[k], running[k])
+
+        time.sleep(0.01)
+
+        with lock:
+            for k in ("total", key):
+                running[k] -= 1
+
+        return item
+
+    items = [f"a{i}" for i in range(6)] + [f"b{i}" for i in range(6)]
+    results = [
+        future.result()
+        for _, future in scheduler.schedule(items, lambda i: i[0], run, 3, 2)
+    ]
+
+    assert sorted(results) == sorted(items)
+    assert peaks["total"] <= 3
+    assert peaks["a"] <= 2 and peaks["b"] <= 2
+
+
+def test_schedule_key_order():
+    order = []
+    list(
+        scheduler.schedule(
+            ["a0", "a1", "a2"],
+            lambda i: i[0],
+            order.append,
+            workers=4,
+            workers_per_key=1,
+        )
+    )
+
+    assert order == ["a0", "a1", "a2"]
+
+
+def test_schedule_exceptions():
+    def run(item):
+        raise ValueError(item)
+
+    [(item, future)] = scheduler.schedule(["a"], lambda i: i, run, 1, 1)
+
+    assert item == "a"
+    assert isinstance(future.exception(), ValueError)
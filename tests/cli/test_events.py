@@ -0,0 +1,101 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from novelsave.client.cli import events
+from novelsave.services import VersionCache
+
+
+@pytest.fixture(autouse=True)
+def installed_versions(mocker):
+    versions = {"novelsave-sources": "0.3.0", "novelsave": "0.8.4"}
+    mocker.patch.object(events, "installed_version", side_effect=versions.get)
+    return versions
+
+
+def make_service(latest: str) -> MagicMock:
+    """provider of a service, which is only called to request the latest version"""
+    service = MagicMock()
+    service.return_value.get_latest_version.return_value = latest
+    return service
+
+
+def test_check_for_updates_cached(tmp_path):
+    source_service = make_service("0.3.1")
+    meta_service = make_service("0.8.4")
+    version_cache = VersionCache(tmp_path / "versions.json", 60)
+
+    for _ in range(2):
+        updates = events.check_for_updates(source_service, meta_service, version_cache)
+        assert updates == [("novelsave-sources", "0.3.1")]
+
+    # the services are not even built once the latest versions are cached
+    source_service.assert_called_once()
+    meta_service.assert_called_once()
+
+
+def test_check_for_updates_not_installed(tmp_path, installed_versions):
+    del installed_versions["novelsave-sources"]
+    source_service = make_service("0.3.1")
+    meta_service = make_service("0.8.4")
+    version_cache = VersionCache(tmp_path / "versions.json", 60)
+
+    assert events.check_for_updates(source_service, meta_service, version_cache) == []
+    source_service.assert_not_called()
+
+
+def test_check_for_updates_connection_error(tmp_path):
+    source_service = make_service("0.3.1")
+    source_service.return_value.get_latest_version.side_effect = (
+        requests.ConnectionError()
+    )
+    meta_service = make_service("0.8.5")
+    version_cache = VersionCache(tmp_path / "versions.json", 60)
+
+    updates = events.check_for_updates(source_service, meta_service, version_cache)
+    assert updates == [("novelsave", "0.8.5")]
+    assert version_cache.get("novelsave-sources") is None
+
+
+def test_version_cache_expires(tmp_path):
+    now = [0.0]
+    version_cache = VersionCache(tmp_path / "versions.json", 60, clock=lambda: now[0])
+    version_cache.put("novelsave", "0.8.5")
+    assert version_cache.get("novelsave") == "0.8.5"
+
+    now[0] = 60
+    assert version_cache.get("novelsave") is None
+
+
+def test_update_check_event_deadline(mocker):
+    release = threading.Event()
+    mocker.patch(
+        "novelsave.client.cli.events.check_for_updates",
+        side_effect=lambda: release.wait(10),
+    )
+    now = [0.0]
+
+    report = events.update_check_event(deadline=2.0, clock=lambda: now[0])
+
+    # the deadline passed while the command ran, hence the report does not wait
+    now[0] = 2.0
+    start = time.monotonic()
+    report()
+    assert time.monotonic() - start < 1
+
+    release.set()
+
+
+def test_update_check_event_reports(mocker):
+    mocker.patch(
+        "novelsave.client.cli.events.check_for_updates",
+        return_value=[("novelsave", "0.8.5")],
+    )
+    warning = mocker.patch("novelsave.client.cli.events.logger.warning")
+
+    events.update_check_event(deadline=5.0)()
+
+    assert "novelsave==0.8.5" in warning.call_args.args[0]
@@ -1,7 +1,109 @@
 import pytest
 from loguru import logger
+from sqlalchemy.orm import sessionmaker
+
+from novelsave.containers import create_database_engine
+from novelsave.core.dtos import NovelDTO, VolumeDTO, ChapterDTO
+from novelsave.migrations.commands import migrate
+from novelsave.services import FileService, NovelService
+from novelsave.settings import config
+from novelsave.utils.adapters import DTOAdapter
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        help="run the benchmarks, which assert on timings and memory",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "benchmark: asserts on timings or memory, skipped unless --run-benchmarks is given",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+
+    # timings and memory are too noisy on a loaded machine for the default run
+    skip = pytest.mark.skip(reason="benchmark, run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+class FakeClock:
+    """clock that stands still until its time is set"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
 
 
 @pytest.fixture(scope="session", autouse=True)
 def disable_logger(request):
     logger.remove()
+
+
+@pytest.fixture
+def database_url(tmp_path) -> str:
+    url = f"sqlite:///{tmp_path / 'data.sqlite'}"
+    migrate(url)
+    return url
+
+
+@pytest.fixture
+def session(database_url):
+    # tuned and with foreign keys enforced like the application's engine
+    engine = create_database_engine(database_url, config["sqlite"])
+    session = sessionmaker(bind=engine, autoflush=False)()
+
+    yield session
+
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def novel_service(session) -> NovelService:
+    return NovelService(session, DTOAdapter(), FileService())
+
+
+@pytest.fixture
+def insert_novel(novel_service):
+    """insert a novel with a single volume of chapters without content"""
+
+    def insert(chapters: int, url: str = "https://example.com/novel"):
+        novel_dto = NovelDTO(
+            id=None,
+            title="Novel",
+            url=url,
+            volumes=[
+                VolumeDTO(
+                    id=None,
+                    index=0,
+                    name="Volume",
+                    chapters=[
+                        ChapterDTO(index=i, title=f"Chapter {i}", url=f"{url}/{i}")
+                        for i in range(chapters)
+                    ],
+                )
+            ],
+        )
+
+        novel = novel_service.insert_novel(novel_dto)
+        novel_service.insert_chapters(novel, novel_dto.volumes)
+        return novel
+
+    return insert
@@ -0,0 +1,41 @@
+import sqlite3
+from pathlib import Path
+
+from alembic.command import downgrade, upgrade
+
+from novelsave.migrations import commands
+
+
+def test_move_contents(database_url):
+    config = commands.make_config(Path(commands.__file__).parent, database_url)
+    downgrade(config, "7d2a9c41b6e3")
+
+    connection = sqlite3.connect(database_url[len("sqlite:///") :])
+    with connection:
+        connection.execute("INSERT INTO novels (id, title) VALUES (1, 'Novel')")
+        connection.execute(
+            "INSERT INTO volumes (id, \"index\", name, novel_id) VALUES (1, 0, 'Volume', 1)"
+        )
+        connection.executemany(
+            'INSERT INTO chapters (id, "index", title, url, content, volume_id) VALUES (?, ?, ?, ?, ?, 1)',
+            [
+                (1, 0, "Chapter 0", "https://example.com/0", b"compressed"),
+                (2, 1, "Chapter 1", "https://example.com/1", "<p>text</p>"),
+                (3, 2, "Chapter 2", "https://example.com/2", None),
+            ],
+        )
+
+    upgrade(config, "head")
+
+    rows = connection.execute(
+        "SELECT chapter_id, content FROM chapter_contents ORDER BY chapter_id"
+    ).fetchall()
+    assert rows == [(1, b"compressed"), (2, "<p>text</p>")]
+
+    columns = [c[1] for c in connection.execute("PRAGMA table_info(chapters)")]
+    assert "content" not in columns
+
+    downgrade(config, "7d2a9c41b6e3")
+    rows = connection.execute("SELECT id, content FROM chapters ORDER BY id").fetchall()
+    assert rows == [(1, b"compressed"), (2, "<p>text</p>"), (3, None)]
+    connection.close()
@@ -0,0 +1,81 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from alembic.command import downgrade
+from alembic.script import ScriptDirectory
+import pytest
+
+from novelsave.migrations import commands
+
+
+def test_head_revisions():
+    config = commands.make_config(
+        Path(commands.__file__).parent, "sqlite://", "alembic.ini"
+    )
+
+    assert commands.head_revisions() == set(
+        ScriptDirectory.from_config(config).get_heads()
+    )
+
+
+def test_migrate_skips_upgrade_at_head(database_url, mocker):
+    upgrade_ = mocker.patch("alembic.command.upgrade")
+
+    assert commands.is_up_to_date(database_url)
+    commands.migrate(database_url)
+    upgrade_.assert_not_called()
+
+
+def test_migrate_upgrades_behind(database_url):
+    downgrade(
+        commands.make_config(Path(commands.__file__).parent, database_url),
+        "e5c4fb5600ea",
+    )
+
+    assert not commands.is_up_to_date(database_url)
+    commands.migrate(database_url)
+    assert commands.is_up_to_date(database_url)
+
+
+def test_current_revisions_missing_database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'data.sqlite'}"
+
+    assert commands.current_revisions(url) is None
+    assert not (tmp_path / "data.sqlite").exists()
+    assert commands.current_revisions("postgresql://localhost/novelsave") is None
+
+
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from novelsave.migrations import commands
+if sys.argv[2] == "skip":
+    commands.migrate(sys.argv[1])
+else:
+    from pathlib import Path
+    from alembic.command import upgrade
+    upgrade(commands.make_config(Path(commands.__file__).parent, sys.argv[1]), "head")
+print(time.perf_counter() - start)
+"""
+
+
+def startup_time(database_url: str, mode: str) -> float:
+    """seconds a fresh interpreter takes to bring the database schema up to date"""
+    timings = []
+    for _ in range(3):
+        output = subprocess.check_output(
+            [sys.executable, "-c", STARTUP_SCRIPT, database_url, mode]
+        )
+        timings.append(float(output))
+
+    return min(timings)
+
+
+@pytest.mark.benchmark
+def test_migrate_at_head_benchmark(database_url):
+    """startup check against the alembic upgrade it replaces, on an up to date database"""
+    skipped = startup_time(database_url, "skip")
+    upgraded = startup_time(database_url, "upgrade")
+
+    assert skipped * 5 < upgraded
@@ -0,0 +1,62 @@
+import sqlite3
+from pathlib import Path
+
+from alembic.command import downgrade, upgrade
+
+from novelsave.core.entities.novel import Chapter
+from novelsave.migrations import commands
+from novelsave.utils.helpers import compression_helper
+
+# more than a batch of the migration
+CHAPTERS = 1200
+CONTENT = "<div><p>Translator: Someone</p><p>Chapter {} of the novel.</p></div>"
+
+
+def alembic_config(database_url: str):
+    return commands.make_config(Path(commands.__file__).parent, database_url)
+
+
+def test_compress_existing_contents(database_url, session):
+    config = alembic_config(database_url)
+    downgrade(config, "0f47c495be4b")
+
+    connection = sqlite3.connect(database_url[len("sqlite:///") :])
+    with connection:
+        connection.execute("INSERT INTO novels (id, title) VALUES (1, 'Novel')")
+        connection.execute(
+            "INSERT INTO volumes (id, \"index\", name, novel_id) VALUES (1, 0, 'Volume', 1)"
+        )
+        connection.executemany(
+            'INSERT INTO chapters ("index", title, url, content, volume_id) VALUES (?, ?, ?, ?, 1)',
+            [
+                (i, f"Chapter {i}", f"https://example.com/{i}", CONTENT.format(i))
+                for i in range(CHAPTERS)
+            ]
+            + [(CHAPTERS, "Chapter", "https://example.com/pending", None)],
+        )
+
+    upgrade(config, "7d2a9c41b6e3")
+
+    rows = connection.execute(
+        'SELECT typeof(content), content FROM chapters ORDER BY "index"'
+    ).fetchall()
+    assert [t for t, _ in rows] == ["blob"] * CHAPTERS + ["null"]
+
+    (digest,) = connection.execute("SELECT digest FROM content_dictionaries").fetchone()
+    assert all(
+        value[1 : compression_helper.HEADER_SIZE] == digest
+        for _, value in rows[:CHAPTERS]
+    )
+
+    upgrade(config, "head")
+    chapters = session.query(Chapter).order_by(Chapter.index).all()
+    assert [c.content for c in chapters] == [
+        CONTENT.format(i) for i in range(CHAPTERS)
+    ] + [None]
+
+    downgrade(config, "0f47c495be4b")
+    rows = connection.execute(
+        'SELECT content FROM chapters ORDER BY "index"'
+    ).fetchall()
+    assert [c for c, in rows] == [CONTENT.format(i) for i in range(CHAPTERS)] + [None]
+    connection.close()
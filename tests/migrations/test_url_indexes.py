@@ -0,0 +1,20 @@
+import sqlite3
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT id FROM chapters WHERE url = 'https://example.com/0'",
+        "SELECT novel_id FROM novel_urls WHERE url = 'https://example.com'",
+    ],
+)
+def test_url_lookups_use_index(database_url, query):
+    connection = sqlite3.connect(database_url[len("sqlite:///") :])
+    plan = " ".join(
+        row[-1] for row in connection.execute(f"EXPLAIN QUERY PLAN {query}")
+    )
+    connection.close()
+
+    assert "USING INDEX" in plan or "USING COVERING INDEX" in plan
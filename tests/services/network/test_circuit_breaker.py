@@ -0,0 +1,88 @@
+import pytest
+import requests
+from novelsave_sources import BadResponseException
+
+from novelsave.exceptions import CircuitOpenException
+from novelsave.services.network import CircuitBreaker
+
+
+def bad_response(status_code: int) -> BadResponseException:
+    response = requests.Response()
+    response.status_code = status_code
+    return BadResponseException(response)
+
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    circuit_breaker = CircuitBreaker("Source", 3, 60, clock=clock)
+
+    circuit_breaker.record_failure(requests.Timeout())
+    circuit_breaker.record_failure(bad_response(503))
+    circuit_breaker.record_success()
+    circuit_breaker.record_failure(requests.ConnectionError())
+    circuit_breaker.record_failure(requests.ConnectionError())
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+    circuit_breaker.record_failure(requests.ConnectionError())
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenException) as e:
+        circuit_breaker.before_request()
+
+    assert e.value.source == "Source"
+    assert e.value.retry_in == 60
+
+
+def test_circuit_ignores_client_errors(clock):
+    circuit_breaker = CircuitBreaker("Source", 2, 60, clock=clock)
+
+    circuit_breaker.record_failure(requests.Timeout())
+    circuit_breaker.record_failure(bad_response(404))
+    circuit_breaker.record_failure(requests.Timeout())
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_probes_after_cooldown(clock):
+    circuit_breaker = CircuitBreaker("Source", 1, 60, clock=clock)
+    circuit_breaker.record_failure(requests.Timeout())
+
+    clock.now = 60
+    assert circuit_breaker.state == CircuitBreaker.HALF_OPEN
+
+    # a single probe is permitted
+    circuit_breaker.before_request()
+    with pytest.raises(CircuitOpenException):
+        circuit_breaker.before_request()
+
+    circuit_breaker.record_failure(requests.Timeout())
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 120
+    circuit_breaker.before_request()
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+    circuit_breaker.before_request()
+
+
+def test_circuit_disabled(clock):
+    circuit_breaker = CircuitBreaker("Source", 0, 60, clock=clock)
+
+    for _ in range(10):
+        circuit_breaker.record_failure(requests.Timeout())
+
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+    circuit_breaker.before_request()
+
+
+def test_circuit_check_does_not_claim_probe(clock):
+    circuit_breaker = CircuitBreaker("Source", 1, 60, clock=clock)
+    circuit_breaker.record_failure(requests.Timeout())
+
+    with pytest.raises(CircuitOpenException):
+        circuit_breaker.check()
+
+    clock.now = 60
+    circuit_breaker.check()
+    circuit_breaker.before_request()
+
+    with pytest.raises(CircuitOpenException):
+        circuit_breaker.check()
@@ -0,0 +1,58 @@
+from novelsave.services.network import ConcurrencyController
+
+
+def run_round(controller, clock, duration, latency=1.0, congested=False):
+    clock.now += duration
+    for _ in range(controller.limit):
+        controller.record(latency, congested)
+
+
+def test_concurrency_increases_with_throughput(clock):
+    controller = ConcurrencyController(2, 1, 5, clock=clock)
+
+    # same duration for more requests each round, throughput keeps improving
+    for _ in range(5):
+        run_round(controller, clock, 1.0)
+
+    assert controller.limit == 5
+
+
+def test_concurrency_holds_without_improvement(clock):
+    controller = ConcurrencyController(2, 1, 10, clock=clock)
+
+    run_round(controller, clock, 1.0)
+    assert controller.limit == 3
+
+    # three requests take as long as two did before, the host is saturated
+    run_round(controller, clock, 1.5)
+    assert controller.limit == 3
+
+
+def test_concurrency_halves_on_congestion(clock):
+    controller = ConcurrencyController(8, 1, 10, clock=clock)
+
+    controller.record(1.0, True)
+    controller.record(1.0, True)
+    assert controller.limit == 4
+
+
+def test_concurrency_decreases_on_latency_spike(clock):
+    controller = ConcurrencyController(4, 1, 10, clock=clock)
+
+    run_round(controller, clock, 1.0, latency=1.0)
+    assert controller.limit == 5
+
+    run_round(controller, clock, 1.0, latency=3.0)
+    assert controller.limit == 3
+
+
+def test_concurrency_bounds():
+    controller = ConcurrencyController(20, 2, 10)
+    assert controller.limit == 10
+
+    for _ in range(5):
+        controller.record(1.0, True)
+        for _ in range(controller.limit):
+            controller.record(1.0, False)
+
+    assert controller.limit == 2
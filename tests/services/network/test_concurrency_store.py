@@ -0,0 +1,26 @@
+from novelsave.services.network import ConcurrencyStore
+
+
+def test_concurrency_store(tmp_path):
+    file = tmp_path / "concurrency.json"
+
+    store = ConcurrencyStore(file)
+    assert store.get("Source") is None
+
+    store.put("Source", 12)
+    store.put("Other", 3)
+
+    store = ConcurrencyStore(file)
+    assert store.get("Source") == 12
+    assert store.get("Other") == 3
+
+
+def test_concurrency_store_malformed(tmp_path):
+    file = tmp_path / "concurrency.json"
+    file.write_text("{", encoding="utf-8")
+
+    store = ConcurrencyStore(file)
+    assert store.get("Source") is None
+
+    store.put("Source", 4)
+    assert store.get("Source") == 4
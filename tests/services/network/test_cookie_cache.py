@@ -0,0 +1,66 @@
+import stat
+
+from requests.cookies import RequestsCookieJar
+
+from novelsave.services.network import CookieCache
+
+
+def make_cookies() -> RequestsCookieJar:
+    cookies = RequestsCookieJar()
+    cookies.set("session", "a", domain=".example.com", path="/")
+    cookies.set("old", "b", domain=".example.com", path="/", expires=50)
+    return cookies
+
+
+def test_cookie_cache(tmp_path):
+    now = [0.0]
+    cookie_cache = CookieCache(tmp_path, 100, clock=lambda: now[0])
+    assert cookie_cache.get("Source", "chrome") is None
+
+    cookie_cache.put("Source", "chrome", make_cookies())
+    assert cookie_cache.get("Source", "firefox") is None
+
+    cookies = CookieCache(tmp_path, 100, clock=lambda: now[0]).get("Source", "chrome")
+    assert cookies.get("session", domain=".example.com") == "a"
+    assert cookies.get("old") == "b"
+
+    # cookies expired by the browser are dropped, then the whole entry
+    now[0] = 60
+    assert set(cookie_cache.get("Source", "chrome").keys()) == {"session"}
+
+    now[0] = 100
+    assert cookie_cache.get("Source", "chrome") is None
+
+
+def test_cookie_cache_private(tmp_path):
+    cookie_cache = CookieCache(tmp_path, 100)
+    cookie_cache.put("Source", "chrome", make_cookies())
+
+    (file,) = tmp_path.iterdir()
+    assert stat.S_IMODE(file.stat().st_mode) == 0o600
+
+
+def test_cookie_cache_invalidate(tmp_path):
+    cookie_cache = CookieCache(tmp_path, 100)
+    cookie_cache.put("Source", "chrome", make_cookies())
+    cookie_cache.invalidate("Source", "chrome")
+    cookie_cache.invalidate("Source", "chrome")
+
+    assert cookie_cache.get("Source", "chrome") is None
+
+
+def test_cookie_cache_disabled(tmp_path):
+    cookie_cache = CookieCache(tmp_path, 0)
+    cookie_cache.put("Source", "chrome", make_cookies())
+
+    assert cookie_cache.get("Source", "chrome") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_cookie_cache_malformed(tmp_path):
+    cookie_cache = CookieCache(tmp_path, 100)
+    cookie_cache.put("Source", "chrome", make_cookies())
+    (file,) = tmp_path.iterdir()
+    file.write_text("{", encoding="utf-8")
+
+    assert cookie_cache.get("Source", "chrome") is None
@@ -0,0 +1,41 @@
+import requests
+
+from novelsave.services.network import HttpSession
+
+
+def test_http_session_default_timeout(mocker):
+    request = mocker.patch.object(requests.Session, "request")
+    http_session = HttpSession(pool_size=4, timeout=10)
+
+    http_session.get("https://example.com")
+    assert request.call_args.kwargs["timeout"] == 10
+
+    http_session.get("https://example.com", timeout=1)
+    assert request.call_args.kwargs["timeout"] == 1
+
+
+def test_http_session_pool_size():
+    http_session = HttpSession(pool_size=12, timeout=10)
+
+    for prefix in ("https://", "http://"):
+        assert http_session.get_adapter(prefix + "example.com")._pool_maxsize == 12
+
+
+def test_http_session_cached_get(mocker):
+    response_cache = mocker.Mock()
+    request = mocker.patch.object(requests.Session, "request")
+    http_session = HttpSession(pool_size=4, timeout=10, response_cache=response_cache)
+
+    http_session.get("https://example.com/a")
+    response_cache.fetch.assert_called_once()
+    request.assert_not_called()
+
+
+def test_http_session_streamed_get_bypasses_cache(mocker):
+    response_cache = mocker.Mock()
+    request = mocker.patch.object(requests.Session, "request")
+    http_session = HttpSession(pool_size=4, timeout=10, response_cache=response_cache)
+
+    http_session.get("https://example.com/a.png", stream=True)
+    response_cache.fetch.assert_not_called()
+    assert request.call_args.kwargs["stream"] is True
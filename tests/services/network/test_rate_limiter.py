@@ -0,0 +1,55 @@
+import pytest
+
+from novelsave.services.network import RateLimiter, TokenBucket
+
+
+def test_token_bucket_burst(clock):
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_refill(clock):
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now = 1.0
+    assert bucket.reserve() == 0
+
+    # refill never exceeds capacity
+    clock.now = 100.0
+    assert [bucket.reserve() for _ in range(2)] == [0, 0]
+    assert bucket.reserve() > 0
+
+
+def test_rate_limiter_per_host():
+    rate_limiter = RateLimiter(rate=1, burst=1)
+
+    first = rate_limiter.bucket("https://a.site/chapter-1")
+    assert rate_limiter.bucket("https://A.site/chapter-2") is first
+    assert rate_limiter.bucket("https://b.site/chapter-1") is not first
+
+
+def test_rate_limiter_disabled(mocker):
+    sleep = mocker.patch("novelsave.services.network.rate_limiter.time.sleep")
+    rate_limiter = RateLimiter(rate=0, burst=1)
+
+    assert not rate_limiter.is_enabled
+    for _ in range(5):
+        assert rate_limiter.acquire("https://a.site/") == 0
+
+    sleep.assert_not_called()
+
+
+def test_rate_limiter_acquire_waits(mocker):
+    sleep = mocker.patch("novelsave.services.network.rate_limiter.time.sleep")
+    rate_limiter = RateLimiter(rate=10, burst=1)
+
+    rate_limiter.acquire("https://a.site/")
+    sleep.assert_not_called()
+
+    assert rate_limiter.acquire("https://a.site/") > 0
+    sleep.assert_called_once()
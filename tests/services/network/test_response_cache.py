@@ -0,0 +1,94 @@
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from novelsave.services.network import ResponseCache
+
+
+def make_response(status=200, content=b"body", **headers) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(
+        {k.replace("_", "-"): v for k, v in headers.items()}
+    )
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+def test_response_cache_revalidates(tmp_path):
+    cache = ResponseCache(tmp_path, 1024)
+    sent = []
+
+    def send(headers):
+        sent.append(headers)
+        if len(sent) == 1:
+            return make_response(ETag='"v1"', Last_Modified="yesterday")
+        return make_response(304, b"")
+
+    assert cache.fetch("https://a/1", send).content == b"body"
+    response = cache.fetch("https://a/1", send)
+
+    assert sent[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "yesterday"}
+    assert response.status_code == 200
+    assert response.content == b"body"
+
+
+def test_response_cache_fresh(tmp_path, clock):
+    cache = ResponseCache(tmp_path, 1024, clock=clock)
+    sent = []
+
+    def send(headers):
+        sent.append(headers)
+        return make_response(Cache_Control="max-age=60")
+
+    cache.fetch("https://a/1", send)
+    clock.now = 59
+    cache.fetch("https://a/1", send)
+    assert len(sent) == 1
+
+    clock.now = 61
+    cache.fetch("https://a/1", send)
+    assert len(sent) == 2
+
+
+def test_response_cache_not_cacheable(tmp_path):
+    cache = ResponseCache(tmp_path, 1024)
+    cache.fetch(
+        "https://a/1", lambda _: make_response(ETag='"v1"', Cache_Control="no-store")
+    )
+
+    assert cache._lookup("https://a/1") is None
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path, clock):
+    cache = ResponseCache(tmp_path, 8 * 40, clock=clock)
+
+    for i, url in enumerate(["https://a/1", "https://a/2", "https://a/3"]):
+        clock.now = i
+        cache.fetch(url, lambda _: make_response(content=bytes([i]) * 40, ETag="v"))
+
+    # shares the body of the first url, hence takes no additional space
+    clock.now = 3
+    cache.fetch(
+        "https://a/4", lambda _: make_response(content=bytes([0]) * 40, ETag="v")
+    )
+
+    for i in range(5, 11):
+        clock.now = i
+        cache.fetch(
+            f"https://b/{i}", lambda _: make_response(content=bytes([i]) * 40, ETag="v")
+        )
+
+    assert cache._lookup("https://a/2") is None
+    # the first url was evicted, though its body remains in use by the fourth
+    assert cache._lookup("https://a/1") is None
+    assert cache._lookup("https://a/4") is not None
+    assert cache._lookup("https://b/10") is not None
+    assert len(list((tmp_path / "http" / "objects").glob("*/*"))) <= 8
+
+
+def test_response_cache_disabled(tmp_path):
+    cache = ResponseCache(tmp_path, 0)
+
+    assert cache.fetch("https://a/1", lambda _: make_response(ETag="v")).ok
+    assert not (tmp_path / "http").exists()
@@ -0,0 +1,66 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+import requests
+from novelsave_sources import BadResponseException
+
+from novelsave.services.network import RetryPolicy
+
+
+@pytest.fixture
+def retry_policy():
+    return RetryPolicy(attempts=3, backoff=1, max_backoff=4, cooldown=60)
+
+
+def bad_response(status_code: int):
+    return BadResponseException(Mock(status_code=status_code))
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        requests.Timeout(),
+        requests.ConnectionError(),
+        ConnectionError("HTML document was not loaded correctly."),
+        bad_response(429),
+        bad_response(503),
+    ],
+)
+def test_transient(retry_policy, exception):
+    assert retry_policy.is_transient(exception)
+    assert not retry_policy.is_permanent(exception)
+
+
+@pytest.mark.parametrize("exception", [bad_response(404), bad_response(410)])
+def test_permanent(retry_policy, exception):
+    assert not retry_policy.is_transient(exception)
+    assert retry_policy.is_permanent(exception)
+
+
+def test_unknown_error(retry_policy):
+    exception = AttributeError("'NoneType' object has no attribute 'text'")
+
+    assert not retry_policy.is_transient(exception)
+    assert not retry_policy.is_permanent(exception)
+
+
+def test_should_retry(retry_policy):
+    exception = requests.Timeout()
+
+    assert retry_policy.should_retry(exception, 1)
+    assert retry_policy.should_retry(exception, 2)
+    assert not retry_policy.should_retry(exception, 3)
+    assert not retry_policy.should_retry(bad_response(404), 1)
+
+
+def test_delay_bounds(retry_policy):
+    for attempt in range(1, 10):
+        ceiling = min(4, 2 ** (attempt - 1))
+        assert 0 <= retry_policy.delay(attempt) <= ceiling
+
+
+def test_cooldown(retry_policy):
+    assert retry_policy.cooldown(1) == timedelta(seconds=60)
+    assert retry_policy.cooldown(3) == timedelta(seconds=240)
+    assert retry_policy.cooldown(100) == RetryPolicy.max_cooldown
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+from novelsave.core.entities.novel import Asset
+from novelsave.services import FileService
+from novelsave.services.novel import AssetDownloader
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    return tmp_path
+
+
+@pytest.fixture
+def asset_service(mocker):
+    return mocker.Mock()
+
+
+@pytest.fixture
+def path_service(mocker, data_dir):
+    path_service = mocker.Mock()
+    path_service.asset_path.side_effect = lambda _, a: data_dir / "1" / f"{a.id}.png"
+    path_service.relative_to_data_dir.side_effect = lambda p: p.relative_to(data_dir)
+    return path_service
+
+
+def make_downloader(mocker, asset_service, path_service, responses, max_size=0):
+    def get(url, **kwargs):
+        status, body = responses[url]
+        response = mocker.MagicMock(ok=status == 200, status_code=status, reason="")
+        response.headers = {"Content-Length": str(len(body))}
+        response.iter_content.return_value = [body[:2], body[2:]]
+        response.__enter__.return_value = response
+        return response
+
+    http_session = mocker.Mock()
+    http_session.get.side_effect = get
+
+    return AssetDownloader(
+        asset_service, path_service, FileService(), http_session, 4, 2, max_size
+    )
+
+
+def test_download(mocker, asset_service, path_service, data_dir):
+    assets = [Asset(id=1, url="https://a/1.png"), Asset(id=2, url="https://a/2.png")]
+    responses = {"https://a/1.png": (200, b"image"), "https://a/2.png": (404, b"")}
+    downloader = make_downloader(mocker, asset_service, path_service, responses)
+
+    results = dict(downloader.download(mocker.Mock(), assets))
+
+    assert results[assets[0]] is None
+    assert results[assets[1]].reason.startswith("404")
+    assert (data_dir / "1" / "1.png").read_bytes() == b"image"
+    asset_service.update_asset_paths.assert_called_once_with(
+        {1: str(Path("1") / "1.png")}
+    )
+
+
+def test_download_max_size(mocker, asset_service, path_service, data_dir):
+    assets = [Asset(id=1, url="https://a/1.png")]
+    responses = {"https://a/1.png": (200, b"image")}
+    downloader = make_downloader(
+        mocker, asset_service, path_service, responses, max_size=4
+    )
+
+    [(_, error)] = downloader.download(mocker.Mock(), assets)
+
+    assert "maximum size" in error.reason
+    assert not (data_dir / "1" / "1.png").exists()
+    asset_service.update_asset_paths.assert_called_once_with({})
@@ -0,0 +1,57 @@
+from novelsave.core.dtos import ChapterDTO
+from novelsave.core.entities.novel import Asset
+from novelsave.services.novel import AssetService
+
+
+def make_chapter(content: str) -> ChapterDTO:
+    return ChapterDTO(
+        index=0, title="c0", url="https://example.com/c/0", content=content
+    )
+
+
+def test_extract_assets(mocker):
+    asset_service = AssetService(mocker.Mock(), mocker.Mock())
+    chapter = make_chapter(
+        '<p>text</p><img src="/a.png" alt="a"/><img src="https://cdn.example.com/b.png"/><img src="/a.png"/>'
+    )
+
+    html, assets = asset_service.extract_assets(chapter)
+
+    assert [a.url for a in assets] == [
+        "https://example.com/a.png",
+        "https://cdn.example.com/b.png",
+    ]
+    assert [a.name for a in assets] == ["a", "[Unspecified]"]
+    assert html == (
+        '<p>text</p><img alt="a" src="{asset0}"/><img src="{asset1}"/><img src="{asset0}"/>'
+    )
+
+
+def test_extract_assets_none(mocker):
+    asset_service = AssetService(mocker.Mock(), mocker.Mock())
+    chapter = make_chapter("<p>text</p>")
+
+    assert asset_service.extract_assets(chapter) == ("<p>text</p>", [])
+
+
+def test_register_assets(mocker):
+    asset_service = AssetService(mocker.Mock(), mocker.Mock())
+    assets = [
+        Asset(url="https://example.com/a.png"),
+        Asset(url="https://example.com/b.png"),
+    ]
+    mocker.patch.object(
+        asset_service,
+        "update_assets",
+        return_value={
+            "https://example.com/a.png": Asset(id=4),
+            "https://example.com/b.png": Asset(id=7),
+        },
+    )
+
+    html = asset_service.register_assets(
+        mocker.Mock(id=1), '<img src="{asset1}"/><img src="{asset0}"/>', assets
+    )
+
+    assert html == '<img src="{id7}"/><img src="{id4}"/>'
+    assert all(a.novel_id == 1 for a in assets)
@@ -0,0 +1,131 @@
+import threading
+
+import pytest
+
+from novelsave.core.dtos import ChapterDTO
+from novelsave.exceptions import ContentUpdateFailedException
+from novelsave.services.novel import ChapterWriter
+
+
+def make_writer(mocker, batch_size=2, interval=60.0, on_written=None):
+    novel = mocker.Mock(id=1)
+    session = mocker.Mock()
+    novel_service = mocker.Mock()
+    asset_service = mocker.Mock()
+    asset_service.collect_assets.side_effect = lambda _, dto: dto.content
+    failure_service = mocker.Mock()
+
+    writer = ChapterWriter(
+        novel,
+        session,
+        novel_service,
+        asset_service,
+        failure_service,
+        batch_size,
+        interval,
+        on_written,
+    )
+    return writer, novel_service, failure_service
+
+
+def make_chapter(index: int) -> ChapterDTO:
+    return ChapterDTO(
+        index=index, title=f"c{index}", url=f"https://example.com/{index}", content="c"
+    )
+
+
+def test_chapter_writer_batches(mocker):
+    writer, novel_service, failure_service = make_writer(mocker, batch_size=2)
+
+    with writer:
+        for i in range(5):
+            writer.put(make_chapter(i))
+
+    batches = [len(c.args[0]) for c in novel_service.update_contents.call_args_list]
+    assert batches == [2, 2, 1]
+    assert writer.written == 5
+
+
+def test_chapter_writer_notifies_written(mocker):
+    on_written = mocker.Mock()
+    writer, novel_service, _ = make_writer(mocker, batch_size=2, on_written=on_written)
+
+    with writer:
+        for i in range(3):
+            writer.put(make_chapter(i))
+
+    assert on_written.call_count == novel_service.update_contents.call_count == 2
+
+
+def test_chapter_writer_records_failures(mocker):
+    writer, novel_service, failure_service = make_writer(mocker)
+    chapter = make_chapter(0)
+    error = ValueError()
+
+    with writer:
+        writer.put_failure(ContentUpdateFailedException(chapter, error, 2))
+
+    failure_service.record_failure.assert_called_once_with(
+        chapter, error, 2, commit=False
+    )
+    assert writer.written == 0
+
+
+def test_chapter_writer_commits_once_per_batch(mocker):
+    writer, novel_service, failure_service = make_writer(mocker, batch_size=3)
+
+    with writer:
+        writer.put_failure(
+            ContentUpdateFailedException(make_chapter(0), ValueError(), 1)
+        )
+        writer.put_failure(
+            ContentUpdateFailedException(make_chapter(1), ValueError(), 1)
+        )
+        writer.put(make_chapter(2))
+
+    assert failure_service.record_failure.call_count == 2
+    assert all(
+        c.kwargs == {"commit": False}
+        for c in failure_service.record_failure.call_args_list
+    )
+    failure_service.clear_failures.assert_called_once_with(
+        [make_chapter(2)], commit=False
+    )
+    assert writer.session.commit.call_count == 1
+
+
+def test_chapter_writer_raises_write_errors(mocker):
+    writer, novel_service, _ = make_writer(mocker, batch_size=1)
+    novel_service.update_contents.side_effect = RuntimeError("database is locked")
+
+    with pytest.raises(RuntimeError):
+        with writer:
+            writer.put(make_chapter(0))
+
+
+def test_chapter_writer_bounds_queue(mocker):
+    writer, novel_service, _ = make_writer(mocker, batch_size=1)
+    release = threading.Event()
+    novel_service.update_contents.side_effect = lambda *_: release.wait()
+
+    queued = threading.Event()
+    released_on_put = []
+
+    def produce():
+        for i in range(5):
+            writer.put(make_chapter(i))
+            released_on_put.append(release.is_set())
+            if i == 2:
+                queued.set()
+
+    with writer:
+        producer = threading.Thread(target=produce)
+        producer.start()
+
+        queued.wait()
+        release.set()
+        producer.join()
+
+    # the writer holds one chapter and two more are queued, the rest wait for the writer
+    assert released_on_put == [False, False, False, True, True]
+    assert novel_service.update_contents.call_count == 5
@@ -0,0 +1,85 @@
+from datetime import datetime
+
+import requests
+from novelsave_sources import BadResponseException
+
+from novelsave.core.dtos import ChapterDTO
+from novelsave.services.network import RetryPolicy
+from novelsave.services.novel import FailureService
+
+
+def make_chapter(index: int) -> ChapterDTO:
+    return ChapterDTO(
+        index=index, title=f"Chapter {index}", url=f"https://example.com/novel/{index}"
+    )
+
+
+def make_failure_service(session) -> FailureService:
+    return FailureService(session, RetryPolicy(3, 1, 60, 3600))
+
+
+def bad_response(status_code: int) -> BadResponseException:
+    response = requests.Response()
+    response.status_code = status_code
+    return BadResponseException(response)
+
+
+def test_record_failure_accumulates_attempts(session, insert_novel):
+    novel = insert_novel(3)
+    failure_service = make_failure_service(session)
+
+    failure_service.record_failure(make_chapter(0), requests.Timeout(), 3)
+    failure = failure_service.record_failure(make_chapter(0), requests.Timeout(), 2)
+
+    assert failure.attempts == 5
+    assert failure.reason.startswith("Timeout")
+    assert not failure.is_permanent
+    assert failure.retry_after > datetime.utcnow()
+    assert len(failure_service.get_failures(novel)) == 1
+
+
+def test_record_failure_permanent(session, insert_novel):
+    insert_novel(3)
+    failure_service = make_failure_service(session)
+
+    failure = failure_service.record_failure(make_chapter(1), bad_response(404), 1)
+
+    assert failure.is_permanent
+    assert failure.retry_after is None
+
+
+def test_record_failure_unknown_chapter(session, insert_novel):
+    novel = insert_novel(3)
+    failure_service = make_failure_service(session)
+
+    chapter = ChapterDTO(index=0, title="Missing", url="https://example.com/missing")
+    assert failure_service.record_failure(chapter, requests.Timeout(), 1) is None
+    assert failure_service.get_failures(novel) == []
+
+
+def test_record_failure_uncommitted(session, insert_novel):
+    novel = insert_novel(3)
+    failure_service = make_failure_service(session)
+
+    failure_service.record_failure(make_chapter(0), requests.Timeout(), 1, commit=False)
+    failure = failure_service.record_failure(
+        make_chapter(0), requests.Timeout(), 1, commit=False
+    )
+    assert failure.attempts == 2
+
+    session.rollback()
+    assert failure_service.get_failures(novel) == []
+
+
+def test_clear_failures_chunked(session, insert_novel):
+    novel = insert_novel(5)
+    failure_service = make_failure_service(session)
+    failure_service.chunk_size = 2
+
+    for i in range(5):
+        failure_service.record_failure(make_chapter(i), requests.Timeout(), 1)
+
+    failure_service.clear_failures([make_chapter(i) for i in range(4)])
+
+    failures = failure_service.get_failures(novel)
+    assert [f.chapter.index for f in failures] == [4]
@@ -0,0 +1,462 @@
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Tuple
+
+import pytest
+from sqlalchemy import event, insert, select, text
+
+from novelsave.core.dtos import ChapterDTO, NovelDTO, VolumeDTO
+from novelsave.core.entities.novel import (
+    Chapter,
+    ChapterContent,
+    ChapterFailure,
+    Novel,
+    Volume,
+)
+
+
+def test_get_pending_chapters_skips_failures(session, novel_service, insert_novel):
+    novel = insert_novel(4)
+    chapters = {c.index: c for c in novel_service.get_chapters(novel)}
+
+    session.add_all(
+        [
+            ChapterFailure(chapter_id=chapters[0].id, attempts=1, is_permanent=True),
+            ChapterFailure(
+                chapter_id=chapters[1].id,
+                attempts=1,
+                retry_after=datetime.utcnow() + timedelta(hours=1),
+            ),
+            ChapterFailure(
+                chapter_id=chapters[2].id,
+                attempts=1,
+                retry_after=datetime.utcnow() - timedelta(hours=1),
+            ),
+        ]
+    )
+    session.commit()
+
+    pending = novel_service.get_pending_chapters(novel)
+    assert sorted(c.index for c in pending) == [2, 3]
+
+    pending = novel_service.get_pending_chapters(novel, include_failed=True)
+    assert sorted(c.index for c in pending) == [0, 1, 2, 3]
+
+    assert len(novel_service.get_pending_chapters(novel, 1)) == 1
+
+
+def test_update_contents_compressed(session, novel_service, insert_novel):
+    novel_service.compression = "zlib"
+    novel = insert_novel(10)
+    contents = {i: f"<p>Chapter {i} of the novel.</p>" * 10 for i in range(10)}
+
+    novel_service.update_contents(
+        [
+            ChapterDTO(
+                index=i,
+                title=f"Chapter {i}",
+                url=f"https://example.com/novel/{i}",
+                content=contents[i],
+            )
+            for i in range(9)
+        ],
+        novel,
+    )
+    novel_service.update_content(
+        ChapterDTO(
+            index=9,
+            title="Chapter 9",
+            url="https://example.com/novel/9",
+            content=contents[9],
+        ),
+        novel,
+    )
+
+    # stored compressed with the dictionary trained from the first chapters
+    stored = session.execute(select(ChapterContent.content)).scalars().all()
+    assert all(isinstance(value, bytes) for value in stored)
+    assert novel.content_dictionary is not None
+    assert all(
+        value[1:9] == novel.content_dictionary.digest for value in stored
+    ), "compressed with the dictionary"
+
+    session.expire_all()
+    chapters = [c for _, c in novel_service.iter_chapters(novel)]
+    assert {c.index: c.content for c in chapters} == contents
+    assert novel_service.get_pending_chapters(novel) == []
+
+    novel_service.delete_content(novel)
+    assert len(novel_service.get_pending_chapters(novel)) == 10
+
+
+def test_update_contents_compressed_zstd(session, novel_service, insert_novel):
+    pytest.importorskip("zstandard")
+    novel_service.compression = "zstd"
+    novel = insert_novel(10)
+    contents = {i: f"<p>Chapter {i} of the novel.</p>" * 10 for i in range(10)}
+
+    novel_service.update_contents(
+        [
+            ChapterDTO(
+                index=i,
+                title=f"Chapter {i}",
+                url=f"https://example.com/novel/{i}",
+                content=contents[i],
+            )
+            for i in range(10)
+        ],
+        novel,
+    )
+
+    stored = session.execute(select(ChapterContent.content)).scalars().all()
+    assert all(isinstance(value, bytes) for value in stored)
+
+    session.expire_all()
+    assert {c.index: c.content for c in novel_service.get_chapters(novel)} == contents
+
+
+def test_update_contents_too_few_samples(session, novel_service, insert_novel):
+    novel_service.compression = "zlib"
+    novel = insert_novel(2)
+
+    novel_service.update_contents(
+        [
+            ChapterDTO(
+                index=i,
+                title=f"Chapter {i}",
+                url=f"https://example.com/novel/{i}",
+                content="<p>text</p>",
+            )
+            for i in range(2)
+        ],
+        novel,
+    )
+
+    assert novel.content_dictionary is None
+    assert [c.content for c in novel_service.get_chapters(novel)] == ["<p>text</p>"] * 2
+
+
+def test_chapter_contents_kept_apart(session, novel_service, insert_novel):
+    novel = insert_novel(3)
+    url = "https://example.com/novel/{}"
+
+    novel_service.update_content(
+        ChapterDTO(index=0, title="", url=url.format(0), content="a")
+    )
+    novel_service.update_contents(
+        [
+            ChapterDTO(index=0, title="", url=url.format(0), content="b"),
+            ChapterDTO(index=1, title="", url=url.format(1), content="c"),
+        ]
+    )
+    session.expire_all()
+
+    # the table of contents does not load the content
+    chapters = novel_service.get_chapters(novel)
+    assert all("body" not in c.__dict__ for c in chapters)
+    assert {c.index: c.content for c in chapters} == {0: "b", 1: "c", 2: None}
+
+    assert [c.index for c in novel_service.get_pending_chapters(novel)] == [2]
+    assert session.query(ChapterContent).count() == 2
+
+    # removed along with the chapter
+    session.delete(next(c for c in chapters if c.index == 0))
+    session.commit()
+    assert session.query(ChapterContent).count() == 1
+
+
+def add_library_chapters(session, chapters: int):
+    """grow the library with a novel of the given number of chapters"""
+    novel = Novel(title="Library")
+    volume = Volume(index=0, name="Volume", novel=novel)
+    session.add_all([novel, volume])
+    session.flush()
+
+    session.execute(
+        insert(Chapter),
+        [
+            {
+                "index": i,
+                "title": f"Chapter {i}",
+                "url": f"https://example.com/library/{volume.id}/{i}",
+                "volume_id": volume.id,
+            }
+            for i in range(chapters)
+        ],
+    )
+    session.commit()
+
+
+def write_cost(novel_service, novel) -> float:
+    """seconds taken to write the content of each chapter of the novel on its own"""
+    chapters = novel_service.get_chapters(novel)
+
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for chapter in chapters:
+            novel_service.update_content(
+                ChapterDTO(index=chapter.index, title="", url=chapter.url, content="a")
+            )
+        timings.append(time.perf_counter() - start)
+
+    return min(timings) / len(chapters)
+
+
+@pytest.mark.benchmark
+def test_update_content_cost_benchmark(session, novel_service, insert_novel):
+    """per chapter write cost as the library grows"""
+    # leaves the cost of syncing to disk out of the measurement
+    session.execute(text("PRAGMA synchronous=OFF"))
+    novel = insert_novel(50)
+
+    add_library_chapters(session, 1000)
+    small = write_cost(novel_service, novel)
+
+    add_library_chapters(session, 50000)
+    large = write_cost(novel_service, novel)
+
+    assert large < small * 2
+
+
+def test_get_chapter_counts(session, novel_service, insert_novel):
+    novel = insert_novel(5)
+    insert_novel(2, url="https://example.com/other")
+    url = "https://example.com/novel/{}"
+
+    novel_service.update_contents(
+        [ChapterDTO(index=i, title="", url=url.format(i), content="a") for i in (0, 1)]
+    )
+    chapters = {c.index: c for c in novel_service.get_chapters(novel)}
+    session.add_all(
+        [
+            ChapterFailure(chapter_id=chapters[1].id, attempts=1),
+            ChapterFailure(chapter_id=chapters[2].id, attempts=1, is_permanent=True),
+        ]
+    )
+    session.commit()
+
+    counts = novel_service.get_chapter_counts(novel)
+    assert (counts.total, counts.downloaded, counts.failed) == (5, 2, 1)
+    assert counts.pending == 3
+
+
+def test_get_novel_listing(novel_service, insert_novel):
+    first = insert_novel(1)
+    second = insert_novel(1, url="https://example.com/second")
+    novel_service.add_url(first, "https://example.com/mirror")
+
+    listing = novel_service.get_novel_listing()
+    assert [(n.id, n.title, n.url) for n in listing] == [
+        (first.id, "Novel", "https://example.com/novel"),
+        (second.id, "Novel", "https://example.com/second"),
+    ]
+
+
+def test_update_chapters(session, novel_service, insert_novel):
+    novel = insert_novel(3)
+    url = "https://example.com/novel/{}"
+    novel_service.update_contents(
+        [
+            ChapterDTO(index=i, title="", url=url.format(i), content="a")
+            for i in range(3)
+        ]
+    )
+
+    # chapter 0 is removed, 2 moves to a new volume and 3 is new
+    novel_service.update_chapters(
+        novel,
+        [
+            VolumeDTO(
+                id=None,
+                index=0,
+                name="Volume",
+                chapters=[ChapterDTO(index=0, title="Chapter 1", url=url.format(1))],
+            ),
+            VolumeDTO(
+                id=None,
+                index=1,
+                name="Volume 2",
+                chapters=[
+                    ChapterDTO(index=0, title="Chapter 2", url=url.format(2)),
+                    ChapterDTO(index=1, title="Chapter 3", url=url.format(3)),
+                ],
+            ),
+        ],
+    )
+
+    volumes = {v.id: v.index for v in novel_service.get_volumes(novel)}
+    toc = {
+        c.url: (volumes[c.volume_id], c.index)
+        for c in novel_service.get_chapters(novel)
+    }
+    assert toc == {
+        url.format(1): (0, 0),
+        url.format(2): (1, 0),
+        url.format(3): (1, 1),
+    }
+    assert session.query(ChapterContent).count() == 2
+
+
+def test_update_chapters_renumbered(session, novel_service, insert_novel):
+    novel = insert_novel(4)
+    other = insert_novel(2, url="https://example.com/other")
+    url = "https://example.com/novel/{}"
+    novel_service.update_contents(
+        [ChapterDTO(index=0, title="", url=url.format(0), content="a")]
+    )
+
+    # chapters 0 and 1 swap places, the rest move along behind a new chapter
+    chapters = [4, 1, 0, 2, 3]
+    novel_service.update_chapters(
+        novel,
+        [
+            VolumeDTO(
+                id=None,
+                index=0,
+                name="Volume",
+                chapters=[
+                    ChapterDTO(index=i, title="", url=url.format(c))
+                    for i, c in enumerate(chapters)
+                ],
+            )
+        ],
+    )
+
+    toc = sorted(novel_service.get_chapters(novel), key=lambda c: c.index)
+    assert [c.url for c in toc] == [url.format(c) for c in chapters]
+    assert [c.index for c in toc] == list(range(5))
+    assert novel_service.get_chapter_counts(novel).downloaded == 1
+    assert len(novel_service.get_chapters(other)) == 2
+
+
+def renumber(session, novel_service, chapters: int) -> Tuple[float, int]:
+    """seconds and statements taken to renumber the novel after a chapter is found at its start
+
+    an executemany counts as a single statement.
+    """
+    novel = novel_service.insert_novel(
+        NovelDTO(id=None, title="Novel", url=f"https://example.com/{chapters}")
+    )
+    url = f"https://example.com/{chapters}/{{}}"
+
+    def toc(urls):
+        chapter_dtos = [
+            ChapterDTO(index=i, title=f"Chapter {u}", url=url.format(u))
+            for i, u in enumerate(urls)
+        ]
+        return [VolumeDTO(id=None, index=0, name="Volume", chapters=chapter_dtos)]
+
+    novel_service.update_chapters(novel, toc(range(chapters)))
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(session.bind, "before_cursor_execute", count)
+    try:
+        start = time.perf_counter()
+        novel_service.update_chapters(novel, toc([-1, *range(chapters)]))
+        cost = time.perf_counter() - start
+    finally:
+        event.remove(session.bind, "before_cursor_execute", count)
+
+    indexes = {c.url: c.index for c in novel_service.get_chapters(novel)}
+    assert indexes == {url.format(u): u + 1 for u in range(-1, chapters)}
+    return cost, len(statements)
+
+
+def test_update_chapters_statements(session, novel_service):
+    """renumbering takes the same statements however many chapters the novel has"""
+    _, small = renumber(session, novel_service, 20)
+    _, large = renumber(session, novel_service, 2000)
+
+    assert small == large
+
+
+@pytest.mark.benchmark
+def test_update_chapters_renumbering_benchmark(session, novel_service):
+    """renumbering every chapter of a novel as it grows"""
+    session.execute(text("PRAGMA synchronous=OFF"))
+
+    small, _ = renumber(session, novel_service, 2000)
+    large, _ = renumber(session, novel_service, 20000)
+
+    # ten times the chapters, within the noise of linear time
+    assert large < small * 25
+
+
+def test_iter_chapters(session, novel_service, insert_novel):
+    novel = insert_novel(0)
+    url = "https://example.com/novel/{}/{}"
+    volumes = [
+        VolumeDTO(
+            id=None,
+            index=v,
+            name=f"Volume {v}",
+            chapters=[
+                ChapterDTO(index=c, title="", url=url.format(v, c))
+                for c in reversed(range(4))
+            ],
+        )
+        for v in reversed(range(3))
+    ]
+    novel_service.update_chapters(novel, volumes)
+    novel_service.update_contents(
+        [
+            ChapterDTO(index=c, title="", url=url.format(v, c), content=f"{v}.{c}")
+            for v in range(3)
+            for c in range(3)
+        ]
+    )
+    session.expire_all()
+
+    chapters = novel_service.iter_chapters(novel, batch_size=2)
+    assert [(v.index, c.index, c.content) for v, c in chapters] == [
+        (v, c, f"{v}.{c}") for v in range(3) for c in range(3)
+    ]
+
+
+def iteration_peak_memory(novel_service, chapters: int) -> int:
+    """peak memory allocated while iterating the content of a novel with the chapters"""
+    url = f"https://example.com/{chapters}"
+    novel = novel_service.insert_novel(NovelDTO(id=None, title="Novel", url=url))
+    novel_service.update_chapters(
+        novel,
+        [
+            VolumeDTO(
+                id=None,
+                index=0,
+                name="Volume",
+                chapters=[
+                    ChapterDTO(index=i, title="", url=f"{url}/{i}")
+                    for i in range(chapters)
+                ],
+            )
+        ],
+    )
+    novel_service.update_contents(
+        [
+            ChapterDTO(index=i, title="", url=f"{url}/{i}", content=f"<p>{i}</p>" * 500)
+            for i in range(chapters)
+        ]
+    )
+    novel_service.session.expire_all()
+
+    tracemalloc.start()
+    try:
+        for _, chapter in novel_service.iter_chapters(novel):
+            assert chapter.content
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.benchmark
+def test_iter_chapters_memory_bounded(novel_service):
+    small = iteration_peak_memory(novel_service, 200)
+    large = iteration_peak_memory(novel_service, 2000)
+
+    assert large < small * 2
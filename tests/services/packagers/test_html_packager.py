@@ -0,0 +1,31 @@
+from unittest.mock import Mock
+
+from novelsave.services import FileService
+from novelsave.services.packagers import HtmlPackager
+from novelsave.settings import STATIC_DIR
+from .test_text_packager import insert_downloaded_novel
+
+
+def test_package(tmp_path, novel_service, insert_novel):
+    novel = insert_downloaded_novel(novel_service, insert_novel, 3)
+    path_service = Mock()
+    path_service.novel_save_path.return_value = tmp_path / "Novel"
+    asset_service = Mock()
+    asset_service.downloaded_assets.return_value = []
+    asset_service.inject_assets.side_effect = lambda content, mapping: content
+    config_service = Mock()
+    config_service.get_config.return_value = "1rem"
+
+    html_file = HtmlPackager(
+        STATIC_DIR,
+        novel_service,
+        FileService(),
+        path_service,
+        asset_service,
+        config_service,
+    ).package(novel)
+
+    html = html_file.read_text(encoding="utf-8")
+    positions = [html.index(f"Paragraph of chapter {i}.") for i in range(3)]
+    assert positions == sorted(positions)
+    assert html.rstrip().endswith("</html>")
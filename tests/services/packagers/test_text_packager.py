@@ -0,0 +1,43 @@
+from unittest.mock import Mock
+
+from novelsave.core.dtos import ChapterDTO
+from novelsave.services import FileService
+from novelsave.services.packagers import TextPackager
+
+
+def make_packager(novel_service, tmp_path):
+    path_service = Mock()
+    path_service.novel_save_path.return_value = tmp_path / "Novel"
+    return TextPackager(novel_service, FileService(), path_service)
+
+
+def insert_downloaded_novel(novel_service, insert_novel, chapters: int):
+    url = f"https://example.com/{chapters}"
+    novel = insert_novel(chapters, url=url)
+    novel.synopsis = ""
+    novel_service.update_contents(
+        [
+            ChapterDTO(
+                index=i,
+                title=f"Chapter {i}",
+                url=f"{url}/{i}",
+                content=f"<p>Paragraph of chapter {i}.</p>" * 10,
+            )
+            for i in range(chapters)
+        ]
+    )
+    return novel
+
+
+def test_package(tmp_path, novel_service, insert_novel):
+    novel = insert_downloaded_novel(novel_service, insert_novel, 3)
+
+    folder = make_packager(novel_service, tmp_path).package(novel)
+
+    assert sorted(p.name for p in folder.iterdir()) == [
+        "_preface.txt",
+        "v00c0000.txt",
+        "v00c0001.txt",
+        "v00c0002.txt",
+    ]
+    assert "Paragraph of chapter 1." in (folder / "v00c0001.txt").read_text()
@@ -0,0 +1,154 @@
+import asyncio
+from concurrent import futures
+from unittest.mock import Mock
+
+import aiohttp
+import pytest
+import requests
+from novelsave_sources import BadResponseException
+from requests.cookies import RequestsCookieJar
+
+from novelsave.core.dtos import ChapterDTO
+from novelsave.services.source import AsyncSourceGateway, PrefetchedHttpGateway
+
+
+class FakeClientResponse:
+    def __init__(self, status: int, body: bytes = b"", headers: dict = None):
+        self.url = "https://example.com/c1"
+        self.status = status
+        self.reason = "OK" if status < 400 else "Error"
+        self.headers = headers or {}
+        self.charset = "utf-8"
+        self.body = body
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+class FakeClientSession:
+    def __init__(self, result):
+        self.result = result
+        self.headers = []
+
+    def get(self, url, headers=None):
+        self.headers.append(headers)
+        session = self
+
+        class Context:
+            async def __aenter__(self):
+                if isinstance(session.result, BaseException):
+                    raise session.result
+                return session.result
+
+            async def __aexit__(self, *args):
+                return False
+
+        return Context()
+
+
+def make_response(status_code: int, headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+def make_chapter() -> ChapterDTO:
+    return ChapterDTO(index=1, title="c1", url="https://example.com/c1")
+
+
+@pytest.fixture
+def http_gateway():
+    http_gateway = Mock()
+    http_gateway.cookies = RequestsCookieJar()
+    return http_gateway
+
+
+@pytest.fixture
+def async_source_gateway(http_gateway):
+    source_gateway = Mock()
+    source_gateway.source.http_gateway = http_gateway
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        yield AsyncSourceGateway(source_gateway, executor, connections=4, timeout=10)
+
+
+def test_prefetched_http_gateway_serves_once(http_gateway):
+    prefetched = PrefetchedHttpGateway(http_gateway)
+    response = make_response(200)
+    prefetched.put("https://example.com/c1", response)
+
+    assert prefetched.get("https://example.com/c1") is response
+    http_gateway.request.assert_not_called()
+
+    prefetched.get("https://example.com/c1")
+    http_gateway.request.assert_called_once()
+
+
+def test_prefetched_http_gateway_forwards_others(http_gateway):
+    prefetched = PrefetchedHttpGateway(http_gateway)
+    prefetched.put("https://example.com/c1", make_response(200))
+
+    prefetched.post("https://example.com/c1", data={"a": 1})
+    prefetched.get("https://example.com/c2")
+    assert [c.args for c in http_gateway.request.call_args_list] == [
+        ("POST", "https://example.com/c1"),
+        ("GET", "https://example.com/c2"),
+    ]
+
+
+def test_prefetched_http_gateway_cookies(http_gateway):
+    prefetched = PrefetchedHttpGateway(http_gateway)
+
+    cookies = RequestsCookieJar()
+    prefetched.cookies = cookies
+    assert http_gateway.cookies is cookies
+    assert prefetched.cookies is cookies
+
+
+def test_async_source_gateway_fetch(async_source_gateway, http_gateway):
+    http_gateway.cookies.set("token", "a", domain="example.com")
+    session = FakeClientSession(FakeClientResponse(200, b"<p>c1</p>"))
+    async_source_gateway._session = session
+
+    response = asyncio.run(async_source_gateway.fetch("https://example.com/c1"))
+    assert response.text == "<p>c1</p>"
+    assert session.headers == [{"Cookie": "token=a"}]
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (asyncio.TimeoutError(), requests.Timeout),
+        (aiohttp.ClientConnectionError(), requests.ConnectionError),
+    ],
+)
+def test_async_source_gateway_fetch_errors(async_source_gateway, error, expected):
+    async_source_gateway._session = FakeClientSession(error)
+
+    with pytest.raises(expected):
+        asyncio.run(async_source_gateway.fetch("https://example.com/c1"))
+
+
+def test_async_source_gateway_fetch_bad_response(async_source_gateway):
+    async_source_gateway._session = FakeClientSession(FakeClientResponse(404))
+
+    with pytest.raises(BadResponseException) as e:
+        asyncio.run(async_source_gateway.fetch("https://example.com/c1"))
+
+    assert e.value.args[0].status_code == 404
+
+
+def test_async_source_gateway_challenge_fallback(async_source_gateway):
+    async_source_gateway._session = FakeClientSession(
+        FakeClientResponse(503, headers={"Server": "cloudflare"})
+    )
+    chapter = make_chapter()
+    async_source_gateway.source_gateway.update_chapter_content.return_value = chapter
+
+    assert asyncio.run(async_source_gateway.update_chapter_content(chapter)) is chapter
+    assert async_source_gateway.challenged
+
+    # the source requests the page through its own gateway afterwards
+    async_source_gateway._session = None
+    assert asyncio.run(async_source_gateway.update_chapter_content(chapter)) is chapter
+    assert async_source_gateway._session is None
@@ -1,8 +1,14 @@
 from unittest.mock import Mock
 
 import pytest
+import requests
 
-from novelsave.exceptions import CookieBrowserNotSupportedException
+from novelsave.core.dtos import ChapterDTO
+from novelsave.exceptions import (
+    CircuitOpenException,
+    CookieBrowserNotSupportedException,
+)
+from novelsave.services.network import CircuitBreaker, CookieCache
 from novelsave.services.source import SourceGateway
 
 
@@ -19,3 +25,52 @@ def test_use_cookies_from_browser_attribute_error(mocker, source_gateway):
 
     with pytest.raises(CookieBrowserNotSupportedException):
         source_gateway.use_cookies_from_browser("chrome")
+
+
+def test_update_chapter_content_circuit_breaker():
+    circuit_breaker = CircuitBreaker("Source", 2, 60)
+    source = Mock()
+    source.chapter.side_effect = requests.Timeout()
+    source_gateway = SourceGateway(source, Mock(), circuit_breaker=circuit_breaker)
+    chapter = ChapterDTO(index=0, title="c0", url="https://example.com/0")
+
+    for _ in range(2):
+        with pytest.raises(requests.Timeout):
+            source_gateway.update_chapter_content(chapter)
+
+    # refused without reaching the source
+    with pytest.raises(CircuitOpenException):
+        source_gateway.update_chapter_content(chapter)
+
+    assert source.chapter.call_count == 2
+
+
+def test_use_cookies_from_browser_cached(mocker, tmp_path):
+    cookie = Mock(domain=".example.com", path="/")
+    cookie.name, cookie.value = "session", "a"
+    chrome = mocker.patch(
+        "novelsave.services.source.source_gateway.browser_cookie3.chrome",
+        return_value=[cookie],
+    )
+    source = Mock(cookie_domains=[".example.com"])
+    source.name = "Source"
+    cookie_cache = CookieCache(tmp_path, 100)
+
+    SourceGateway(source, Mock(), cookie_cache=cookie_cache).use_cookies_from_browser(
+        "chrome"
+    )
+    source_gateway = SourceGateway(source, Mock(), cookie_cache=cookie_cache)
+    source_gateway.use_cookies_from_browser("chrome")
+
+    chrome.assert_called_once()
+    assert source.set_cookies.call_args.args[0].get("session") == "a"
+
+    # refused cookies are extracted again by the next run
+    response = Mock(status_code=401)
+    source.chapter.side_effect = requests.HTTPError(response=response)
+    with pytest.raises(requests.HTTPError):
+        source_gateway.update_chapter_content(
+            ChapterDTO(index=0, title="c0", url="https://example.com/0")
+        )
+
+    assert cookie_cache.get("Source", "chrome") is None
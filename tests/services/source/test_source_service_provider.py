@@ -1,15 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock
 
 import pytest
 from novelsave_sources import novel_source_types
 
 from novelsave.exceptions import SourceNotFoundException
+from novelsave.services.network import CircuitBreaker
 from novelsave.services.source import SourceService
 
 
 @pytest.fixture
 def source_service():
-    return SourceService(Mock())
+    return SourceService(Mock(), Mock(), Mock())
 
 
 def test_source_from_url(source_service):
@@ -22,3 +24,36 @@ def test_source_from_url(source_service):
 def test_source_from_url_unavailable(source_service):
     with pytest.raises(SourceNotFoundException):
         source_service.source_from_url("https://test.site")
+
+
+def test_source_from_url_reuses_gateway(source_service, mocker):
+    locate_novel_source = mocker.patch(
+        "novelsave.services.source.source_service.locate_novel_source"
+    )
+    source_types = novel_source_types()
+
+    first = source_service.source_from_url(source_types[0].base_urls[0] + "/novel")
+    other = source_service.source_from_url(source_types[1].base_urls[0] + "/novel")
+    second = source_service.source_from_url(source_types[0].base_urls[0] + "/other")
+
+    assert first is second
+    assert first is not other
+    assert isinstance(first.source, source_types[0])
+    locate_novel_source.assert_not_called()
+
+    sources = source_service.get_novel_sources()
+    assert first in sources and other in sources
+
+
+def test_source_from_url_not_shared_between_threads():
+    source_service = SourceService(
+        Mock(), Mock(), Mock(), lambda name: CircuitBreaker(name, 5, 60)
+    )
+    url = novel_source_types()[0].base_urls[0]
+
+    first = source_service.source_from_url(url)
+    with ThreadPoolExecutor(1) as executor:
+        second = executor.submit(source_service.source_from_url, url).result()
+
+    assert first is not second
+    assert first.circuit_breaker is second.circuit_breaker
@@ -48,6 +48,39 @@ class TestFileService(unittest.TestCase):
         # cleanup: remove created dir
         shutil.rmtree(path.parent)
 
+    def test_write_chunks(self):
+        path = Path("ns_test_dir/atc_file.html")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        size = self.file_service.write_chunks(path, [b"<h1>testing", b" data</h1>"])
+
+        # test content was written to file
+        self.assertEqual(21, size)
+        with path.open("rb") as f:
+            self.assertEqual(b"<h1>testing data</h1>", f.read())
+
+        # cleanup: remove created dir
+        shutil.rmtree(path.parent)
+
+    def test_write_chunks_interrupted(self):
+        path = Path("ns_test_dir/atc_file.html")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"original")
+
+        def chunks():
+            yield b"partial"
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            self.file_service.write_chunks(path, chunks())
+
+        # test existing file is untouched and no temporary file remains
+        self.assertEqual(b"original", path.read_bytes())
+        self.assertEqual([path], list(path.parent.iterdir()))
+
+        # cleanup: remove created dir
+        shutil.rmtree(path.parent)
+
     def test_read_str(self):
         path = Path("ns_test_dir/atc_file.html")
         path.parent.mkdir(parents=True, exist_ok=True)
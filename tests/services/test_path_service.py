@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from novelsave.core.entities.novel import Novel
+from novelsave.core.entities.novel import Novel, Asset
 from novelsave.exceptions import SourceNotFoundException
 from novelsave.services import PathService
 
@@ -86,6 +86,39 @@ def test_get_thumbnail_path_no_suffix(source_service, novel_service):
     assert data_dir / "1" / "cover" == path
 
 
+def test_get_asset_path(source_service, novel_service):
+    novel = Novel(id=1, thumbnail_url="https://my.site/cover.jpg")
+    asset = Asset(id=2, url="https://my.site/assets/page.html?size=1")
+
+    path_service = PathService(
+        data_dir, save_dir, config_dir, division_rules, novel_service, source_service
+    )
+    path = path_service.asset_path(novel, asset)
+
+    assert data_dir / "1" / "web" / "2.html" == path
+
+
+def test_get_asset_path_symlinked_data_dir(tmp_path, source_service, novel_service):
+    (tmp_path / "target").mkdir()
+    linked_data_dir = tmp_path / "data"
+    linked_data_dir.symlink_to(tmp_path / "target", target_is_directory=True)
+
+    novel = Novel(id=1)
+    asset = Asset(id=2, url="https://my.site/assets/page.html")
+
+    path_service = PathService(
+        linked_data_dir,
+        save_dir,
+        config_dir,
+        division_rules,
+        novel_service,
+        source_service,
+    )
+    path = path_service.asset_path(novel, asset)
+
+    assert path_service.relative_to_data_dir(path) == Path("1/web/2.html")
+
+
 def test_resolve_data_path(source_service, novel_service):
     path_service = PathService(
         data_dir, save_dir, config_dir, division_rules, novel_service, source_service
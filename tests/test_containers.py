@@ -0,0 +1,66 @@
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from novelsave.containers import create_database_engine
+from novelsave.settings import config
+
+PROFILE = config["sqlite"]
+
+
+def test_create_database_engine_profile(tmp_path):
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'data.sqlite'}", PROFILE)
+
+    with engine.connect() as connection:
+
+        def pragma(name):
+            return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # normal
+        assert pragma("cache_size") == -PROFILE["cache_size"]
+        assert pragma("busy_timeout") == PROFILE["busy_timeout"]
+        assert pragma("foreign_keys") == 1
+
+    engine.dispose()
+
+
+@pytest.mark.parametrize("key", ["journal_mode", "synchronous"])
+def test_create_database_engine_unknown_setting(tmp_path, key):
+    with pytest.raises(ValueError):
+        create_database_engine(
+            f"sqlite:///{tmp_path / 'data.sqlite'}",
+            {**PROFILE, key: "wal; DROP TABLE novels"},
+        )
+
+
+def test_readers_do_not_block_writer(tmp_path):
+    path = tmp_path / "data.sqlite"
+    engine = create_database_engine(f"sqlite:///{path}", PROFILE)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE chapters (content TEXT)"))
+        connection.execute(text("INSERT INTO chapters VALUES ('a')"))
+
+    # a package run reading the chapters within a transaction
+    reader = sqlite3.connect(path, timeout=0)
+    reader.execute("BEGIN")
+    assert reader.execute("SELECT content FROM chapters").fetchall() == [("a",)]
+
+    def write():
+        with engine.begin() as connection:
+            connection.execute(text("INSERT INTO chapters VALUES ('b')"))
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    writer.join(1)
+    assert not writer.is_alive(), "writer waited for the reader"
+
+    # the reader keeps its snapshot until it is done
+    assert reader.execute("SELECT count(*) FROM chapters").fetchone() == (1,)
+    reader.rollback()
+    assert reader.execute("SELECT count(*) FROM chapters").fetchone() == (2,)
+
+    reader.close()
+    engine.dispose()
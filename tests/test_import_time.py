@@ -0,0 +1,101 @@
+import subprocess
+import sys
+from typing import Set
+
+import pytest
+
+from novelsave.services import VersionCache
+
+# imported by the commands that download or package novels only
+HEAVY_MODULES = {
+    "aiohttp",
+    "alembic",
+    "browser_cookie3",
+    "bs4",
+    "ebooklib",
+    "lxml",
+    "mako",
+    "novelsave_sources",
+}
+
+APPLICATION = """
+from novelsave.client import cli
+from novelsave.containers import Application
+from novelsave.settings import config
+
+application = Application()
+application.config.from_dict(config)
+"""
+
+
+def imported_modules(code: str) -> Set[str]:
+    """top level packages imported by running the code, as reported by -X importtime"""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    modules = set()
+    for line in output.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip().split(".")[0])
+
+    return modules
+
+
+def test_cli_startup_imports():
+    modules = imported_modules(
+        APPLICATION
+        + """
+application.services.config_service()
+application.services.novel_service()
+"""
+    )
+
+    assert "novelsave" in modules
+    assert not modules & HEAVY_MODULES
+
+
+def test_cli_startup_imports_with_update_check(tmp_path):
+    versions_file = tmp_path / "versions.json"
+    version_cache = VersionCache(versions_file, 60)
+    for package in ("novelsave", "novelsave-sources"):
+        version_cache.put(package, "0.0.0")
+
+    modules = imported_modules(
+        APPLICATION
+        + f"""
+from novelsave.client.cli import events
+
+application.config.from_dict({{"updates": {{"file": {str(versions_file)!r}}}}})
+application.wire(modules=[events])
+
+# reports once the check is done, which does not request the cached versions
+events.update_check_event()()
+application.services.config_service()
+"""
+    )
+
+    assert "novelsave" in modules
+    assert not modules & HEAVY_MODULES
+
+
+@pytest.mark.parametrize(
+    "target, expected, unexpected",
+    [
+        ("text", {"bs4"}, {"ebooklib", "mako"}),
+        ("epub", {"ebooklib"}, {"mako"}),
+    ],
+)
+def test_packager_imports(target, expected, unexpected):
+    modules = imported_modules(
+        APPLICATION
+        + f"""
+application.packagers.packager_provider().filter_packagers(["{target}"])
+"""
+    )
+
+    assert expected <= modules
+    assert not modules & unexpected
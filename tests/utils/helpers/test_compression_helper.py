@@ -0,0 +1,103 @@
+import pytest
+
+from novelsave.exceptions import RequirementException
+from novelsave.utils.helpers import compression_helper
+
+CHAPTERS = [
+    f"<div class='chapter'><p>Translator: Someone</p><p>Chapter {i} of the novel.</p></div>"
+    for i in range(16)
+]
+
+
+def test_compress_none():
+    assert compression_helper.compress("<p>a</p>", "none") == "<p>a</p>"
+    assert compression_helper.compress(None, "zlib") is None
+
+
+def test_decompress_uncompressed_text():
+    load_dictionary = pytest.fail
+
+    assert compression_helper.decompress("<p>a</p>", load_dictionary) == "<p>a</p>"
+    assert compression_helper.decompress(None, load_dictionary) is None
+
+
+def test_compress_zlib_round_trip():
+    value = compression_helper.compress(CHAPTERS[0] * 20, "zlib")
+
+    assert isinstance(value, bytes)
+    assert len(value) < len(CHAPTERS[0] * 20)
+    assert compression_helper.decompress(value, pytest.fail) == CHAPTERS[0] * 20
+
+
+def test_compress_zlib_dictionary(mocker):
+    dictionary = compression_helper.train_dictionary(CHAPTERS[:8], "zlib")
+    plain = compression_helper.compress(CHAPTERS[10], "zlib")
+    value = compression_helper.compress(CHAPTERS[10], "zlib", dictionary)
+
+    assert len(value) < len(plain)
+
+    # dictionaries are looked up by their digest once they are not yet known
+    mocker.patch.object(compression_helper, "_dictionaries", {})
+    load_dictionary = mocker.Mock(return_value=dictionary)
+    for _ in range(2):
+        assert compression_helper.decompress(value, load_dictionary) == CHAPTERS[10]
+
+    load_dictionary.assert_called_once_with(compression_helper.digest(dictionary))
+
+
+def test_decompress_missing_dictionary(mocker):
+    dictionary = compression_helper.train_dictionary(CHAPTERS[:8], "zlib")
+    value = compression_helper.compress(CHAPTERS[10], "zlib", dictionary)
+    mocker.patch.object(compression_helper, "_dictionaries", {})
+
+    with pytest.raises(ValueError):
+        compression_helper.decompress(value, lambda digest: None)
+
+
+def test_train_dictionary_size():
+    dictionary = compression_helper.train_dictionary(CHAPTERS * 100, "zlib")
+
+    assert 0 < len(dictionary) <= compression_helper.ZLIB_DICTIONARY_SIZE
+    assert compression_helper.train_dictionary([], "zlib") is None
+
+
+def test_compress_unknown_codec():
+    with pytest.raises(ValueError):
+        compression_helper.compress("<p>a</p>", "lzma")
+
+
+def test_compress_zstd_requirement(mocker):
+    mocker.patch.dict("sys.modules", {"zstandard": None})
+
+    with pytest.raises(RequirementException):
+        compression_helper.compress("<p>a</p>", "zstd")
+
+
+def test_compress_zstd_round_trip():
+    pytest.importorskip("zstandard")
+    value = compression_helper.compress(CHAPTERS[0] * 20, "zstd")
+
+    assert value[0] != compression_helper.compress(CHAPTERS[0], "zlib")[0]
+    assert len(value) < len(CHAPTERS[0] * 20)
+    assert compression_helper.decompress(value, pytest.fail) == CHAPTERS[0] * 20
+
+
+def test_compress_zstd_dictionary(mocker):
+    pytest.importorskip("zstandard")
+    samples = [
+        f"<div class='chapter'><p>Translator: Someone {i}</p>"
+        f"<p>{' '.join(str(i * j) for j in range(40))}</p></div>"
+        for i in range(400)
+    ]
+    dictionary = compression_helper.train_dictionary(samples, "zstd", 4096)
+    assert dictionary is not None
+
+    value = compression_helper.compress(CHAPTERS[10], "zstd", dictionary)
+    assert value[1 : compression_helper.HEADER_SIZE] == compression_helper.digest(
+        dictionary
+    )
+
+    mocker.patch.object(compression_helper, "_dictionaries", {})
+    load_dictionary = mocker.Mock(return_value=dictionary)
+    assert compression_helper.decompress(value, load_dictionary) == CHAPTERS[10]
+    load_dictionary.assert_called_once_with(compression_helper.digest(dictionary))
@@ -12,3 +12,16 @@ def test_version_2():
     expected_config = {"novel": {"dir": Path("//path/to/file")}}
 
     assert config_helper._version_2(test_data) == expected_config
+
+
+def test_version_2_retry_types():
+    test_data = {
+        "version": 2,
+        "config": {"retry.backoff": "2", "retry.max_backoff": "60"},
+    }
+
+    expected_config = {"retry": {"backoff": 2.0, "max_backoff": 60.0}}
+
+    parsed = config_helper._version_2(test_data)
+    assert parsed == expected_config
+    assert type(parsed["retry"]["max_backoff"]) is float